@@ -0,0 +1 @@
+# HAOT benchmarks, imported as benchmarks.cases and benchmarks.run_benchmarks
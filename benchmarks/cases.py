@@ -0,0 +1,537 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   cases.py
+Def:    Contains the benchmark cases of the public optics, aerodynamics,
+        quantum_mechanics, coordinates and conversions functions, and of an
+        end-to-end OpenFOAM-like workflow.
+"""
+
+import os
+import tempfile
+import numpy as np
+import haot
+
+# Benchmark cases, name -> builder, whether it takes fields, largest size
+CASES = {}
+
+# Public functions without a benchmark
+EXCLUDED = {
+    "optics.tropina_aproximation": "not implemented",
+    "quantum_mechanics.tranlational_energy": "not implemented",
+}
+
+
+def register(name: str, field: bool = True, max_elements: int = None):
+    """
+    Registers a benchmark builder. A builder takes the number of elements
+    (None at scalar scale) and a random generator, and returns the function
+    call to time without arguments
+
+    Parameters:
+        name: case name, <module>.<function>
+        field: the function takes fields, False runs it at scalar scale only
+        max_elements: largest size of the case, None (default) has no limit
+    """
+
+    def decorator(builder):
+        CASES[name] = {
+            "builder": builder,
+            "field": field,
+            "max_elements": max_elements,
+        }
+        return builder
+
+    return decorator
+
+
+def cases_for(elements: int) -> dict[str, dict]:
+    """
+    Returns the cases that run at a given size, None is scalar scale
+    """
+    if elements is None:
+        return {name: case for name, case in CASES.items() if name != "workflow"}
+    return {
+        name: case
+        for name, case in CASES.items()
+        if case["field"]
+        and (case["max_elements"] is None or elements <= case["max_elements"])
+    }
+
+
+def _field(elements: int, rng, low: float, high: float):
+    """
+    Helper function that returns a uniform scalar (elements is None) or field
+    """
+    if elements is None:
+        return float(rng.uniform(low, high))
+    return rng.uniform(low, high, elements)
+
+
+def _frames(elements: int, rng, points: int = 100) -> np.ndarray:
+    """
+    Helper function that returns [time, points] optical path lengths
+    """
+    frames = 2 if elements is None else max(elements // points, 2)
+    return 1.0 + 1e-6 * rng.standard_normal((frames, points))
+
+
+# Optics #
+@register("optics.index_of_refraction_density_temperature")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    density = _field(n, rng, 0.01, 2.0)
+    return lambda: haot.index_of_refraction_density_temperature(temperature, density)
+
+
+@register("optics.index_of_refraction")
+def _(n, rng):
+    density = {"N2": _field(n, rng, 0.01, 1.5), "O2": _field(n, rng, 0.01, 0.5)}
+    return lambda: haot.index_of_refraction(density)
+
+
+@register("optics.index_of_refraction_field")
+def _(n, rng):
+    density = {
+        "N2": _field(n, rng, 0.01, 1.5),
+        "O2": _field(n, rng, 0.01, 0.5),
+        "NO": _field(n, rng, 0.0, 0.01),
+    }
+    return lambda: haot.index_of_refraction_field(density)
+
+
+@register("optics.permittivity_material")
+def _(n, rng):
+    index = _field(n, rng, 1.0, 1.5)
+    return lambda: haot.permittivity_material(index)
+
+
+@register("optics.electric_susceptibility")
+def _(n, rng):
+    index = _field(n, rng, 1.0, 1.5)
+    return lambda: haot.electric_susceptibility(index)
+
+
+@register("optics.optical_path_length")
+def _(n, rng):
+    index = 1.0 + 1e-4 * rng.random(2 if n is None else n)
+    distance = np.linspace(0.0, 1.0, index.size)
+    return lambda: haot.optical_path_length(index, distance)
+
+
+@register("optics.optical_path_difference_rms")
+def _(n, rng):
+    opd = _frames(n, rng) - 1.0
+    return lambda: haot.optical_path_difference_rms(opd)
+
+
+@register("optics.phase_variance")
+def _(n, rng):
+    opd_rms = _field(n, rng, 0.0, 1e-7)
+    return lambda: haot.phase_variance(opd_rms, 633.0)
+
+
+@register("optics.strehl_ratio")
+def _(n, rng):
+    variance = _field(n, rng, 0.0, 2.0)
+    return lambda: haot.strehl_ratio(variance)
+
+
+@register("optics.optical_path_difference")
+def _(n, rng):
+    opl = _frames(n, rng)
+    return lambda: haot.optical_path_difference(opl)
+
+
+@register("optics.optical_path_difference_streaming")
+def _(n, rng):
+    opl = _frames(n, rng)
+    return lambda: haot.optical_path_difference_streaming(opl)
+
+
+@register("optics.optical_path_difference_rms_streaming")
+def _(n, rng):
+    opd = _frames(n, rng) - 1.0
+    return lambda: haot.optical_path_difference_rms_streaming(opd)
+
+
+@register("optics.buldakov_expansion")
+def _(n, rng):
+    size = None if n is None else n
+    vibrational = rng.integers(0, 10, size)
+    rotational = rng.integers(0, 100, size)
+    return lambda: haot.buldakov_expansion(vibrational, rotational, "N2")
+
+
+@register("optics.buldakov_polarizability_temperature", max_elements=10**4)
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.buldakov_polarizability_temperature(temperature, "N2")
+
+
+@register("optics.buldakov_polarizability_field")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    haot.buldakov_polarizability_table("N2")
+    return lambda: haot.buldakov_polarizability_field(temperature, "N2")
+
+
+@register("optics.buldakov_polarizability_table", field=False)
+def _(n, rng):
+    def call():
+        haot.buldakov_polarizability_table.cache_clear()
+        return haot.buldakov_polarizability_table("N2")
+
+    return call
+
+
+@register("optics.kerl_polarizability_temperature")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.kerl_polarizability_temperature(temperature, "N2", 532.0)
+
+
+@register("optics.kerl_polarizability_wavelengths")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    wavelengths = [355.0, 532.0, 1064.0]
+    return lambda: haot.kerl_polarizability_wavelengths(temperature, "N2", wavelengths)
+
+
+@register("optics.atmospheric_index_of_refraction")
+def _(n, rng):
+    altitude = _field(n, rng, 0.0, 80000.0)
+    return lambda: haot.atmospheric_index_of_refraction(altitude)
+
+
+@register("optics.atmospheric_index_of_refraction_profile")
+def _(n, rng):
+    altitude = _field(n, rng, 0.0, 80000.0)
+    haot.atmospheric_profile()
+    return lambda: haot.atmospheric_index_of_refraction_profile(altitude)
+
+
+@register("optics.atmospheric_profile", field=False)
+def _(n, rng):
+    def call():
+        haot.atmospheric_profile.cache_clear()
+        return haot.atmospheric_profile()
+
+    return call
+
+
+@register("optics.brewster_angle")
+def _(n, rng):
+    index = _field(n, rng, 1.0, 1.5)
+    return lambda: haot.brewster_angle(index)
+
+
+@register("optics.total_internal_reflection_angle")
+def _(n, rng):
+    index = _field(n, rng, 1.0, 1.5)
+    return lambda: haot.total_internal_reflection_angle(index)
+
+
+@register("optics.normal_incidence_reflectance")
+def _(n, rng):
+    index = _field(n, rng, 1.0, 1.5)
+    return lambda: haot.normal_incidence_reflectance(index)
+
+
+@register("optics.gladstone_dale_constant")
+def _(n, rng):
+    density = {"N2": _field(n, rng, 0.01, 1.5), "O2": _field(n, rng, 0.01, 0.5)}
+    return lambda: haot.gladstone_dale_constant(density)
+
+
+@register("optics.gladstone_dale_constant_field")
+def _(n, rng):
+    density = {
+        "N2": _field(n, rng, 0.01, 1.5),
+        "O2": _field(n, rng, 0.01, 0.5),
+        "NO": _field(n, rng, 0.0, 0.01),
+    }
+    return lambda: haot.gladstone_dale_constant_field(density)
+
+
+@register("optics.air_gladstone_dale_polarizability")
+def _(n, rng):
+    polarizability = _field(n, rng, 1e-30, 2e-30)
+    return lambda: haot.air_gladstone_dale_polarizability(polarizability)
+
+
+@register("optics.gladstone_dale_air_wavelength")
+def _(n, rng):
+    wavelength = _field(n, rng, 300.0, 1100.0)
+    return lambda: haot.gladstone_dale_air_wavelength(wavelength)
+
+
+# Aerodynamics #
+@register("aerodynamics.sutherland_law_viscosity")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.sutherland_law_viscosity(temperature)
+
+
+@register("aerodynamics.sutherland_law_conductivity")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.sutherland_law_conductivity(temperature)
+
+
+@register("aerodynamics.air_atomic_molar_mass", field=False)
+def _(n, rng):
+    return lambda: haot.air_atomic_molar_mass()
+
+
+@register("aerodynamics.speed_of_sound")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.speed_of_sound(temperature)
+
+
+@register("aerodynamics.isentropic_relations")
+def _(n, rng):
+    mach = _field(n, rng, 0.1, 8.0)
+    return lambda: haot.isentropic_relations(mach)
+
+
+@register("aerodynamics.normal_shock_relations")
+def _(n, rng):
+    mach = _field(n, rng, 1.1, 8.0)
+    return lambda: haot.normal_shock_relations(mach)
+
+
+@register("aerodynamics.oblique_shock_relations", field=False)
+def _(n, rng):
+    return lambda: haot.oblique_shock_relations(3.0, 40.0)
+
+
+@register("aerodynamics.oblique_shock_angle", field=False)
+def _(n, rng):
+    return lambda: haot.oblique_shock_angle(3.0, 15.0)
+
+
+# Quantum mechanics #
+@register("quantum_mechanics.zero_point_energy", field=False)
+def _(n, rng):
+    return lambda: haot.zero_point_energy("N2")
+
+
+@register("quantum_mechanics.vibrational_partition_function")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.vibrational_partition_function(10, temperature, "N2")
+
+
+@register("quantum_mechanics.rotational_partition_function")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.rotational_partition_function(100, temperature, "N2")
+
+
+@register("quantum_mechanics.born_oppenheimer_partition_function")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.born_oppenheimer_partition_function(10, 100, temperature, "N2")
+
+
+@register("quantum_mechanics.potential_dunham_coef_012", field=False)
+def _(n, rng):
+    return lambda: haot.potential_dunham_coef_012("N2")
+
+
+@register("quantum_mechanics.potential_dunham_coeff_m", field=False)
+def _(n, rng):
+    a_0, a_1, a_2 = haot.potential_dunham_coef_012("N2")
+    return lambda: haot.potential_dunham_coeff_m(a_1, a_2, 6)
+
+
+@register("quantum_mechanics.boltzmann_factor")
+def _(n, rng):
+    temperature = _field(n, rng, 200.0, 3000.0)
+    return lambda: haot.boltzmann_factor(temperature, "N2", 5, 20)
+
+
+@register("quantum_mechanics.boltzmann_distribution", field=False)
+def _(n, rng):
+    return lambda: haot.boltzmann_distribution(1000.0, "N2", 10, 100, True)
+
+
+@register("quantum_mechanics.born_oppenheimer_approximation")
+def _(n, rng):
+    vibrational = rng.integers(0, 10, n)
+    rotational = rng.integers(0, 100, n)
+    return lambda: haot.born_oppenheimer_approximation(vibrational, rotational, "N2")
+
+
+@register("quantum_mechanics.vibrational_energy_k")
+def _(n, rng):
+    vibrational = rng.integers(0, 10, n)
+    return lambda: haot.vibrational_energy_k(vibrational, "N2")
+
+
+@register("quantum_mechanics.rotational_energy_k")
+def _(n, rng):
+    rotational = rng.integers(0, 100, n)
+    return lambda: haot.rotational_energy_k(rotational, "N2")
+
+
+@register("quantum_mechanics.reduced_mass_kg", field=False)
+def _(n, rng):
+    return lambda: haot.reduced_mass_kg("N", "O")
+
+
+@register("quantum_mechanics.characteristic_temperatures_K", field=False)
+def _(n, rng):
+    return lambda: haot.characteristic_temperatures_K("N2")
+
+
+@register("quantum_mechanics.molecular_spring_constant", field=False)
+def _(n, rng):
+    return lambda: haot.molecular_spring_constant("N2")
+
+
+# Coordinates #
+@register("coordinates.haversine_distance")
+def _(n, rng):
+    points = [_field(n, rng, -80.0, 80.0) for _ in range(4)]
+    return lambda: haot.haversine_distance(*points)
+
+
+@register("coordinates.lla_to_ecef")
+def _(n, rng):
+    lla = (
+        _field(n, rng, -89.0, 89.0),
+        _field(n, rng, -180.0, 180.0),
+        _field(n, rng, 0.0, 1e5),
+    )
+    return lambda: haot.lla_to_ecef(*lla)
+
+
+@register("coordinates.ecef_to_lla")
+def _(n, rng):
+    ecef = haot.lla_to_ecef(
+        _field(n, rng, -89.0, 89.0),
+        _field(n, rng, -180.0, 180.0),
+        _field(n, rng, 0.0, 1e5),
+    )
+    return lambda: haot.ecef_to_lla(ecef)
+
+
+@register("coordinates.roll_dcm", field=False)
+def _(n, rng):
+    return lambda: haot.roll_dcm(10.0)
+
+
+@register("coordinates.pitch_dcm", field=False)
+def _(n, rng):
+    return lambda: haot.pitch_dcm(10.0)
+
+
+@register("coordinates.yaw_dcm", field=False)
+def _(n, rng):
+    return lambda: haot.yaw_dcm(10.0)
+
+
+@register("coordinates.euler_321_dcm", field=False)
+def _(n, rng):
+    return lambda: haot.euler_321_dcm(10.0, 20.0, 30.0)
+
+
+@register("coordinates.euler_angles_from_dcm", field=False)
+def _(n, rng):
+    dcm = haot.euler_321_dcm(10.0, 20.0, 30.0)
+    return lambda: haot.euler_angles_from_dcm(dcm)
+
+
+# Conversions #
+@register("conversions.polarizability_cgs_to_si")
+def _(n, rng):
+    polarizability = _field(n, rng, 1e-24, 2e-24)
+    return lambda: haot.polarizability_cgs_to_si(polarizability)
+
+
+@register("conversions.polarizability_si_to_cgs")
+def _(n, rng):
+    polarizability = _field(n, rng, 1e-40, 2e-40)
+    return lambda: haot.polarizability_si_to_cgs(polarizability)
+
+
+@register("conversions.wavenumber_to_electronvolt")
+def _(n, rng):
+    wavenumber = _field(n, rng, 100.0, 3000.0)
+    return lambda: haot.wavenumber_to_electronvolt(wavenumber)
+
+
+@register("conversions.wavenumber_to_joules")
+def _(n, rng):
+    wavenumber = _field(n, rng, 100.0, 3000.0)
+    return lambda: haot.wavenumber_to_joules(wavenumber)
+
+
+@register("conversions.wavenumber_to_angular_frequency")
+def _(n, rng):
+    wavenumber = _field(n, rng, 100.0, 3000.0)
+    return lambda: haot.wavenumber_to_angular_frequency(wavenumber)
+
+
+@register("conversions.mass_density_to_molar_density")
+def _(n, rng):
+    density = _field(n, rng, 0.01, 2.0)
+    return lambda: haot.mass_density_to_molar_density(density, "N2")
+
+
+@register("conversions.molar_mass_to_kilogram")
+def _(n, rng):
+    molar_mass = _field(n, rng, 1.0, 50.0)
+    return lambda: haot.molar_mass_to_kilogram(molar_mass)
+
+
+# End-to-end workflow #
+def write_openfoam_field(path: str, values: np.ndarray):
+    """
+    Writes a binary OpenFOAM volScalarField with the given internal field
+    """
+    header = (
+        "FoamFile\n{\n    version     2.0;\n    format      binary;\n"
+        '    arch        "LSB;label=32;scalar=64";\n'
+        "    class       volScalarField;\n}\n\n"
+        f"internalField   nonuniform List<scalar> \n{values.size}\n("
+    )
+    with open(path, "wb") as file:
+        file.write(header.encode())
+        file.write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+        file.write(b")\n;\n\nboundaryField\n{\n}\n")
+
+
+@register("workflow", max_elements=10**6)
+def _(n, rng, n_snapshots: int = 4):
+    """
+    Synthetic OpenFOAM case of n cells per snapshot, shape [n / 400, 25, 16].
+    The case is read lazily, and the pipeline computes the OPD RMS and the
+    Strehl ratio of rays along the last axis
+    """
+    grid = (max(n // 400, 1), 25, 16)
+    tmp_dir = tempfile.TemporaryDirectory(prefix="haot_workflow_")
+    for i in range(n_snapshots):
+        time_dir = os.path.join(tmp_dir.name, f"{1e-4 * (i + 1):g}")
+        os.makedirs(time_dir)
+        size = int(np.prod(grid))
+        write_openfoam_field(
+            os.path.join(time_dir, "T"), 300.0 + 20.0 * rng.standard_normal(size)
+        )
+        write_openfoam_field(
+            os.path.join(time_dir, "rho"), 1.0 + 0.05 * rng.standard_normal(size)
+        )
+
+    def call():
+        case = haot.OpenFoamCase(tmp_dir.name)
+        temperature = np.stack([val.reshape(grid) for _, val in case.series("T")])
+        density = np.stack([val.reshape(grid) for _, val in case.series("rho")])
+        pipeline = haot.AeroOpticsPipeline(1e-3, ray_axis=2)
+        return pipeline.run(density, temperature_K=temperature)
+
+    # The temporary case lives as long as the benchmark call
+    call.tmp_dir = tmp_dir
+    return call
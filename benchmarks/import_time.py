@@ -0,0 +1,69 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   import_time.py
+Def:    Measures the startup time of import haot, each case runs in a fresh
+        interpreter.
+
+Usage:
+    $ python benchmarks/import_time.py --repeat 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Statements timed in a fresh interpreter, after numpy is imported
+CASES = {
+    "import haot": "import haot",
+    "haversine_distance": "import haot; haot.haversine_distance",
+    "sutherland_law_viscosity": "import haot; haot.sutherland_law_viscosity",
+    "index_of_refraction": "import haot; haot.index_of_refraction_density_temperature",
+    "all modules (eager)": "from haot import *",
+}
+
+_TIMER = """
+import time, sys
+import numpy
+start = time.perf_counter()
+{statement}
+stop = time.perf_counter()
+heavy = [name for name in ("scipy", "scipy.optimize", "ambiance", "molmass") if name in sys.modules]
+print(stop - start, ",".join(heavy))
+"""
+
+
+def time_statement(statement: str, repeat: int) -> tuple[list[float], str]:
+    """
+    Times a statement in fresh interpreters, returns the times in [s] and
+    the heavy dependencies it loaded
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+    return times, output[1] if len(output) > 1 else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("Usage:")[0])
+    parser.add_argument("--repeat", type=int, default=10, help="runs per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<28}{'median [ms]':>12}{'min [ms]':>10}  loaded")
+    for case, statement in CASES.items():
+        times, heavy = time_statement(statement, args.repeat)
+        print(
+            f"{case:<28}{1e3 * statistics.median(times):>12.1f}"
+            f"{1e3 * min(times):>10.1f}  {heavy}"
+        )
+
+
+if __name__ == "__main__":
+    main()
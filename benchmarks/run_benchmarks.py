@@ -0,0 +1,148 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   run_benchmarks.py
+Def:    Times the public functions of HAOT at scalar and field scale, records
+        the time and peak memory of each call and writes the results to JSON.
+
+Usage:
+    $ python benchmarks/run_benchmarks.py --sizes scalar 1e4 1e7 --output new.json
+    $ python benchmarks/run_benchmarks.py --filter optics --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+import numpy as np
+
+# Repository root, benchmarks is imported as a package when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import haot
+from benchmarks.cases import EXCLUDED, cases_for
+
+
+def parse_size(size: str) -> int:
+    """
+    Returns the number of elements of a size, None for 'scalar'
+    """
+    return None if size == "scalar" else int(float(size))
+
+
+def time_case(builder, elements: int, repeat: int, seed: int = 0) -> dict:
+    """
+    Times a benchmark case, returns the median and minimum time per call in
+    [s] and the peak memory allocated by a call in [bytes]
+    """
+    call = builder(elements, np.random.default_rng(seed))
+    call()  # warm up caches and lazy imports
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    call()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "time_s": statistics.median(times),
+        "min_s": min(times),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run(sizes: list[str], repeat: int, name_filter: str = None) -> list[dict]:
+    """
+    Runs the benchmark cases at each size, prints a row per case. Only the
+    cases whose name contains name_filter run, all of them when None
+    """
+    results = []
+    print(f"{'case':<58}{'size':>10}{'time [ms]':>12}{'peak [MB]':>11}")
+    for size in sizes:
+        elements = parse_size(size)
+        for name, case in cases_for(elements).items():
+            if name_filter and name_filter not in name:
+                continue
+            result = {"name": name, "size": size, "elements": elements or 1}
+            result.update(time_case(case["builder"], elements, repeat))
+            results.append(result)
+            print(
+                f"{name:<58}{size:>10}{1e3 * result['time_s']:>12.4f}"
+                f"{result['peak_memory_bytes'] / 2**20:>11.2f}"
+            )
+    return results
+
+
+def metadata() -> dict:
+    """
+    Returns the versions and machine of a benchmark run
+    """
+    return {
+        "haot": haot.__version__,
+        "numpy": np.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "excluded": EXCLUDED,
+    }
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """
+    Returns the cases slower than the baseline by more than threshold, as a
+    fraction of the baseline time
+    """
+    reference = {(val["name"], val["size"]): val for val in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = reference.get((result["name"], result["size"]))
+        if old is None:
+            continue
+        ratio = result["time_s"] / old["time_s"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result['name']} [{result['size']}]: "
+                f"{1e3 * old['time_s']:.4f} -> {1e3 * result['time_s']:.4f} ms "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("Usage:")[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        default=["scalar", "1e4", "1e7"],
+        help="scalar or number of elements",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    parser.add_argument("--filter", help="only cases containing this text")
+    parser.add_argument("--output", help="JSON file of results")
+    parser.add_argument("--compare", help="JSON file of baseline results")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="regression tolerance"
+    )
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.filter)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"metadata": metadata(), "results": results}, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        print(f"\n{len(regressions)} regressions over {args.threshold:.0%}")
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,212 @@
-# HAOT modules
-from .aerodynamics import *
-from .quantum_mechanics import *
-from .optics import *
-from .constants import *
-from .conversions import *
-from .coordinates import *
-
-# Printing Version
-from importlib.metadata import version
-
-# Print Version
-__version__ = version("haot")
+# HAOT modules, imported on first use
+import importlib
+
+_MODULES = (
+    "aerodynamics",
+    "quantum_mechanics",
+    "optics",
+    "constants",
+    "conversions",
+    "coordinates",
+    "species",
+    "precision",
+    "workspace",
+    "streaming",
+    "parallel",
+    "batch",
+    "kernels",
+    "instrumentation",
+    "validation",
+    "ray_tracing",
+    "zernike",
+    "far_field",
+    "pipeline",
+    "openfoam",
+)
+
+# Public functions and classes of each module, haot.<name> imports its
+# module (and the module dependencies, ex. scipy) the first time it is used
+_EXPORTS = {
+    "aerodynamics": (
+        "sutherland_law_viscosity",
+        "sutherland_law_conductivity",
+        "air_atomic_molar_mass",
+        "speed_of_sound",
+        "isentropic_relations",
+        "normal_shock_relations",
+        "oblique_shock_relations",
+        "oblique_shock_angle",
+    ),
+    "quantum_mechanics": (
+        "zero_point_energy",
+        "vibrational_partition_function",
+        "rotational_partition_function",
+        "born_oppenheimer_partition_function",
+        "potential_dunham_coef_012",
+        "potential_dunham_coeff_m",
+        "boltzmann_factor",
+        "boltzmann_distribution",
+        "born_oppenheimer_approximation",
+        "vibrational_energy_k",
+        "rotational_energy_k",
+        "reduced_mass_kg",
+        "characteristic_temperatures_K",
+        "molecular_spring_constant",
+        "tranlational_energy",
+    ),
+    "optics": (
+        "index_of_refraction_density_temperature",
+        "index_of_refraction",
+        "index_of_refraction_field",
+        "permittivity_material",
+        "electric_susceptibility",
+        "optical_path_length",
+        "optical_path_difference_rms",
+        "phase_variance",
+        "strehl_ratio",
+        "optical_path_difference",
+        "optical_path_difference_streaming",
+        "optical_path_difference_rms_streaming",
+        "tropina_aproximation",
+        "buldakov_expansion",
+        "buldakov_polarizability_temperature",
+        "buldakov_polarizability_field",
+        "buldakov_polarizability_table",
+        "kerl_polarizability_temperature",
+        "kerl_polarizability_wavelengths",
+        "atmospheric_index_of_refraction",
+        "atmospheric_index_of_refraction_profile",
+        "atmospheric_profile",
+        "brewster_angle",
+        "total_internal_reflection_angle",
+        "normal_incidence_reflectance",
+        "gladstone_dale_constant",
+        "gladstone_dale_constant_field",
+        "air_gladstone_dale_polarizability",
+        "gladstone_dale_air_wavelength",
+    ),
+    "constants": (
+        "smith_atmospheric_constants",
+        "sutherland_constants",
+        "karl_2003",
+        "polarizability",
+        "buldakov_polarizability_derivatives_2016",
+        "kerl_interpolation",
+        "spectroscopy_constants",
+    ),
+    "conversions": (
+        "polarizability_cgs_to_si",
+        "polarizability_si_to_cgs",
+        "wavenumber_to_electronvolt",
+        "wavenumber_to_joules",
+        "wavenumber_to_angular_frequency",
+        "mass_density_to_molar_density",
+        "molar_mass_to_kilogram",
+    ),
+    "coordinates": (
+        "haversine_distance",
+        "lla_to_ecef",
+        "ecef_to_lla",
+        "roll_dcm",
+        "pitch_dcm",
+        "yaw_dcm",
+        "euler_321_dcm",
+        "euler_angles_from_dcm",
+    ),
+    "species": (
+        "species_properties",
+        "species_molar_mass",
+        "air_molar_mass",
+        "register_species",
+        "unregister_species",
+        "species_cache",
+    ),
+    "precision": (
+        "set_precision",
+        "get_precision",
+        "precision_policy",
+    ),
+    "workspace": (
+        "Workspace",
+        "work_buffer",
+    ),
+    "streaming": (
+        "chunked_frames",
+        "grouped_frames",
+        "welford_frames",
+    ),
+    "parallel": (
+        "set_num_threads",
+        "get_num_threads",
+        "thread_policy",
+        "chunked_elementwise",
+    ),
+    "batch": ("process_snapshots",),
+    "kernels": (
+        "set_backend",
+        "get_backend",
+        "compiled_kernel",
+    ),
+    "instrumentation": (
+        "set_profiling",
+        "get_profiling",
+        "profiling",
+        "reset_profile",
+        "profile_stats",
+        "profile_report",
+        "instrumented",
+        "instrument_module",
+    ),
+    "validation": (
+        "set_validation",
+        "get_validation",
+        "trusted",
+        "check_nonnegative",
+        "check_positive",
+        "check_range",
+        "check_species",
+    ),
+    "ray_tracing": (
+        "optical_path_length_grid",
+        "UnstructuredRayTracer",
+        "slant_path_refraction",
+    ),
+    "zernike": (
+        "zernike_noll_to_nm",
+        "zernike_polynomial",
+        "circular_aperture",
+        "ZernikeBasis",
+    ),
+    "far_field": ("far_field_statistics",),
+    "pipeline": ("AeroOpticsPipeline",),
+    "openfoam": (
+        "read_openfoam_field",
+        "OpenFoamCase",
+    ),
+}
+_NAMES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES) + list(_NAMES)
+
+
+def __getattr__(name: str):
+    """
+    Imports HAOT modules, functions and classes on first use
+    """
+    if name in _MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _NAMES:
+        module = importlib.import_module(f"{__name__}.{_NAMES[name]}")
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    if name == "__version__":
+        # Printing Version
+        from importlib.metadata import version
+
+        globals()[name] = version("haot")
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
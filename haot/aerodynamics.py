@@ -5,19 +5,36 @@ File:   aerodynamics.py
 Def:    Contains aerodynamics helper functions.
 """
 
-import molmass
 import scipy
 import numpy as np
 from haot import constants as constants_tables
-
-
-def sutherland_law_viscosity(temperature_K: float, molecule: str = "Air") -> float:
+from haot import species as species_registry
+from haot import kernels
+from haot.workspace import Workspace, work_buffer
+from haot.parallel import chunked_elementwise
+from haot.instrumentation import instrument_module
+from haot.validation import check_nonnegative, check_positive, check_species
+
+# Species with Sutherland constants
+_SUTHERLAND_SPECIES = frozenset({"Air", "Argon", "N2", "O2"})
+
+
+@chunked_elementwise("temperature_K")
+def sutherland_law_viscosity(
+    temperature_K: float,
+    molecule: str = "Air",
+    out: np.ndarray = None,
+    workspace: Workspace = None,
+) -> float:
     """
     Calculates the Sutherland's law of viscosity
 
     Parameters:
         temperature_K: reference temperature in [K]
         molecule: Air (default), Argon, N2, O2
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         dynamic viscosity in [kg/ms]
@@ -29,30 +46,61 @@ def sutherland_law_viscosity(temperature_K: float, molecule: str = "Air") -> flo
         Viscous Fluid Flow, International Edition, 4th (White F., ISBN 978 1 260 59786)
     """
     # Checking cases
-    if type(temperature_K) is float and temperature_K < 0:
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if type(temperature_K) is np.ndarray and (temperature_K < 0).any():
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if molecule not in ["Air", "Argon", "N2", "O2"]:
-        raise ValueError("This function only supports Air, Argon, N2 or O2")
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    check_species(
+        molecule,
+        _SUTHERLAND_SPECIES,
+        "This function only supports Air, Argon, N2 or O2",
+    )
 
     const = constants_tables.sutherland_constants(molecule)
 
-    # Eq 1-34
-    dynamic_viscosity = const["temperature_ref"] + const["sutherland_visc"]
-    dynamic_viscosity /= temperature_K + const["sutherland_visc"]
-    dynamic_viscosity *= (temperature_K / const["temperature_ref"]) ** (3 / 2)
-
-    return const["viscosity_ref"] * dynamic_viscosity  # [kg/ms]
-
+    dynamic_viscosity = work_buffer(
+        "sutherland_law_viscosity",
+        np.shape(temperature_K),
+        np.result_type(temperature_K, 1.0),
+        out,
+        workspace,
+    )
 
-def sutherland_law_conductivity(temperature_K: float, molecule: str = "Air") -> float:
+    # Eq 1-34, T^(3/2) / (T + S) = sqrt(T^3 / (T + S)^2)
+    scale = (
+        const["viscosity_ref"]
+        * (const["temperature_ref"] + const["sutherland_visc"])
+        / const["temperature_ref"] ** (3 / 2)
+    )
+    kernel = kernels.compiled_kernel("sutherland_viscosity", dynamic_viscosity.dtype)
+    if kernel is not None:
+        kernel(temperature_K, const["sutherland_visc"], scale, out=dynamic_viscosity)
+    else:
+        np.add(temperature_K, const["sutherland_visc"], out=dynamic_viscosity)
+        np.divide(temperature_K, dynamic_viscosity, out=dynamic_viscosity)
+        np.square(dynamic_viscosity, out=dynamic_viscosity)
+        dynamic_viscosity *= temperature_K
+        np.sqrt(dynamic_viscosity, out=dynamic_viscosity)
+        dynamic_viscosity *= scale
+
+    return (
+        dynamic_viscosity if dynamic_viscosity.ndim else dynamic_viscosity[()]
+    )  # [kg/ms]
+
+
+@chunked_elementwise("temperature_K")
+def sutherland_law_conductivity(
+    temperature_K: float,
+    molecule: str = "Air",
+    out: np.ndarray = None,
+    workspace: Workspace = None,
+) -> float:
     """
     Calculates the Sutherland's law of thermal conductivity
 
     Parameters:
         temperature_K: reference temperature in [K]
         molecule: Air (default), Argon, N2, O2
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         thermal conductivity in [W/mK]
@@ -64,23 +112,48 @@ def sutherland_law_conductivity(temperature_K: float, molecule: str = "Air") ->
         Viscous Fluid Flow, International Edition, 4th (White F., ISBN 978 1 260 59786)
     """
     # Checking cases
-    if type(temperature_K) is float and temperature_K < 0:
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if type(temperature_K) is np.ndarray and (temperature_K < 0).any():
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if molecule not in ["Air", "Argon", "N2", "O2"]:
-        raise ValueError("This function only supports Air, Argon, N2 or O2")
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    check_species(
+        molecule,
+        _SUTHERLAND_SPECIES,
+        "This function only supports Air, Argon, N2 or O2",
+    )
 
     const = constants_tables.sutherland_constants(molecule)
 
-    # Eq 1-41b
-    thermal_conductivity = const["sutherland_cond"]
-    thermal_conductivity += const["temperature_ref"]
-    thermal_conductivity /= temperature_K + const["sutherland_cond"]
-    thermal_conductivity *= temperature_K / const["temperature_ref"]
-    thermal_conductivity **= 3 / 2
+    thermal_conductivity = work_buffer(
+        "sutherland_law_conductivity",
+        np.shape(temperature_K),
+        np.result_type(temperature_K, 1.0),
+        out,
+        workspace,
+    )
 
-    return const["conductivity_ref"] * thermal_conductivity  # [W/mK]
+    # Eq 1-41b
+    ratio_ref = (const["sutherland_cond"] + const["temperature_ref"]) / const[
+        "temperature_ref"
+    ]
+    kernel = kernels.compiled_kernel(
+        "sutherland_conductivity", thermal_conductivity.dtype
+    )
+    if kernel is not None:
+        kernel(
+            temperature_K,
+            const["sutherland_cond"],
+            ratio_ref,
+            const["conductivity_ref"],
+            out=thermal_conductivity,
+        )
+    else:
+        np.add(temperature_K, const["sutherland_cond"], out=thermal_conductivity)
+        np.divide(temperature_K, thermal_conductivity, out=thermal_conductivity)
+        thermal_conductivity *= ratio_ref
+        np.power(thermal_conductivity, 3 / 2, out=thermal_conductivity)
+        thermal_conductivity *= const["conductivity_ref"]
+
+    return (
+        thermal_conductivity if thermal_conductivity.ndim else thermal_conductivity[()]
+    )  # [W/mK]
 
 
 def air_atomic_molar_mass(molecules: str = None) -> dict[str, float]:
@@ -99,18 +172,27 @@ def air_atomic_molar_mass(molecules: str = None) -> dict[str, float]:
     if not molecules:
         molecules = ["N+", "O+", "NO+", "N2+", "O2+", "N", "O", "NO", "N2", "O2"]
 
-    air_atomic_dict = {i: molmass.Formula(i).mass for i in molecules}
+    air_atomic_dict = {i: species_registry.species_molar_mass(i) for i in molecules}
 
     return air_atomic_dict  # [g/mol]
 
 
-def speed_of_sound(temperature_K: float, adiabatic_indx: float = 1.4) -> float:
+@chunked_elementwise("temperature_K", "adiabatic_indx")
+def speed_of_sound(
+    temperature_K: float,
+    adiabatic_indx: float = 1.4,
+    out: np.ndarray = None,
+    workspace: Workspace = None,
+) -> float:
     """
     Calculates the speed of sound
 
     Parameters:
         temperature_K: reference temperature in [K]
         adiabatic_indx: adiabatic index, 1.4 (default)
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         speed of sound in [m/s]
@@ -119,10 +201,7 @@ def speed_of_sound(temperature_K: float, adiabatic_indx: float = 1.4) -> float:
         >> speed_of_sound(300.0)
     """
     # Checking cases
-    if type(temperature_K) is float and temperature_K < 0:
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if type(temperature_K) is np.ndarray and (temperature_K < 0).any():
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
 
     gas_const = scipy.constants.R  # [J/mol*K]
     air_atomic_mass = air_atomic_molar_mass(["N2", "O2", "Ar", "CO2"])  # [g/mol]
@@ -133,20 +212,37 @@ def speed_of_sound(temperature_K: float, adiabatic_indx: float = 1.4) -> float:
         + 0.93 * air_atomic_mass["Ar"]
         + 0.07 * air_atomic_mass["CO2"]
     ) * 1e-5  # [kg/mol]
-    spd_of_sound = np.sqrt(
-        adiabatic_indx * temperature_K * gas_const / air_molecular_mass
+    spd_of_sound = work_buffer(
+        "speed_of_sound",
+        np.broadcast_shapes(np.shape(temperature_K), np.shape(adiabatic_indx)),
+        np.result_type(temperature_K, adiabatic_indx, 1.0),
+        out,
+        workspace,
     )
-    return spd_of_sound  # [m/s]
+    np.multiply(adiabatic_indx, temperature_K, out=spd_of_sound)
+    spd_of_sound *= gas_const / air_molecular_mass
+    np.sqrt(spd_of_sound, out=spd_of_sound)
+
+    return spd_of_sound if spd_of_sound.ndim else spd_of_sound[()]  # [m/s]
 
 
+@chunked_elementwise("mach_1")
 def isentropic_relations(
-    mach_1: float, adiabatic_indx: float = 1.4
+    mach_1: float,
+    adiabatic_indx: float = 1.4,
+    out: dict[str, np.ndarray] = None,
+    workspace: Workspace = None,
 ) -> dict[str, float]:
     """
     Calculates isentropic relations
 
     Parameters:
         mach_1: pre-shock mach number
+        adiabatic_indx: adiabatic index, 1.4 (default)
+        out: dictionary with pressure_s, temperature_s and/or density_s
+            arrays to store the results in, None (default)
+        workspace: Workspace that holds the results missing from out, None
+            (default)
 
     Returns:
         dict: A dictionary containing:
@@ -161,30 +257,43 @@ def isentropic_relations(
         Edition 4th (Anderson J., ISBN 978 1 260 57082 3)
     """
     # Checking cases
-    if mach_1 <= 0:
-        raise ValueError("Mach number has to be greater than 0!")
+    check_positive(mach_1, "Mach number has to be greater than 0!")
     gamma_minus = adiabatic_indx - 1
     gamma_ratio = gamma_minus / 2
+    isentropic_dict = _relation_buffers(
+        "isentropic_relations",
+        ["pressure_s", "temperature_s", "density_s"],
+        mach_1,
+        adiabatic_indx,
+        out,
+        workspace,
+    )
+    temperature_s = isentropic_dict["temperature_s"]
 
     # Stagnation temperature (Eq. 3.28)
-    temperature_s = 1 + gamma_ratio * mach_1**2
+    np.square(mach_1, out=temperature_s)
+    temperature_s *= gamma_ratio
+    temperature_s += 1
 
     # Stagnation pressure (Eq. 3.29)
-    pressure_s = temperature_s ** (adiabatic_indx / gamma_minus)
+    np.power(
+        temperature_s,
+        adiabatic_indx / gamma_minus,
+        out=isentropic_dict["pressure_s"],
+    )
 
     # Stagnation density (Eq. 3.30)
-    density_s = temperature_s ** (1.0 / gamma_minus)
+    np.power(temperature_s, 1.0 / gamma_minus, out=isentropic_dict["density_s"])
 
-    isentropic_dict = {
-        "pressure_s": pressure_s,
-        "temperature_s": temperature_s,
-        "density_s": density_s,
-    }
-    return isentropic_dict
+    return _relation_results(isentropic_dict)
 
 
+@chunked_elementwise("mach_1")
 def normal_shock_relations(
-    mach_1: float, adiabatic_indx: float = 1.4
+    mach_1: float,
+    adiabatic_indx: float = 1.4,
+    out: dict[str, np.ndarray] = None,
+    workspace: Workspace = None,
 ) -> dict[str, float]:
     """
     Calculates normal shock relations
@@ -192,6 +301,10 @@ def normal_shock_relations(
     Parameters:
         mach_1: pre-shock mach number
         adiabatic_indx: adiabatic index, 1.4 (default)
+        out: dictionary with mach_2, pressure_r, temperature_r, density_r
+            and/or pressure_s arrays to store the results in, None (default)
+        workspace: Workspace that holds the results missing from out and a
+            scratch array, None (default)
 
     Returns:
         dict: A dictionary containing:
@@ -206,39 +319,84 @@ def normal_shock_relations(
     """
     gamma_minus = adiabatic_indx - 1
     gamma_plus = adiabatic_indx + 1
-    mach_11 = mach_1**2
+    normal_shock_dict = _relation_buffers(
+        "normal_shock_relations",
+        ["mach_2", "pressure_r", "temperature_r", "density_r", "pressure_s"],
+        mach_1,
+        adiabatic_indx,
+        out,
+        workspace,
+    )
+    pressure_r = normal_shock_dict["pressure_r"]
+    density_r = normal_shock_dict["density_r"]
+    mach_11 = work_buffer(
+        "normal_shock_relations.mach_11",
+        pressure_r.shape,
+        pressure_r.dtype,
+        workspace=workspace,
+    )
+    np.square(mach_1, out=mach_11)
 
-    # Mach post-shock
-    mach_2 = gamma_minus * mach_11 + 2
-    mach_2 /= 2 * adiabatic_indx * mach_11 - gamma_minus
-    mach_2 **= 0.5
+    # Pressure ratio, (2 g M^2 - (g - 1)) / (g + 1)
+    np.multiply(mach_11, 2 * adiabatic_indx / gamma_plus, out=pressure_r)
+    pressure_r -= gamma_minus / gamma_plus
 
-    # Pressure ratio
-    pressure_r = (2 * adiabatic_indx * mach_11 - gamma_minus) / gamma_plus
+    # (g - 1) M^2 + 2, stored in the density ratio
+    np.multiply(mach_11, gamma_minus, out=density_r)
+    density_r += 2
 
     # Temperature ratio
-    temperature_r = 2 * adiabatic_indx * mach_11 - gamma_minus
-    temperature_r *= gamma_minus * mach_11 + 2
-    temperature_r /= gamma_plus**2 * mach_11
+    temperature_r = normal_shock_dict["temperature_r"]
+    np.multiply(pressure_r, density_r, out=temperature_r)
+    temperature_r /= mach_11
+    temperature_r /= gamma_plus
+
+    # Mach post-shock
+    mach_2 = normal_shock_dict["mach_2"]
+    np.divide(density_r, pressure_r, out=mach_2)
+    mach_2 /= gamma_plus
+    np.sqrt(mach_2, out=mach_2)
 
     # Density ratio
-    density_r = gamma_plus * mach_11 / (gamma_minus * mach_11 + 2)
+    np.divide(mach_11, density_r, out=density_r)
+    density_r *= gamma_plus
+
+    # Stagnation pressure ratio, mach_11 is used as scratch
+    pressure_s = normal_shock_dict["pressure_s"]
+    np.power(pressure_r, -1 / gamma_minus, out=pressure_s)
+    np.power(density_r, adiabatic_indx / gamma_minus, out=mach_11)
+    pressure_s *= mach_11
+
+    return _relation_results(normal_shock_dict)  # [ ]
+
+
+def _relation_buffers(
+    name: str,
+    keys: list[str],
+    mach_1: float,
+    adiabatic_indx: float,
+    out: dict[str, np.ndarray],
+    workspace: Workspace,
+) -> dict[str, np.ndarray]:
+    """
+    Helper function that returns the output arrays of a flow relation, of
+    the broadcast shape of the mach number and adiabatic index
+    """
+    if out is None:
+        out = {}
+    shape = np.broadcast_shapes(np.shape(mach_1), np.shape(adiabatic_indx))
+    dtype = np.result_type(mach_1, adiabatic_indx, 1.0)
+    return {
+        key: work_buffer(f"{name}.{key}", shape, dtype, out.get(key), workspace)
+        for key in keys
+    }
 
-    # Stagnation pressure ratio
-    pressure_s1 = gamma_plus / (2 * adiabatic_indx * mach_11 - gamma_minus)
-    pressure_s1 **= 1 / gamma_minus
-    pressure_s2 = gamma_plus * mach_11 / (gamma_minus * mach_11 + 2)
-    pressure_s2 **= adiabatic_indx / gamma_minus
-    pressure_s = pressure_s1 * pressure_s2
 
-    normal_shock_dict = {
-        "mach_2": mach_2,
-        "pressure_r": pressure_r,
-        "temperature_r": temperature_r,
-        "density_r": density_r,
-        "pressure_s": pressure_s,
-    }
-    return normal_shock_dict  # [ ]
+def _relation_results(relation_dict: dict[str, np.ndarray]) -> dict[str, float]:
+    """
+    Helper function that returns scalars for scalar flow relations
+    """
+    return {key: val if val.ndim else val[()] for key, val in relation_dict.items()}
 
 
 def oblique_shock_relations(
@@ -378,3 +536,6 @@ def oblique_shock_angle(
     )[0]
 
     return np.degrees(beta_weak_rad), np.degrees(beta_strong_rad)
+
+
+instrument_module(globals())
@@ -0,0 +1,249 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   batch.py
+Def:    Contains a process pool driver for multi-snapshot post-processing.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy as np
+from haot.instrumentation import instrument_module
+
+# Function and shared arrays of a worker process, set by _attach_worker
+_WORKER = {}
+
+
+def process_snapshots(
+    function,
+    fields: dict[str, np.ndarray],
+    workers: int = None,
+    ordered: bool = True,
+    callback=None,
+) -> dict[str, np.ndarray]:
+    """
+    Processes independent snapshots (ex. CFD time steps) in a process pool.
+    Fields are copied once to shared memory and mapped by every worker, and
+    the results of each snapshot are written to preallocated shared arrays,
+    only snapshot indices are sent between processes. Each worker has its
+    own GIL, so Python loops (ex. gladstone_dale_constant or the partition
+    functions) run in parallel
+
+    Parameters:
+        function: module level function of a snapshot, takes a dictionary
+            of read-only snapshot fields (fields[key][i]) and returns a
+            dictionary of scalars or arrays, ex. opd_rms and strehl_ratio.
+            Result shapes and dtypes are set by the first snapshot, integer
+            and boolean results are stored as floats
+        fields: dictionary of arrays of shape [snapshots, ...], ex.
+            {"temperature_K": T, "mass_density": rho}
+        workers: number of processes, None (default) uses all cores, 1 runs
+            in the calling process
+        ordered: True (default) completes the snapshots in order, False as
+            soon as each one is done
+        callback: function called with the index and a copy of the results
+            of each completed snapshot, None (default)
+
+    Returns:
+        dict: A dictionary with the results of function, with a leading
+        [snapshots] axis
+
+    Examples:
+        >> def snapshot_statistics(snapshot):
+        >>     opd_rms = optical_path_difference_rms(opl(snapshot))
+        >>     variance = phase_variance(opd_rms, 633.0)
+        >>     return {"opd_rms": opd_rms, "strehl_ratio": strehl_ratio(variance)}
+
+        >> results = process_snapshots(
+        >>     snapshot_statistics, {"temperature_K": T, "mass_density": rho}, 32
+        >> )
+    """
+    if not isinstance(fields, dict) or not fields:
+        raise ValueError("fields must be a dictionary of arrays")
+    fields = {key: np.asarray(val) for key, val in fields.items()}
+    n_snapshots = {len(val) if val.ndim else 0 for val in fields.values()}
+    if len(n_snapshots) > 1:
+        raise ValueError("All fields must have the same number of snapshots!")
+    n_snapshots = n_snapshots.pop()
+    if n_snapshots < 1:
+        raise ValueError("fields must contain at least one snapshot")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, (int, np.integer)) or workers < 1:
+        raise ValueError("Number of workers must be a positive integer!")
+
+    # First snapshot in the calling process, sets the result shapes
+    first = _snapshot_results(function, _snapshot(fields, 0), None)
+
+    if workers == 1 or n_snapshots == 1:
+        results = {
+            key: np.empty((n_snapshots,) + val.shape, np.result_type(val, float))
+            for key, val in first.items()
+        }
+        for i in range(n_snapshots):
+            if i:
+                snapshot = _snapshot_results(function, _snapshot(fields, i), results)
+            else:
+                snapshot = first
+            for key, val in snapshot.items():
+                results[key][i] = val
+            _notify(callback, i, results)
+        return results
+
+    shared_fields = _SharedArrays()
+    shared_results = _SharedArrays()
+    try:
+        for key, val in fields.items():
+            shared_fields.create(key, val.shape, val.dtype, val)
+        for key, val in first.items():
+            shared_results.create(
+                key, (n_snapshots,) + val.shape, np.result_type(val, float)
+            )
+            shared_results.arrays[key][0] = val
+        _notify(callback, 0, shared_results.arrays)
+
+        context = multiprocessing.get_context()
+        with context.Pool(
+            min(workers, n_snapshots - 1),
+            initializer=_attach_worker,
+            initargs=(function, shared_fields.specs(), shared_results.specs()),
+        ) as pool:
+            imap = pool.imap if ordered else pool.imap_unordered
+            for i in imap(_process_snapshot, range(1, n_snapshots)):
+                _notify(callback, i, shared_results.arrays)
+
+        return {key: val.copy() for key, val in shared_results.arrays.items()}
+    finally:
+        shared_fields.close()
+        shared_results.close()
+
+
+def _snapshot(fields: dict[str, np.ndarray], index: int) -> dict[str, np.ndarray]:
+    """
+    Helper function that returns read-only views of a snapshot
+    """
+    snapshot = {}
+    for key, val in fields.items():
+        snapshot[key] = val[index].view() if val.ndim > 1 else val[index]
+        if isinstance(snapshot[key], np.ndarray):
+            snapshot[key].flags.writeable = False
+    return snapshot
+
+
+def _snapshot_results(function, snapshot: dict, results: dict) -> dict:
+    """
+    Helper function that calls function on a snapshot and checks its
+    results against the results of the first snapshot
+    """
+    snapshot_results = function(snapshot)
+    if not isinstance(snapshot_results, dict):
+        raise ValueError("function must return a dictionary")
+    snapshot_results = {key: np.asarray(val) for key, val in snapshot_results.items()}
+    if results is None:
+        return snapshot_results
+    if snapshot_results.keys() != results.keys():
+        raise ValueError("function must return the same results for all snapshots")
+    for key, val in snapshot_results.items():
+        if val.shape != results[key].shape[1:]:
+            raise ValueError(
+                f"Result '{key}' has shape {val.shape}, the first snapshot "
+                f"returned {results[key].shape[1:]}!"
+            )
+        if not np.can_cast(val.dtype, results[key].dtype, "same_kind"):
+            raise ValueError(
+                f"Result '{key}' of type {val.dtype} does not fit the first "
+                f"snapshot type {results[key].dtype}!"
+            )
+    return snapshot_results
+
+
+def _notify(callback, index: int, results: dict[str, np.ndarray]):
+    """
+    Helper function that calls callback with a copy of a snapshot results
+    """
+    if callback is not None:
+        callback(index, {key: np.array(val[index]) for key, val in results.items()})
+
+
+def _attach_worker(function, field_specs: dict, result_specs: dict):
+    """
+    Helper function that maps the shared arrays in a worker process
+    """
+    _WORKER["function"] = function
+    _WORKER["blocks"] = []
+    _WORKER["fields"] = _attach_arrays(field_specs, _WORKER["blocks"])
+    _WORKER["results"] = _attach_arrays(result_specs, _WORKER["blocks"])
+    for val in _WORKER["fields"].values():
+        val.flags.writeable = False
+
+
+def _attach_arrays(specs: dict, blocks: list) -> dict[str, np.ndarray]:
+    """
+    Helper function that maps shared memory blocks as arrays
+    """
+    arrays = {}
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return arrays
+
+
+def _process_snapshot(index: int) -> int:
+    """
+    Helper function that processes a snapshot in a worker process
+    """
+    results = _WORKER["results"]
+    snapshot = _snapshot(_WORKER["fields"], index)
+    for key, val in _snapshot_results(_WORKER["function"], snapshot, results).items():
+        results[key][index] = val
+    return index
+
+
+class _SharedArrays:
+    """
+    Helper class that owns shared memory blocks and their array views
+    """
+
+    def __init__(self):
+        self.arrays = {}
+        self._blocks = {}
+
+    def create(
+        self, key: str, shape: tuple[int, ...], dtype: np.dtype, values=None
+    ) -> np.ndarray:
+        """
+        Helper method that allocates a shared array, and copies values in it
+        """
+        dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._blocks[key] = block
+        self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if values is not None:
+            self.arrays[key][...] = values
+        return self.arrays[key]
+
+    def specs(self) -> dict[str, tuple]:
+        """
+        Helper method that returns the block name, shape and data type of
+        each array
+        """
+        return {
+            key: (self._blocks[key].name, val.shape, val.dtype.str)
+            for key, val in self.arrays.items()
+        }
+
+    def close(self):
+        """
+        Helper method that releases the shared memory blocks
+        """
+        self.arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+
+instrument_module(globals())
@@ -6,10 +6,13 @@ Def:    Contains conversion functions.
 """
 
 import numpy as np
-import molmass
 import scipy.constants as s_consts
+from haot import species as species_registry
+from haot.parallel import chunked_elementwise
+from haot.instrumentation import instrument_module
 
 
+@chunked_elementwise("polarizability_cgs")
 def polarizability_cgs_to_si(polarizability_cgs: float) -> float:
     """
     Converts volumetric polarizability (CGS) to atomic polarizability (SI)
@@ -23,6 +26,7 @@ def polarizability_cgs_to_si(polarizability_cgs: float) -> float:
     return polarizability_cgs * 4 * np.pi * s_consts.epsilon_0 * 1e-6
 
 
+@chunked_elementwise("polarizability_si")
 def polarizability_si_to_cgs(polarizability_si: float) -> float:
     """
     Converts atomic polarizability (SI) to volumetric polarizability (CGS)
@@ -36,6 +40,7 @@ def polarizability_si_to_cgs(polarizability_si: float) -> float:
     return polarizability_si * 1e6 / (4 * np.pi * s_consts.epsilon_0)
 
 
+@chunked_elementwise("wavenumber_cm")
 def wavenumber_to_electronvolt(wavenumber_cm: float) -> float:
     """
     Converts wavenumber to electron-volt
@@ -49,6 +54,7 @@ def wavenumber_to_electronvolt(wavenumber_cm: float) -> float:
     return wavenumber_to_joules(wavenumber_cm) / s_consts.eV
 
 
+@chunked_elementwise("wavenumber_cm")
 def wavenumber_to_joules(wavenumber_cm: float) -> float:
     """
     Converts wavenumber to Joules
@@ -62,6 +68,7 @@ def wavenumber_to_joules(wavenumber_cm: float) -> float:
     return wavenumber_cm * s_consts.c * 100 * s_consts.h
 
 
+@chunked_elementwise("wavenumber_cm")
 def wavenumber_to_angular_frequency(wavenumber_cm: float) -> float:
     """
     Converts wavenumber to [rads/seconds]
@@ -75,6 +82,7 @@ def wavenumber_to_angular_frequency(wavenumber_cm: float) -> float:
     return 2 * np.pi * s_consts.c * wavenumber_cm * 100
 
 
+@chunked_elementwise("mass_density")
 def mass_density_to_molar_density(mass_density: float, molecule: str) -> float:
     """
     Converts mass_density [kg/m3] to molar density [particles/m3]
@@ -86,9 +94,11 @@ def mass_density_to_molar_density(mass_density: float, molecule: str) -> float:
     Returns:
         molar density in [particles/m3]
     """
-    return mass_density * s_consts.N_A / molmass.Formula(molecule).mass * 1e3
+    molar_mass = species_registry.species_molar_mass(molecule)  # [g/mol]
+    return mass_density * s_consts.N_A / molar_mass * 1e3
 
 
+@chunked_elementwise("molar_mass_gmol")
 def molar_mass_to_kilogram(molar_mass_gmol: float) -> float:
     """
     Converts molar mass [g/mol] to mass [kg]
@@ -100,3 +110,6 @@ def molar_mass_to_kilogram(molar_mass_gmol: float) -> float:
         mass in [kg]
     """
     return molar_mass_gmol * 1e-3 / s_consts.N_A
+
+
+instrument_module(globals())
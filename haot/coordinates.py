@@ -6,6 +6,8 @@ Def:    Contains coordinates functions.
 """
 
 import numpy as np
+from haot import kernels
+from haot.instrumentation import instrument_module
 
 
 def _earth_data() -> dict:
@@ -78,7 +80,7 @@ def lla_to_ecef(*args) -> np.ndarray:
         ecef_x, ecef_y, ecef_z: float ECEF coordinates [m]
     """
     if len(args) == 1:
-        lat_degs, lon_deg, alt_m = args[0]
+        lat_deg, lon_deg, alt_m = args[0]
     elif len(args) == 3:
         lat_deg, lon_deg, alt_m = args
     else:
@@ -119,7 +121,7 @@ def ecef_to_lla(*args) -> np.ndarray:
                     ECEF coordinates [x, y, z] in meters.
 
     Returns:
-        lla : numpy.ndarray of shape (3,)
+        lla : numpy.ndarray of shape (3,), or (3, n) for arrays of n points
             Geodetic coordinates [latitude (deg), longitude (deg), altitude (m)].
     """
     if len(args) == 1:
@@ -137,21 +139,36 @@ def ecef_to_lla(*args) -> np.ndarray:
     a_4 = 2.5 * a_2
     a_5 = a_1 + a_3
     a_6 = 1 - eccentricity_2
-    radius = np.linalg.norm([ecef_x, ecef_y, ecef_z])
+    kernel = kernels.compiled_kernel("ecef_to_lla")
+    if kernel is not None:
+        constants = np.array(
+            [
+                earth_dict["semi_major_earth_radius_m"],
+                eccentricity_2,
+                a_1,
+                a_2,
+                a_3,
+                a_4,
+                a_5,
+                a_6,
+            ]
+        )
+        return np.array(kernel(ecef_x, ecef_y, ecef_z, constants))
+    radius = np.sqrt(ecef_x**2 + ecef_y**2 + ecef_z**2)
     u = a_2 / radius
     v = a_3 - (a_4 / radius)
     s_2 = (ecef_z / radius) ** 2
     c_2 = (ecef_x**2 + ecef_y**2) / radius**2
-    longitude_deg = np.degrees(np.arctan(ecef_y / ecef_x))
+    longitude_deg = np.degrees(np.arctan2(ecef_y, ecef_x))
 
-    if c_2 > 0.3:
-        s = (np.abs(ecef_z) / radius) * (1.0 + c_2 * (a_1 + u + s_2 * v) / radius)
-        latitude_rad = np.arcsin(s)
-        c = np.sqrt(1.0 - s**2)
-    else:
-        c = np.sqrt(c_2) * (1 - s_2 * (a_5 - u - c_2 * v) / radius)
-        latitude_rad = np.arccos(c)
-        s = np.sqrt(1.0 - c**2)
+    # Both branches are evaluated for arrays, only the valid one is kept
+    with np.errstate(invalid="ignore"):
+        s_a = (np.abs(ecef_z) / radius) * (1.0 + c_2 * (a_1 + u + s_2 * v) / radius)
+        c_b = np.sqrt(c_2) * (1 - s_2 * (a_5 - u - c_2 * v) / radius)
+        branch = c_2 > 0.3
+        s = np.where(branch, s_a, np.sqrt(1.0 - c_b**2))
+        c = np.where(branch, np.sqrt(1.0 - s_a**2), c_b)
+        latitude_rad = np.where(branch, np.arcsin(s_a), np.arccos(c_b))
 
     g = 1.0 - eccentricity_2 * s**2
     rg = earth_dict["semi_major_earth_radius_m"] / np.sqrt(g)
@@ -163,8 +180,7 @@ def ecef_to_lla(*args) -> np.ndarray:
     p = m / (rf / g + f)
     latitude_deg = np.degrees(latitude_rad + p)
     altitude_m = f + (0.5 * m * p)
-    if ecef_z < 0:
-        latitude_deg *= -1
+    latitude_deg = np.where(ecef_z < 0, -latitude_deg, latitude_deg)
     return np.array([latitude_deg, longitude_deg, altitude_m])
 
 
@@ -282,3 +298,6 @@ def euler_angles_from_dcm(dcm: np.ndarray) -> np.ndarray:
     yaw_deg = np.rad2deg(np.arctan(dcm[0][1] / dcm[0][0]))
 
     return np.array([roll_deg, pitch_deg, yaw_deg])
+
+
+instrument_module(globals())
@@ -0,0 +1,169 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   far_field.py
+Def:    Contains far-field (Fraunhofer) functions for aberrated wavefronts.
+"""
+
+import numpy as np
+import scipy.fft
+from haot import zernike
+from haot.streaming import chunked_frames, grouped_frames
+from haot.instrumentation import instrument_module
+
+
+def far_field_statistics(
+    opd: np.ndarray,
+    wavelength_nm: float,
+    aperture_mask: np.ndarray = None,
+    padding: int = 2,
+    encircled_radii: tuple[float, ...] = (1.22,),
+    chunk_size: int = 16,
+    workers: int = None,
+) -> dict[str, np.ndarray]:
+    """
+    Calculates far-field statistics of Optical Path Difference frames. The
+    point spread function (PSF) of each frame is the squared modulus of the
+    zero-padded Fourier transform of the pupil field
+    exp(2 pi i OPD / wavelength). Frames are processed in chunks that reuse
+    the same padded buffers, so long runs (ex. a numpy.memmap or a frame
+    generator) are never loaded in memory
+
+    Parameters:
+        opd: Optical Path Difference in [m], numpy array of shape
+            [time, x_axis, y_axis] or an iterable of [x_axis, y_axis] frames
+        wavelength_nm: wavelength of light in [nm]
+        aperture_mask: boolean aperture mask of shape [x_axis, y_axis], None
+            (default) uses the largest circle inscribed in the grid
+        padding: zero-padding factor of the pupil grid, 2 (default) samples
+            the PSF at Nyquist. The PSF is sampled every 1 / padding [lambda/D]
+        encircled_radii: radii around the optical axis in [lambda/D] where the
+            encircled energy is calculated, (1.22,) (default) is the first
+            Airy null
+        chunk_size: frames transformed at once, 16 (default)
+        workers: FFT workers, None (default) uses one
+
+    Returns:
+        dict: A dictionary containing
+            - strehl_ratio: PSF peak over the diffraction limited PSF peak,
+              shape [time]
+            - encircled_energy: PSF energy fraction inside encircled_radii,
+              shape [time, radii]
+            - centroid: PSF centroid (beam jitter) in [lambda/D], shape
+              [time, 2], along x_axis and y_axis
+
+    Examples:
+        >> opd = np.load('opd.npy', mmap_mode='r')
+
+        >> stats = far_field_statistics(opd, 532.0, encircled_radii=(1.0, 2.0))
+
+    Reference:
+        Introduction to Fourier Optics (ISBN: 978-0974707723)
+    """
+    if wavelength_nm <= 0:
+        raise ValueError("Wavelength must be greater than 0!")
+    if not isinstance(padding, (int, np.integer)) or padding < 1:
+        raise ValueError("Padding should be a positive integer!")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than 0!")
+
+    if isinstance(opd, np.ndarray):
+        if opd.ndim != 3:
+            raise ValueError("opd must be of shape [time, x_axis, y_axis]")
+        chunks = chunked_frames(opd, chunk_size)
+    else:
+        chunks = grouped_frames(opd, chunk_size)
+
+    radii = np.atleast_1d(np.asarray(encircled_radii, dtype=float))
+    wavenumber = 2 * np.pi / (wavelength_nm * 1e-9)  # [1/m]
+    strehl, encircled, centroid = ([], [], [])
+    engine = None
+    for chunk in chunks:
+        if engine is None:
+            engine = _FarFieldEngine(chunk.shape[1:], aperture_mask, padding, radii)
+        psf = engine.point_spread_function(chunk, wavenumber, workers)
+        flat_psf = psf.reshape(psf.shape[0], -1)
+        energy = flat_psf.sum(axis=1)
+        strehl.append(flat_psf.max(axis=1) / engine.ideal_peak)
+        encircled.append((flat_psf @ engine.encircled_weights) / energy[:, None])
+        centroid.append((flat_psf @ engine.coordinates) / energy[:, None])
+    if engine is None:
+        raise ValueError("opd must contain at least one frame")
+
+    return {
+        "strehl_ratio": np.concatenate(strehl),
+        "encircled_energy": np.concatenate(encircled),
+        "centroid": np.concatenate(centroid),
+    }
+
+
+class _FarFieldEngine:
+    """
+    Helper class that holds the padded FFT buffers and the far-field
+    coordinates of a pupil grid
+    """
+
+    def __init__(
+        self,
+        grid_shape: tuple[int, int],
+        aperture_mask: np.ndarray,
+        padding: int,
+        radii: np.ndarray,
+    ):
+        if aperture_mask is None:
+            aperture_mask = zernike.circular_aperture(grid_shape)
+        aperture_mask = np.asarray(aperture_mask, dtype=bool)
+        if aperture_mask.shape != tuple(grid_shape):
+            raise ValueError("Aperture mask must have the grid shape")
+        if not aperture_mask.any():
+            raise ValueError("Aperture mask must contain at least one point")
+        self.grid_shape = tuple(grid_shape)
+        self.mask = aperture_mask
+        self.padded_shape = tuple(padding * n for n in grid_shape)
+        # Diffraction limited peak of a uniform pupil, |sum(pupil)|^2
+        self.ideal_peak = float(aperture_mask.sum()) ** 2
+
+        # Far-field coordinates in [lambda/D], in FFT order (no shifting)
+        x_coord, y_coord = np.meshgrid(
+            np.fft.fftfreq(self.padded_shape[0], 1 / grid_shape[0]),
+            np.fft.fftfreq(self.padded_shape[1], 1 / grid_shape[1]),
+            indexing="ij",
+        )
+        self.coordinates = np.c_[x_coord.ravel(), y_coord.ravel()]
+        radius = np.hypot(x_coord, y_coord).ravel()
+        self.encircled_weights = (radius[:, None] <= radii).astype(float)
+
+        self._field = np.empty((0,) + self.padded_shape, dtype=complex)
+        self._psf = np.empty((0,) + self.padded_shape)
+
+    def point_spread_function(
+        self, opd: np.ndarray, wavenumber: float, workers: int
+    ) -> np.ndarray:
+        """
+        Helper method that returns the PSF of a chunk of frames, the returned
+        array is a view of an internal buffer
+        """
+        if opd.shape[1:] != self.grid_shape:
+            raise ValueError("All frames must have the same shape")
+        n_frames = opd.shape[0]
+        if self._field.shape[0] < n_frames:
+            self._field = np.empty((n_frames,) + self.padded_shape, dtype=complex)
+            self._psf = np.empty((n_frames,) + self.padded_shape)
+        field = self._field[:n_frames]
+        psf = self._psf[:n_frames]
+
+        # Pupil field, zero outside the aperture
+        field.fill(0.0)
+        phase = np.asarray(opd, dtype=np.float64)[:, self.mask] * wavenumber
+        pupil = field[:, : self.grid_shape[0], : self.grid_shape[1]]
+        pupil[:, self.mask] = np.exp(1j * phase)
+
+        # In place for contiguous complex buffers
+        spectrum = scipy.fft.fft2(field, axes=(1, 2), overwrite_x=True, workers=workers)
+        np.multiply(spectrum.real, spectrum.real, out=psf)
+        psf += spectrum.imag**2
+
+        return psf
+
+
+instrument_module(globals())
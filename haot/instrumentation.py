@@ -0,0 +1,273 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   instrumentation.py
+Def:    Contains the opt-in profiling of the public functions, call counts,
+        wall time, element throughput and allocated bytes.
+"""
+
+import atexit
+import contextlib
+import functools
+import os
+import sys
+import threading
+import time
+import types
+import numpy as np
+
+# Profiling switch, HAOT_PROFILE=1 (or a .json path) enables it at import
+_POLICY = {"enabled": os.environ.get("HAOT_PROFILE", "0") not in ("", "0")}
+# Counters per function, name -> calls, time_s, elements, bytes
+_STATS = {}
+_LOCK = threading.Lock()
+
+
+def set_profiling(enabled: bool):
+    """
+    Enables or disables the profiling of the public functions. Each call of
+    an instrumented function records its wall time, the elements of its
+    largest array argument and the bytes of the arrays it returns. When
+    disabled an instrumented call costs a dictionary lookup
+
+    Parameters:
+        enabled: True records calls, False (default at import, unless the
+            HAOT_PROFILE environment variable is set) does not
+
+    Examples:
+        >> set_profiling(True)
+    """
+    _POLICY["enabled"] = bool(enabled)
+
+
+def get_profiling() -> bool:
+    """
+    Returns whether calls are profiled
+
+    Returns:
+        True or False
+    """
+    return _POLICY["enabled"]
+
+
+@contextlib.contextmanager
+def profiling(reset: bool = True):
+    """
+    Context manager that profiles the calls of its block, and restores the
+    previous setting on exit
+
+    Parameters:
+        reset: clears the counters on entry, True (default)
+
+    Examples:
+        >> with profiling():
+        >>     index = index_of_refraction_density_temperature(T, rho)
+        >> print(profile_report())
+    """
+    previous = _POLICY["enabled"]
+    if reset:
+        reset_profile()
+    _POLICY["enabled"] = True
+    try:
+        yield
+    finally:
+        _POLICY["enabled"] = previous
+
+
+def reset_profile():
+    """
+    Clears the profiling counters
+    """
+    with _LOCK:
+        _STATS.clear()
+
+
+def profile_stats() -> dict[str, dict]:
+    """
+    Returns the profiling counters of each instrumented function. Time of
+    nested calls is included in the caller
+
+    Returns:
+        dictionary keyed by <module>.<function>:
+            - calls: number of calls
+            - time_s: cumulative wall time in [s]
+            - elements: cumulative elements of the largest array arguments
+            - bytes: cumulative bytes of the returned arrays
+            - elements_per_s: element throughput in [1/s]
+    """
+    with _LOCK:
+        stats = {name: dict(val) for name, val in _STATS.items()}
+    for val in stats.values():
+        val["elements_per_s"] = (
+            val["elements"] / val["time_s"] if val["time_s"] else 0.0
+        )
+    return stats
+
+
+def profile_report(output_format: str = "table", sort: str = "time_s") -> str:
+    """
+    Returns the profiling report as a table or as JSON
+
+    Parameters:
+        output_format: 'table' (default) or 'json'
+        sort: counter the functions are sorted by (descending), 'time_s'
+            (default), 'calls', 'elements' or 'bytes'
+
+    Returns:
+        report
+
+    Examples:
+        >> print(profile_report())
+
+        >> open('profile.json', 'w').write(profile_report(output_format='json'))
+    """
+    if output_format not in ["table", "json"]:
+        raise ValueError("Output format must be 'table' or 'json'")
+    if sort not in ["time_s", "calls", "elements", "bytes"]:
+        raise ValueError("Sort must be 'time_s', 'calls', 'elements' or 'bytes'")
+    stats = profile_stats()
+    names = sorted(stats, key=lambda name: stats[name][sort], reverse=True)
+    if output_format == "json":
+        import json
+
+        return json.dumps({name: stats[name] for name in names}, indent=2)
+
+    lines = [
+        f"{'function':<56}{'calls':>8}{'total [ms]':>12}{'mean [us]':>11}"
+        f"{'Melem/s':>10}{'MB':>9}"
+    ]
+    for name in names:
+        val = stats[name]
+        lines.append(
+            f"{name:<56}{val['calls']:>8}{1e3 * val['time_s']:>12.3f}"
+            f"{1e6 * val['time_s'] / val['calls']:>11.2f}"
+            f"{1e-6 * val['elements_per_s']:>10.2f}{val['bytes'] / 2**20:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def instrumented(function, name: str = None):
+    """
+    Decorator that records the calls of a function while profiling is on
+
+    Parameters:
+        function: function to instrument
+        name: name in the report, None (default) is <module>.<qualname>
+
+    Examples:
+        >> @instrumented
+        >> def speed_of_sound(temperature_K, ...):
+        >>     ...
+    """
+    if name is None:
+        name = f"{function.__module__}.{function.__qualname__}"
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _POLICY["enabled"]:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        _record(name, elapsed, _elements(args, kwargs), _nbytes(result))
+        return result
+
+    # Cached functions keep their cache controls
+    for attr in ["cache_clear", "cache_info"]:
+        if hasattr(function, attr):
+            setattr(wrapper, attr, getattr(function, attr))
+    return wrapper
+
+
+def instrument_module(namespace: dict):
+    """
+    Instruments the public functions, and the public methods of the public
+    classes, defined in a module. Called at the end of the module
+
+    Parameters:
+        namespace: globals() of the module
+
+    Examples:
+        >> instrument_module(globals())
+    """
+    module = namespace["__name__"]
+    for key, val in list(namespace.items()):
+        if key.startswith("_") or getattr(val, "__module__", None) != module:
+            continue
+        if isinstance(val, type):
+            for attr, method in list(vars(val).items()):
+                if not attr.startswith("_") and isinstance(method, types.FunctionType):
+                    setattr(val, attr, instrumented(method))
+        elif callable(val):
+            namespace[key] = instrumented(val)
+
+
+def _record(name: str, elapsed: float, elements: int, nbytes: int):
+    """
+    Helper function that adds a call to the counters
+    """
+    with _LOCK:
+        stats = _STATS.get(name)
+        if stats is None:
+            stats = _STATS[name] = {
+                "calls": 0,
+                "time_s": 0.0,
+                "elements": 0,
+                "bytes": 0,
+            }
+        stats["calls"] += 1
+        stats["time_s"] += elapsed
+        stats["elements"] += elements
+        stats["bytes"] += nbytes
+
+
+def _elements(args: tuple, kwargs: dict) -> int:
+    """
+    Helper function that returns the elements of the largest array argument
+    (or of a dictionary of arrays), 1 for scalar calls
+    """
+    elements = 1
+    for val in (*args, *kwargs.values()):
+        if isinstance(val, dict):
+            sizes = [
+                np.size(item) for item in val.values() if isinstance(item, np.ndarray)
+            ]
+            elements = max(elements, *sizes) if sizes else elements
+        elif isinstance(val, np.ndarray):
+            elements = max(elements, val.size)
+    return elements
+
+
+def _nbytes(result) -> int:
+    """
+    Helper function that returns the bytes of the arrays in a result,
+    memory mapped arrays are not allocated and count as zero
+    """
+    if isinstance(result, np.memmap):
+        return 0
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, dict):
+        return sum(_nbytes(val) for val in result.values())
+    if isinstance(result, (tuple, list)):
+        return sum(_nbytes(val) for val in result)
+    return 0
+
+
+def _report_at_exit():
+    """
+    Helper function that writes the report when HAOT_PROFILE is set, as
+    JSON when it is a .json path, otherwise as a table on stderr
+    """
+    if not _STATS:
+        return
+    target = os.environ.get("HAOT_PROFILE", "")
+    if target.endswith(".json"):
+        with open(target, "w") as file:
+            file.write(profile_report(output_format="json"))
+    else:
+        print(profile_report(), file=sys.stderr)
+
+
+if _POLICY["enabled"]:
+    atexit.register(_report_at_exit)
@@ -0,0 +1,195 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   kernels.py
+Def:    Contains optional JIT compiled kernels of elementwise formulas.
+"""
+
+import functools
+import math
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Kernel backend, numba when installed
+_POLICY = {"backend": "numpy" if numba is None else "numba"}
+
+
+def set_backend(backend: str):
+    """
+    Sets the backend of elementwise formulas (Buldakov expansion, Kerl
+    polarizability, Lorentz-Lorenz dense index, Sutherland laws and
+    ecef_to_lla). The numba backend fuses each formula in a single compiled
+    loop, without temporary arrays, kernels are compiled on first use and
+    only take float64 fields. The numpy backend is the reference
+    implementation, results agree to a few ulps
+
+    Parameters:
+        backend: 'numba' (default when installed) or 'numpy'
+
+    Examples:
+        >> set_backend('numpy')
+    """
+    if backend not in ["numba", "numpy"]:
+        raise ValueError("Backend must be 'numba' or 'numpy'")
+    if backend == "numba" and numba is None:
+        raise ValueError("The numba backend requires numba, pip install numba!")
+    _POLICY["backend"] = backend
+
+
+def get_backend() -> str:
+    """
+    Returns the backend of elementwise formulas
+
+    Returns:
+        'numba' or 'numpy'
+    """
+    return _POLICY["backend"]
+
+
+def compiled_kernel(name: str, dtype: np.dtype = np.float64):
+    """
+    Returns the compiled kernel (a NumPy ufunc) of a formula, None with the
+    numpy backend or for non float64 fields
+
+    Parameters:
+        name: buldakov_polarizability, kerl_polarizability, dense_refractivity,
+            sutherland_viscosity, sutherland_conductivity or ecef_to_lla
+        dtype: data type of the fields, np.float64 (default)
+
+    Returns:
+        kernel ufunc or None
+
+    Examples:
+        >> kernel = compiled_kernel('kerl_polarizability')
+    """
+    if name not in _KERNELS:
+        raise ValueError(f"Unknown kernel '{name}'!")
+    if _POLICY["backend"] != "numba" or np.dtype(dtype) != np.float64:
+        return None
+    return _compile(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(name: str):
+    """
+    Helper function that compiles a kernel, once per process (and cached on
+    disk by numba)
+    """
+    function, signature, layout = _KERNELS[name]
+    if layout is None:
+        return numba.vectorize([signature], nopython=True, cache=True)(function)
+    return numba.guvectorize([signature], layout, nopython=True, cache=True)(function)
+
+
+def _buldakov_polarizability(
+    vibrational_number, rotational_number, c_0, c_1, c_2, c_3, c_4
+):
+    """
+    Helper kernel of optics.buldakov_expansion, the polynomial in
+    g = 2 v + 1 and r = J (J + 1)
+    """
+    g = 2.0 * vibrational_number + 1.0
+    r = rotational_number * (rotational_number + 1.0)
+    return (c_4 * r + c_3 * g + c_1) * g + c_2 * r + c_0
+
+
+def _kerl_polarizability(temperature_K, b, c, scale):
+    """
+    Helper kernel of optics.kerl_polarizability_temperature,
+    a_0 (1 + b T + c T^2) / (1 - (w / w_0)^2)
+    """
+    return ((temperature_K * c + b) * temperature_K + 1.0) * scale
+
+
+def _dense_refractivity(dilute_refractivity):
+    """
+    Helper kernel of the Lorentz-Lorenz dense refractivity, from the dilute
+    refractivity x, n_dense - 1 = exp(log(1 + 6 x / (3 - 2 x)) / 2) - 1
+    """
+    ratio = dilute_refractivity / (dilute_refractivity * -2.0 + 3.0)
+    return math.expm1(0.5 * math.log1p(ratio * 6.0))
+
+
+def _sutherland_viscosity(temperature_K, sutherland, scale):
+    """
+    Helper kernel of aerodynamics.sutherland_law_viscosity,
+    sqrt(T^3 / (T + S)^2)
+    """
+    ratio = temperature_K / (temperature_K + sutherland)
+    return math.sqrt(ratio * ratio * temperature_K) * scale
+
+
+def _sutherland_conductivity(temperature_K, sutherland, ratio_ref, scale):
+    """
+    Helper kernel of aerodynamics.sutherland_law_conductivity,
+    (T / (T + S) (T_ref + S) / T_ref)^(3/2)
+    """
+    ratio = temperature_K / (temperature_K + sutherland) * ratio_ref
+    return ratio**1.5 * scale
+
+
+def _ecef_to_lla(ecef_x, ecef_y, ecef_z, constants, latitude, longitude, altitude):
+    """
+    Helper kernel of coordinates.ecef_to_lla, constants are the semi-major
+    radius, eccentricity^2 and a_1 to a_6
+    """
+    radius_a = constants[0]
+    eccentricity_2 = constants[1]
+    a_1 = constants[2]
+    a_2 = constants[3]
+    a_3 = constants[4]
+    a_4 = constants[5]
+    a_5 = constants[6]
+    a_6 = constants[7]
+    radius = math.sqrt(ecef_x**2 + ecef_y**2 + ecef_z**2)
+    u = a_2 / radius
+    v = a_3 - (a_4 / radius)
+    s_2 = (ecef_z / radius) ** 2
+    c_2 = (ecef_x**2 + ecef_y**2) / radius**2
+    if c_2 > 0.3:
+        s = (abs(ecef_z) / radius) * (1.0 + c_2 * (a_1 + u + s_2 * v) / radius)
+        latitude_rad = math.asin(s)
+        c = math.sqrt(1.0 - s**2)
+    else:
+        c = math.sqrt(c_2) * (1 - s_2 * (a_5 - u - c_2 * v) / radius)
+        latitude_rad = math.acos(c)
+        s = math.sqrt(1.0 - c**2)
+
+    g = 1.0 - eccentricity_2 * s**2
+    rg = radius_a / math.sqrt(g)
+    rf = a_6 * rg
+    u = math.sqrt(c_2) * radius - (rg * c)
+    v = abs(ecef_z) - (rf * s)
+    f = (c * u) + (s * v)
+    m = (c * v) - (s * u)
+    p = m / (rf / g + f)
+    latitude[0] = math.degrees(latitude_rad + p) * (-1.0 if ecef_z < 0 else 1.0)
+    longitude[0] = math.degrees(math.atan2(ecef_y, ecef_x))
+    altitude[0] = f + (0.5 * m * p)
+
+
+# Kernels, signature and layout (None for elementwise ufuncs)
+_KERNELS = {
+    "buldakov_polarizability": (
+        _buldakov_polarizability,
+        "f8(f8, f8, f8, f8, f8, f8, f8)",
+        None,
+    ),
+    "kerl_polarizability": (_kerl_polarizability, "f8(f8, f8, f8, f8)", None),
+    "dense_refractivity": (_dense_refractivity, "f8(f8)", None),
+    "sutherland_viscosity": (_sutherland_viscosity, "f8(f8, f8, f8)", None),
+    "sutherland_conductivity": (
+        _sutherland_conductivity,
+        "f8(f8, f8, f8, f8)",
+        None,
+    ),
+    "ecef_to_lla": (
+        _ecef_to_lla,
+        "void(f8, f8, f8, f8[:], f8[:], f8[:], f8[:])",
+        "(),(),(),(n)->(),(),()",
+    ),
+}
@@ -0,0 +1,246 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   openfoam.py
+Def:    Contains a lightweight reader for OpenFOAM field files.
+"""
+
+import gzip
+import mmap
+import os
+import re
+import numpy as np
+from haot.instrumentation import instrument_module
+
+# Header entries and internalField declarations
+_FORMAT = re.compile(rb"\bformat\s+(ascii|binary)\s*;")
+_ARCH = re.compile(rb"\barch\s+\"([^\"]*)\"\s*;")
+_CLASS = re.compile(rb"\bclass\s+(\w+)\s*;")
+_UNIFORM = re.compile(rb"internalField\s+uniform\s+([^;]+);")
+_NONUNIFORM = re.compile(
+    rb"internalField\s+nonuniform\s+List<(scalar|vector)>\s*(\d+)\s*\("
+)
+_LIST_END = re.compile(rb"\)\s*;")
+_N_CELLS = re.compile(rb"nCells:\s*(\d+)")
+
+
+def read_openfoam_field(path: str, n_cells: int = None) -> np.ndarray:
+    """
+    Reads the internal field of an OpenFOAM volScalarField or volVectorField
+    file. Binary payloads are memory-mapped (no copies, nothing is read
+    until used), ASCII payloads are parsed into a new array
+
+    Parameters:
+        path: path of the field file, ex. 'case/0.001/T'. Gzip compressed
+            files (.gz) are decompressed in memory
+        n_cells: number of cells, only used by uniform fields, None (default)
+            returns uniform fields as a scalar or a [3] array
+
+    Returns:
+        internal field of shape [n_cells] (scalar) or [n_cells, 3] (vector),
+        read-only if memory-mapped
+
+    Examples:
+        >> temperature = read_openfoam_field('case/0.001/T')
+
+        >> index = index_of_refraction_density_temperature(temperature, rho)
+    """
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as file:
+            return _parse_field(file.read(), path, n_cells, None)
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"'{path}' is empty!")
+        with data:
+            return _parse_field(data, path, n_cells, path)
+
+
+def _parse_field(data, path: str, n_cells: int, memmap_path: str) -> np.ndarray:
+    """
+    Helper function that parses the internal field of an OpenFOAM field
+    file, binary payloads are memory-mapped from memmap_path when provided
+    """
+    header_end = data.find(b"internalField")
+    if header_end < 0 or data.find(b"FoamFile", 0, header_end) < 0:
+        raise ValueError(f"'{path}' is not an OpenFOAM field file!")
+    header = data[:header_end]
+    field_class = _CLASS.search(header)
+    if field_class and field_class.group(1) not in (
+        b"volScalarField",
+        b"volVectorField",
+    ):
+        raise ValueError("Only volScalarField and volVectorField are supported!")
+
+    # Only the declaration is searched, not the payload
+    declaration = data[header_end : header_end + 256]
+    uniform = _UNIFORM.match(declaration)
+    if uniform:
+        value = np.array(uniform.group(1).strip(b"() \t\n").split(), dtype=float)
+        value = value[0] if value.size == 1 else value
+        if n_cells is None:
+            return value
+        return np.full((n_cells,) + np.shape(value), value)
+
+    nonuniform = _NONUNIFORM.match(declaration)
+    if not nonuniform:
+        raise ValueError(f"Unable to parse the internalField of '{path}'!")
+    components = 3 if nonuniform.group(1) == b"vector" else 1
+    count = int(nonuniform.group(2))
+    offset = header_end + nonuniform.end()
+    shape = (count, components) if components > 1 else (count,)
+
+    file_format = _FORMAT.search(header)
+    if file_format and file_format.group(1) == b"binary":
+        arch = _ARCH.search(header)
+        arch = arch.group(1) if arch else b"LSB;label=32;scalar=64"
+        byte_order = ">" if b"MSB" in arch else "<"
+        scalar_size = re.search(rb"scalar=(\d+)", arch)
+        scalar_size = int(scalar_size.group(1)) // 8 if scalar_size else 8
+        dtype = np.dtype(f"{byte_order}f{scalar_size}")
+        if offset + count * components * dtype.itemsize > len(data):
+            raise ValueError(f"'{path}' is truncated!")
+        if memmap_path is None:
+            return np.frombuffer(data, dtype, count * components, offset).reshape(shape)
+        return np.memmap(memmap_path, dtype, "r", offset, shape)
+
+    # ASCII payload, vectors are written as (x y z)
+    payload_end = _LIST_END.search(data, offset)
+    if not payload_end:
+        raise ValueError(f"'{path}' is truncated!")
+    payload = data[offset : payload_end.start()]
+    if components > 1:
+        payload = payload.replace(b"(", b" ").replace(b")", b" ")
+    values = np.fromstring(payload.decode("ascii"), dtype=float, sep=" ")
+    if values.size != count * components:
+        raise ValueError(f"'{path}' is truncated!")
+    return values.reshape(shape)
+
+
+class OpenFoamCase:
+    """
+    OpenFOAM case directory. Time directories and fields are listed on
+    demand and fields are read lazily with read_openfoam_field, so only the
+    selected fields of the selected times are touched
+
+    Parameters:
+        case_dir: case directory, contains the time directories and
+            constant/polyMesh
+
+    Examples:
+        >> case = OpenFoamCase('results')
+
+        >> temperature = case.read('T')
+
+        >> for time, rho in case.series('rho', case.times[-10:]):
+        >>     ...
+    """
+
+    def __init__(self, case_dir: str):
+        if not os.path.isdir(case_dir):
+            raise ValueError(f"'{case_dir}' is not a directory!")
+        self.case_dir = case_dir
+        self._n_cells = None
+
+    @property
+    def times(self) -> list[str]:
+        """
+        Time directories sorted by time
+        """
+        times = []
+        for name in os.listdir(self.case_dir):
+            try:
+                times.append((float(name), name))
+            except ValueError:
+                continue
+        return [name for _, name in sorted(times)]
+
+    @property
+    def n_cells(self) -> int:
+        """
+        Number of cells of the mesh, read from the constant/polyMesh/owner
+        header, None if the mesh is not available
+        """
+        if self._n_cells is None:
+            owner = os.path.join(self.case_dir, "constant", "polyMesh", "owner")
+            if os.path.exists(owner):
+                with open(owner, "rb") as file:
+                    header = file.read(4096)
+            elif os.path.exists(owner + ".gz"):
+                with gzip.open(owner + ".gz", "rb") as file:
+                    header = file.read(4096)
+            else:
+                return None
+            n_cells = _N_CELLS.search(header)
+            if n_cells:
+                self._n_cells = int(n_cells.group(1))
+        return self._n_cells
+
+    def fields(self, time: str = None) -> list[str]:
+        """
+        Fields of a time directory
+
+        Parameters:
+            time: time directory, None (default) is the latest time
+
+        Returns:
+            field names, ex. ['T', 'U', 'p', 'rho']
+        """
+        time_dir = self._time_dir(time)
+        fields = []
+        for name in sorted(os.listdir(time_dir)):
+            if os.path.isfile(os.path.join(time_dir, name)):
+                fields.append(name[:-3] if name.endswith(".gz") else name)
+        return fields
+
+    def read(self, field: str, time: str = None) -> np.ndarray:
+        """
+        Reads the internal field of a time directory, uniform fields are
+        expanded to the number of cells of the mesh when available
+
+        Parameters:
+            field: field name, ex. 'T'
+            time: time directory, None (default) is the latest time
+
+        Returns:
+            internal field of shape [n_cells] or [n_cells, 3]
+        """
+        path = os.path.join(self._time_dir(time), field)
+        if not os.path.exists(path) and os.path.exists(path + ".gz"):
+            path += ".gz"
+        if not os.path.exists(path):
+            raise ValueError(f"Field '{field}' not found at time {time}!")
+        return read_openfoam_field(path, self.n_cells)
+
+    def series(self, field: str, times: list[str] = None):
+        """
+        Generator of a field over time directories, one field is read at a
+        time
+
+        Parameters:
+            field: field name, ex. 'T'
+            times: time directories, None (default) uses all times
+
+        Returns:
+            generator of (time, internal field) tuples
+        """
+        for time in self.times if times is None else times:
+            yield time, self.read(field, time)
+
+    def _time_dir(self, time: str) -> str:
+        """
+        Helper method that returns the path of a time directory
+        """
+        if time is None:
+            times = self.times
+            if not times:
+                raise ValueError("The case does not have time directories!")
+            time = times[-1]
+        time_dir = os.path.join(self.case_dir, str(time))
+        if not os.path.isdir(time_dir):
+            raise ValueError(f"Time directory '{time}' not found!")
+        return time_dir
+
+
+instrument_module(globals())
@@ -5,46 +5,84 @@ File:   optics.py
 Def:    Contains aero optics functions.
 """
 
-from ambiance import Atmosphere
-import molmass
+import functools
+from types import MappingProxyType
 import numpy as np
 import scipy.constants as s_consts
 from haot import constants as constants_tables
 from haot import quantum_mechanics as quantum
 from haot import conversions
-
-
+from haot import species as species_registry
+from haot import precision
+from haot import kernels
+from haot.workspace import Workspace, work_buffer
+from haot.streaming import chunked_frames, grouped_frames, welford_frames
+from haot.parallel import chunked_elementwise
+from haot.instrumentation import instrument_module
+from haot.validation import (
+    check_nonnegative,
+    check_positive,
+    check_range,
+    check_species,
+)
+
+# Earth radius used by the standard atmosphere geopotential altitude [m]
+_EARTH_RADIUS_M = 6356766.0
+# Species with Buldakov polarizability derivatives
+_BULDAKOV_SPECIES = frozenset({"H2", "N2", "O2"})
+
+
+@chunked_elementwise("temperature_K", "mass_density")
 def index_of_refraction_density_temperature(
     temperature_K: float,
     mass_density: float,
     molecule: str = "Air",
     wavelength_nm: float = 633.0,
+    *,
+    refractivity: bool = False,
 ) -> dict[str, float]:
     """
     Calculates dilute and dense index of refraction as a
     function of mass density and temperature.
-    Uses Kerl approximation for polarizability
+    Uses Kerl approximation for polarizability. Follows haot.get_precision(),
+    in float32 mode use refractivity=True to keep the significant digits
 
     Parameters:
         temperature_K: reference temperature in [K]
         mass_density: mass density in [kg/m^3]
-        molecule: H2, N2, O2, Air(default)
-        wavelength_nm: signal's wavelength in [nm], 633(default) [nm]
+        molecule: H2, N2, O2, Air(default), or a registered species with Kerl
+            constants
+        wavelength_nm: signal's wavelength in [nm], 633(default) [nm], or an
+            array of wavelengths evaluated in one broadcast pass
+        refractivity: returns the refractivity n - 1 instead of the index of
+            refraction, False (default)
 
     Returns:
         dict: A dictionary containing
             - dilute: dilute index of refraction
             - dense: dense index of refraction
+        with a leading [n_wavelengths] axis if wavelength_nm is an array
+
+    Examples:
+        >> index_of_refraction_density_temperature(T, rho, 'Air', [355, 532, 1064])
+
+        >> with precision_policy(np.float32):
+        >>     index_of_refraction_density_temperature(T, rho, refractivity=True)
     """
     # Checks
-    if molecule not in ["Air", "H2", "N2", "O2"]:
-        raise ValueError("This function only supports Air, H2, N2 or O2")
-    if type(temperature_K) is float and temperature_K < 0:
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if type(temperature_K) is np.ndarray and (temperature_K < 0).any():
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if wavelength_nm <= 0:
-        raise ValueError("Wavelength must be greater than 0 nanometers!")
+    _kerl_constants(molecule)  # supported species
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    check_positive(wavelength_nm, "Wavelength must be greater than 0 nanometers!")
+    dtype = precision.get_precision()
+    if np.ndim(wavelength_nm) > 0:
+        return _index_of_refraction_wavelengths(
+            temperature_K, mass_density, molecule, wavelength_nm, dtype, refractivity
+        )
+    if refractivity or dtype != np.float64:
+        n_return = _index_of_refraction_wavelengths(
+            temperature_K, mass_density, molecule, [wavelength_nm], dtype, refractivity
+        )
+        return {key: val[0] for key, val in n_return.items()}
     # Calculates polarizability using Kerl
     pol_kerl_air_m3 = kerl_polarizability_temperature(
         temperature_K, "Air", wavelength_nm
@@ -52,11 +90,7 @@ def index_of_refraction_density_temperature(
     pol_kerl_SI = conversions.polarizability_cgs_to_si(pol_kerl_air_m3 * 1e6)
 
     if molecule == "Air":
-        molar_mass_air = (
-            0.78 * molmass.Formula("N2").mass
-            + 0.21 * molmass.Formula("O2").mass
-            + 0.01 * molmass.Formula("Ar").mass
-        )
+        molar_mass_air = species_registry.air_molar_mass()
         molar_density = mass_density * s_consts.N_A / molar_mass_air * 1e3
     else:
         molar_density = conversions.mass_density_to_molar_density(
@@ -71,6 +105,47 @@ def index_of_refraction_density_temperature(
     return n_return
 
 
+def _index_of_refraction_wavelengths(
+    temperature_K: np.ndarray,
+    mass_density: np.ndarray,
+    molecule: str,
+    wavelengths_nm: list[float],
+    dtype: np.dtype = np.float64,
+    refractivity: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Helper function of index_of_refraction_density_temperature for an array
+    of wavelengths, the temperature polynomial is shared across wavelengths
+    and the [n_wavelengths, ...] results are computed in place
+    """
+    # Kerl polarizability [n_wavelengths, ...] in [m^3]
+    field_shape = np.broadcast_shapes(np.shape(temperature_K), np.shape(mass_density))
+    dilute = np.empty((np.size(wavelengths_nm),) + field_shape, dtype=dtype)
+    kerl_polarizability_wavelengths(
+        np.broadcast_to(temperature_K, field_shape), "Air", wavelengths_nm, out=dilute
+    )
+
+    if molecule == "Air":
+        molar_mass = species_registry.air_molar_mass()
+    else:
+        molar_mass = species_registry.species_molar_mass(molecule)
+    molar_density = np.multiply(
+        mass_density, s_consts.N_A / molar_mass * 1e3, dtype=dtype
+    )
+
+    # Dilute refractivity, a_i N_i / (2 e_0)
+    dilute *= conversions.polarizability_cgs_to_si(1e6) / (2 * s_consts.epsilon_0)
+    dilute *= molar_density
+    dense = np.empty_like(dilute)
+    _dilute_dense_index(dilute, dense, refractivity)
+
+    n_return = {}
+    n_return["dilute"] = dilute
+    n_return["dense"] = dense
+
+    return n_return
+
+
 def index_of_refraction(mass_density_dict: dict[str, float]) -> dict[str, float]:
     """
     Calculates dilute and dense index of refraction as a
@@ -118,12 +193,185 @@ def index_of_refraction(mass_density_dict: dict[str, float]) -> dict[str, float]
     return n_return
 
 
-def permittivity_material(index_of_refraction: float) -> float:
+def index_of_refraction_field(
+    mass_density: np.ndarray,
+    species: list[str] = None,
+    out: dict[str, np.ndarray] = None,
+    refractivity: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Calculates dilute and dense index of refraction over species mass density
+    fields. Vectorized version of index_of_refraction, the species
+    polarizability, Avogadro's number and molar mass are folded into one
+    cached coefficient per species
+
+    Parameters:
+        mass_density: species mass densities in [kg/m^3], either a dictionary
+            of equal shape arrays or an array of shape [n_species, n_cells]
+        species: species names of each row of mass_density, required when
+            mass_density is an array. Ex [N2, O2, O, N, NO]
+        out: dictionary with dilute and/or dense arrays to store the
+            results in, None (default)
+        refractivity: returns the refractivity n - 1 instead of the index of
+            refraction, False (default)
+
+    Returns:
+        dict: A dictionary containing
+            - dilute: dilute index of refraction
+            - dense: dense index of refraction
+
+    Examples:
+        >> index_of_refraction_field({"N2": rho_n2, "O2": rho_o2})
+
+        >> index_of_refraction_field(rho, ["N2", "O2", "NO"], out=buffers)
+    """
+    species, mass_density = _species_field(mass_density, species)
+    # Sum (a_i N_i) / (2 e_0), per unit of mass density
+    coefficients = _molar_polarizability_coefficients(species)
+    coefficients = coefficients / (2 * s_consts.epsilon_0)
+
+    # Output buffers
+    if out is None:
+        out = {}
+    field_shape = np.shape(mass_density[0])
+    dilute = _field_buffer(out.get("dilute"), field_shape)
+    dense = _field_buffer(out.get("dense"), field_shape)
+
+    # Dilute refractivity, n_dilute - 1 (dense is used as scratch)
+    if isinstance(mass_density, np.ndarray):
+        np.dot(
+            coefficients,
+            mass_density.reshape(len(species), -1),
+            out=dilute.reshape(-1),
+        )
+    else:
+        np.multiply(mass_density[0], coefficients[0], out=dilute)
+        for i in range(1, len(species)):
+            np.multiply(mass_density[i], coefficients[i], out=dense)
+            dilute += dense
+
+    _dilute_dense_index(dilute, dense, refractivity)
+
+    n_return = {}
+    n_return["dilute"] = dilute if field_shape else dilute[()]
+    n_return["dense"] = dense if field_shape else dense[()]
+
+    return n_return
+
+
+def _dilute_dense_index(
+    dilute: np.ndarray, dense: np.ndarray, refractivity: bool = False
+):
+    """
+    Helper function that computes the dilute and dense index of refraction in
+    place, dilute holds the dilute refractivity x = n_dilute - 1 on entry.
+    With refractivity, both are left as n - 1
+    """
+    kernel = kernels.compiled_kernel("dense_refractivity", dense.dtype)
+    if kernel is not None:
+        kernel(dilute, out=dense)
+    else:
+        # Lorentz-Lorenz, n_dense^2 - 1 = 6 x / (3 - 2 x)
+        np.multiply(dilute, -2.0, out=dense)
+        dense += 3.0
+        np.divide(dilute, dense, out=dense)
+        dense *= 6.0
+        # n_dense - 1 = exp(log(n_dense^2) / 2) - 1, without cancellation
+        np.log1p(dense, out=dense)
+        dense *= 0.5
+        np.expm1(dense, out=dense)
+    if not refractivity:
+        dense += 1.0
+        dilute += 1.0
+
+
+def _species_field(
+    mass_density: np.ndarray, species: list[str] = None
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """
+    Helper function to validate species mass density fields, returns the
+    species names and the densities as an array or a list of arrays
+    """
+    if isinstance(mass_density, dict):
+        species = tuple(mass_density.keys())
+        mass_density = [np.asarray(val, dtype=float) for val in mass_density.values()]
+        if len({np.shape(val) for val in mass_density}) > 1:
+            raise ValueError("Mass density arrays must have the same shape!")
+    elif isinstance(mass_density, np.ndarray):
+        if species is None or len(species) != mass_density.shape[0]:
+            raise ValueError(
+                "Species names must be provided for each row of the mass density!"
+            )
+        species = tuple(species)
+        mass_density = np.ascontiguousarray(mass_density, dtype=float)
+    else:
+        raise ValueError("Mass density should be a dictionary or a numpy array!")
+    if not species:
+        raise ValueError("Mass density should contain at least one species!")
+    for key in species:
+        try:
+            polarizability = species_registry.species_properties(key)["polarizability"]
+        except ValueError:
+            polarizability = None
+        if polarizability is None:
+            raise ValueError(
+                f"Invalid key '{key}'. Keys should be named: N2, O2, O, N, NO"
+            )
+
+    return species, mass_density
+
+
+def _field_buffer(buffer: np.ndarray, field_shape: tuple[int, ...]) -> np.ndarray:
+    """
+    Helper function to validate an out= buffer, or allocates a new one
+    """
+    if buffer is None:
+        return np.empty(field_shape)
+    if (
+        not isinstance(buffer, np.ndarray)
+        or buffer.shape != field_shape
+        or buffer.dtype != np.float64
+        or not buffer.flags.c_contiguous
+    ):
+        raise ValueError(
+            "Output buffers must be C-contiguous float64 arrays of the field shape"
+        )
+    return buffer
+
+
+@species_registry.species_cache
+def _molar_polarizability_coefficients(species: tuple[str, ...]) -> np.ndarray:
+    """
+    Helper function that caches a_i * N_A / M_i for each species in
+    [Fm^2 m^3/kg]
+    """
+    properties = [species_registry.species_properties(key) for key in species]
+    coefficients = np.array(
+        [
+            conversions.polarizability_cgs_to_si(prop["polarizability"])
+            * s_consts.N_A
+            / prop["molar_mass"]
+            * 1e3
+            for prop in properties
+        ]
+    )
+    coefficients.flags.writeable = False
+
+    return coefficients
+
+
+@chunked_elementwise("index_of_refraction")
+def permittivity_material(
+    index_of_refraction: float, out: np.ndarray = None, workspace: Workspace = None
+) -> float:
     """
     Calculates the permittivity of the material for a linear dielectric.
 
     Parameters:
         index_of_refraction: index of refraction
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         material's permittivity in [F/m]
@@ -149,15 +397,31 @@ def permittivity_material(index_of_refraction: float) -> float:
         raise ValueError("Index of must be greater than 0!")
 
     # n ~ sqrt(e_r), Eq. 4.33
-    return s_consts.epsilon_0 * index_of_refraction**2
+    permittivity = work_buffer(
+        "permittivity_material",
+        np.shape(index_of_refraction),
+        np.result_type(index_of_refraction, 1.0),
+        out,
+        workspace,
+    )
+    np.square(index_of_refraction, out=permittivity)
+    permittivity *= s_consts.epsilon_0
+
+    return permittivity if permittivity.ndim else permittivity[()]  # [F/m]
 
 
-def electric_susceptibility(index_of_refraction: float) -> float:
+@chunked_elementwise("index_of_refraction")
+def electric_susceptibility(
+    index_of_refraction: float, out: np.ndarray = None, workspace: Workspace = None
+) -> float:
     """
     Calculates the electric susceptibility for a linear dielectric.
 
     Parameters:
         index_of_refraction: index of refraction
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         electric susceptibility in [ ]
@@ -177,12 +441,21 @@ def electric_susceptibility(index_of_refraction: float) -> float:
         raise ValueError(
             "Index of refraction must be a numpy.ndarray, float or integer"
         )
-    if type(index_of_refraction) is float and index_of_refraction < 0:
-        raise ValueError("Index of refraction must be greater than 0!")
-    if type(index_of_refraction) is np.ndarray and (index_of_refraction < 0).any():
-        raise ValueError("Index of must be greater than 0!")
+    check_nonnegative(
+        index_of_refraction, "Index of refraction must be greater than 0!"
+    )
     # Eq 4.34
-    return index_of_refraction**2 - 1
+    susceptibility = work_buffer(
+        "electric_susceptibility",
+        np.shape(index_of_refraction),
+        np.result_type(index_of_refraction, 1.0),
+        out,
+        workspace,
+    )
+    np.square(index_of_refraction, out=susceptibility)
+    susceptibility -= 1
+
+    return susceptibility if susceptibility.ndim else susceptibility[()]
 
 
 def optical_path_length(index_of_refraction: float, distance: float) -> float:
@@ -205,14 +478,10 @@ def optical_path_length(index_of_refraction: float, distance: float) -> float:
         raise ValueError(
             "Index of refraction must be a numpy.ndarray, float or integer"
         )
-    if type(index_of_refraction) is float and index_of_refraction < 0:
-        raise ValueError("Index of refraction must be greater than 0!")
-    if type(index_of_refraction) is np.ndarray and (index_of_refraction < 0).any():
-        raise ValueError("Index of must be greater than 0!")
-    if type(distance) is float and distance < 0:
-        raise ValueError("Distance must be greater than 0!")
-    if type(distance) is np.ndarray and (distance < 0).any():
-        raise ValueError("Distance of must be greater than 0!")
+    check_nonnegative(
+        index_of_refraction, "Index of refraction must be greater than 0!"
+    )
+    check_nonnegative(distance, "Distance must be greater than 0!")
     if np.shape(index_of_refraction) != np.shape(distance):
         raise ValueError("Index of refraction and distance must have the same length")
     index_avg = 0.5 * (index_of_refraction[:-1] + index_of_refraction[1:])
@@ -236,9 +505,11 @@ def optical_path_difference_rms(opd: float, avg_ax: int = 0) -> float:
 
     if avg_ax not in [0, 1, 2, 3]:
         raise ValueError("avg_ax must be one of [0, 1, 2, 3]")
-    return np.sqrt(np.mean((opd - np.mean(opd, axis=avg_ax, keepdims=True)) ** 2))
+    mean = np.mean(opd, axis=avg_ax, keepdims=True, dtype=np.float64)
+    return np.sqrt(np.mean((opd - mean) ** 2))
 
 
+@chunked_elementwise("opd_rms", "wavelength_nm")
 def phase_variance(opd_rms: float, wavelength_nm: float) -> float:
     """
     Calculates phase variance.
@@ -253,6 +524,7 @@ def phase_variance(opd_rms: float, wavelength_nm: float) -> float:
     return (2 * np.pi * opd_rms / (wavelength_nm * 1e-9)) ** 2
 
 
+@chunked_elementwise("phase_variance")
 def strehl_ratio(phase_variance: float) -> float:
     """
     Calculates the Strehl ratio.
@@ -269,7 +541,8 @@ def strehl_ratio(phase_variance: float) -> float:
 
 def optical_path_difference(opl: np.array, avg_ax: int = 0) -> float:
     """
-    Calculates the optical path difference.
+    Calculates the optical path difference. Follows haot.get_precision(),
+    the mean and the difference are always computed in float64
 
     Parameters:
         opl: has to be a numpy array of shape [time, x_axis, y_axis, z_axis]
@@ -283,7 +556,103 @@ def optical_path_difference(opl: np.array, avg_ax: int = 0) -> float:
 
     if avg_ax not in [0, 1, 2, 3]:
         raise ValueError("avg_ax must be one of [0, 1, 2, 3]")
-    return opl - np.mean(opl, axis=avg_ax, keepdims=True)
+    mean = np.mean(opl, axis=avg_ax, keepdims=True, dtype=np.float64)
+    opd = np.empty(opl.shape, dtype=precision.get_precision())
+    return np.subtract(opl, mean, out=opd, dtype=np.float64, casting="same_kind")
+
+
+def optical_path_difference_streaming(
+    opl: np.ndarray, avg_ax: int = 0, out: np.ndarray = None, chunk_size: int = 16
+) -> np.ndarray:
+    """
+    Calculates the optical path difference out-of-core. Works like
+    optical_path_difference, but reads opl (ex. a numpy.memmap) in chunks
+    of chunk_size entries along the first axis, and writes into out
+
+    Parameters:
+        opl: numpy array of shape [time, x_axis, y_axis, z_axis]
+        avg_ax: axis where average is performed, 0 (default)
+        out: array where the optical path difference is stored, ex. a
+            numpy.memmap, None (default) allocates it in memory following
+            haot.get_precision()
+        chunk_size: entries of the first axis read at once, 16 (default)
+
+    Returns:
+        numpy array of the same shape as the optical path length
+
+    Examples:
+        >> opl = np.load('opl.npy', mmap_mode='r')
+
+        >> opd = np.lib.format.open_memmap('opd.npy', 'w+', float, opl.shape)
+
+        >> optical_path_difference_streaming(opl, out=opd)
+    """
+    if not isinstance(opl, np.ndarray):
+        raise ValueError("opl must be a numpy array")
+    if avg_ax not in [0, 1, 2, 3]:
+        raise ValueError("avg_ax must be one of [0, 1, 2, 3]")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than 0!")
+    if out is None:
+        out = np.empty(opl.shape, dtype=precision.get_precision())
+    if out.shape != opl.shape:
+        raise ValueError("out must have the same shape as opl")
+
+    if avg_ax == 0:
+        _, mean, _ = welford_frames(chunked_frames(opl, chunk_size))
+    for i in range(0, opl.shape[0], chunk_size):
+        chunk = opl[i : i + chunk_size]
+        if avg_ax != 0:
+            mean = np.mean(chunk, axis=avg_ax, keepdims=True, dtype=np.float64)
+        np.subtract(chunk, mean, out=out[i : i + chunk_size], casting="unsafe")
+
+    return out
+
+
+def optical_path_difference_rms_streaming(
+    opd: np.ndarray, avg_ax: int = 0, chunk_size: int = 16
+) -> float:
+    """
+    Calculates the optical path difference RMS out-of-core. Works like
+    optical_path_difference_rms, but reads opd (ex. a numpy.memmap or an
+    iterator of frames) in chunks of chunk_size entries along the first
+    axis, using Welford's online accumulation with float64 accumulators
+
+    Parameters:
+        opd: Optical Path Difference, numpy array of shape
+            [time, x_axis, y_axis, z_axis] or an iterable of [x_axis, y_axis,
+            z_axis] frames
+        avg_ax: axis where average is performed, 0 (default). Iterables only
+            support 0
+        chunk_size: entries of the first axis read at once, 16 (default)
+
+    Returns
+        Optical Path Difference Root-Mean-Squared
+
+    Examples:
+        >> optical_path_difference_rms_streaming(np.load('opd.npy', mmap_mode='r'))
+
+        >> optical_path_difference_rms_streaming(frame_generator(), chunk_size=32)
+    """
+    if avg_ax not in [0, 1, 2, 3]:
+        raise ValueError("avg_ax must be one of [0, 1, 2, 3]")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than 0!")
+
+    if not isinstance(opd, np.ndarray):
+        if avg_ax != 0:
+            raise ValueError("Iterables of frames only support avg_ax = 0")
+        count, _, sum_squares = welford_frames(grouped_frames(opd, chunk_size))
+        return np.sqrt(sum_squares.sum() / (count * sum_squares.size))
+    if avg_ax == 0:
+        _, _, sum_squares = welford_frames(chunked_frames(opd, chunk_size))
+        return np.sqrt(sum_squares.sum() / opd.size)
+
+    # Average along an inner axis, chunks are independent
+    sum_squares = 0.0
+    for chunk in chunked_frames(opd, chunk_size):
+        sum_squares += np.var(chunk, axis=avg_ax, dtype=np.float64).sum()
+    return np.sqrt(sum_squares * opd.shape[avg_ax] / opd.size)
 
 
 def tropina_aproximation(vibrational_number, rotational_number, molecule):
@@ -296,10 +665,11 @@ def tropina_aproximation(vibrational_number, rotational_number, molecule):
 
 
 def buldakov_expansion(
-    vibrational_number: int, rotational_number: int, molecule: str
-) -> float:
+    vibrational_number: np.ndarray, rotational_number: np.ndarray, molecule: str
+) -> np.ndarray:
     """
-    Calculates the Buldakov expansion
+    Calculates the Buldakov expansion. Quantum numbers broadcast against
+    each other, so a whole (v, J) grid is evaluated at once
 
     Parameters:
         vibrational_number: vibrational quantum number (has to be positive)
@@ -312,99 +682,280 @@ def buldakov_expansion(
     Reference:
         Temperature Dependence of Polarizability of Diatomic Homonuclear
         Molecules (https://doi.org/10.1134/BF03355985)
+
+    Examples:
+        >> buldakov_expansion(0, 0, 'N2')
+
+        >> buldakov_expansion(np.arange(5)[:, None], np.arange(50), 'N2')
+    """
+    coefficients = _buldakov_coefficients(molecule)
+    kernel = kernels.compiled_kernel("buldakov_polarizability")
+    if kernel is not None:
+        return kernel(vibrational_number, rotational_number, *coefficients)
+    rotational_degeneracy = np.multiply(rotational_number, rotational_number + 1)
+    vibrational_degeneracy = np.multiply(vibrational_number, 2) + 1
+
+    # a + b g + c r + d g^2 + e g r, g = 2 v + 1 and r = J (J + 1)
+    polarizability = coefficients[4] * rotational_degeneracy
+    polarizability = polarizability + coefficients[3] * vibrational_degeneracy
+    polarizability += coefficients[1]
+    polarizability *= vibrational_degeneracy
+    polarizability += coefficients[2] * rotational_degeneracy
+    polarizability += coefficients[0]
+
+    return polarizability  # [m^3]
+
+
+@species_registry.species_cache
+def _buldakov_coefficients(molecule: str) -> tuple[float, ...]:
     """
+    Helper function that caches the Buldakov expansion as a polynomial in
+    g = 2 v + 1 and r = J (J + 1), returns the coefficients of
+    [1, g, r, g^2, g r]
+    """
+    check_species(
+        molecule, _BULDAKOV_SPECIES, "This function only supports H2, N2 or O2"
+    )
     # Load constants
-    spectroscopy_const = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_const = species_registry.species_properties(molecule)["spectroscopy"]
     derivative_const = constants_tables.buldakov_polarizability_derivatives_2016(
         molecule
     )
     be_we = spectroscopy_const["B_e"] / spectroscopy_const["omega_e"]
 
     # Dunham potential energy constants
-    (a_0, a_1, a_2) = quantum.potential_dunham_coef_012(molecule)
+    a_0, a_1, a_2 = quantum.potential_dunham_coef_012(molecule)
     a_3 = quantum.potential_dunham_coeff_m(a_1, a_2, 3)
 
-    rotational_degeneracy = rotational_number * (rotational_number + 1)
-    vibrational_degeneracy = 2 * vibrational_number + 1
+    # Vibrational terms, (const + slope g^2) pairs
+    first = (-3 / 8 * a_1**3, 1 / 4 * a_2 * a_1, -15 / 4 * a_3)
+    second = (1 / 8 * a_1**2, a_2)
+    third = -1 / 24 * a_1
+    constant = derivative_const["first"] * (7 * first[0] + 23 * first[1] + 5 * first[2])
+    constant += derivative_const["second"] * (7 * second[0] + 5 * second[1])
+    constant += derivative_const["third"] * 7 * third
+    slope = derivative_const["first"] * (15 * first[0] + 39 * first[1] + first[2])
+    slope += derivative_const["second"] * (15 * second[0] + second[1])
+    slope += derivative_const["third"] * 15 * third
+
+    # Vibrational-rotational term
+    interaction = 24 * (1 - a_2) + 27 * a_1 * (1 + a_1)
+    interaction *= derivative_const["first"]
+    interaction -= 3 * (1 + 3 * a_1) * derivative_const["second"]
+    interaction += 1 / 8 * derivative_const["third"]
+
+    return (
+        derivative_const["zeroth"] + constant * be_we**2,
+        (-3 * a_1 * derivative_const["first"] + derivative_const["second"]) * be_we / 2,
+        4 * derivative_const["first"] * be_we**2,
+        slope * be_we**2,
+        interaction * be_we**3,
+    )
+
+
+def buldakov_polarizability_temperature(
+    temperature_K: np.ndarray,
+    molecule: str,
+    vibrational_number: int = 10,
+    rotational_number: int = None,
+    chunk_size: int = 1024,
+) -> np.ndarray:
+    """
+    Calculates the thermally averaged polarizability, sum of the Buldakov
+    expansion over (v, J) levels weighted by their Boltzmann populations.
+    Level energies use the Born-Oppenheimer approximation with a (2 J + 1)
+    rotational degeneracy
+
+    Parameters:
+        temperature_K: reference temperature in [K]
+        molecule: H2, N2, O2
+        vibrational_number: highest vibrational quantum number, 10 (default)
+        rotational_number: highest rotational quantum number, None (default)
+            uses every level below the Born-Oppenheimer rotational turning
+            point, up to 150
+        chunk_size: temperatures averaged at once, 1024 (default)
+
+    Returns:
+        polarizability in [m^3]
+
+    Reference:
+        Temperature Dependence of Polarizability of Diatomic Homonuclear
+        Molecules (https://doi.org/10.1134/BF03355985)
+
+    Examples:
+        >> buldakov_polarizability_temperature(np.linspace(300, 3000, 10), 'N2')
+    """
+    temperature_K = np.asarray(temperature_K, dtype=float)
+    check_positive(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than 0!")
+    energy_K, weights = _buldakov_levels(
+        molecule, vibrational_number, rotational_number
+    )
 
-    # Split in terms
-    tmp_1 = be_we
-    tmp_1 *= -3 * a_1 * derivative_const["first"] + derivative_const["second"]
-    tmp_1 *= vibrational_degeneracy
-    tmp_1 *= 1 / 2
+    # Boltzmann average, [temperature, levels] @ [levels, 2]
+    inverse_temperature = temperature_K.ravel()
+    polarizability = np.empty(inverse_temperature.shape)
+    for i in range(0, inverse_temperature.size, chunk_size):
+        populations = np.multiply.outer(
+            -1 / inverse_temperature[i : i + chunk_size], energy_K
+        )
+        np.exp(populations, out=populations)
+        averages = populations @ weights
+        np.divide(
+            averages[:, 0], averages[:, 1], out=polarizability[i : i + chunk_size]
+        )
 
-    tmp_2 = be_we**2
-    tmp_2 *= derivative_const["first"]
-    tmp_2 *= rotational_degeneracy
-    tmp_2 *= 4
+    return polarizability.reshape(temperature_K.shape)  # [m^3]
 
-    tmp_31a = 7
-    tmp_31a += 15 * vibrational_degeneracy**2
-    tmp_31a *= a_1**3
-    tmp_31a *= -3 / 8
 
-    tmp_31b = 23
-    tmp_31b += 39 * vibrational_degeneracy**2
-    tmp_31b *= a_2
-    tmp_31b *= a_1
-    tmp_31b *= 1 / 4
+def buldakov_polarizability_field(
+    temperature_K: np.ndarray,
+    molecule: str,
+    temperature_step_K: float = 5.0,
+    max_temperature_K: float = 6000.0,
+) -> np.ndarray:
+    """
+    Calculates the thermally averaged polarizability over temperature
+    fields, interpolating a cached buldakov_polarizability_temperature table
+    (one uniform grid lookup per cell)
 
-    tmp_31c = 5
-    tmp_31c += vibrational_degeneracy**2
-    tmp_31c *= a_3
-    tmp_31c *= -15 / 4
+    Parameters:
+        temperature_K: reference temperature in [K], between 0 and
+            max_temperature_K
+        molecule: H2, N2, O2
+        temperature_step_K: temperature step of the cached table in [K], 5.0
+            (default)
+        max_temperature_K: highest temperature of the cached table in [K],
+            6000.0 (default)
 
-    tmp_31 = derivative_const["first"] * (tmp_31a + tmp_31b + tmp_31c)
+    Returns:
+        polarizability in [m^3]
 
-    tmp_32a = 7
-    tmp_32a += 15 * vibrational_degeneracy**2
-    tmp_32a *= a_1**2
-    tmp_32a *= 1 / 8
+    Examples:
+        >> buldakov_polarizability_field(temperature_field, 'N2')
+    """
+    table = buldakov_polarizability_table(
+        molecule, temperature_step_K, max_temperature_K
+    )
+    temperature_K = np.asarray(temperature_K, dtype=float)
+    check_range(
+        temperature_K,
+        0.0,
+        max_temperature_K,
+        f"Temperature must be between 0 and {max_temperature_K} Kelvin!",
+    )
 
-    tmp_32b = 5
-    tmp_32b += vibrational_degeneracy**2
-    tmp_32b *= a_2
-    tmp_32b * --3 / 4
+    # Uniform grid lookup
+    position = temperature_K / temperature_step_K
+    indx = np.minimum(position.astype(np.intp), len(table) - 2)
+    position -= indx
+    polarizability = table[indx]
+    polarizability += position * (table[indx + 1] - polarizability)
 
-    tmp_32 = derivative_const["second"] * (tmp_32a + tmp_32b)
+    return polarizability  # [m^3]
 
-    tmp_33 = 7
-    tmp_33 += 15 * vibrational_degeneracy**2
-    tmp_33 *= a_1
-    tmp_33 *= derivative_const["third"]
-    tmp_33 *= -1 / 24
 
-    tmp_3 = (tmp_31 + tmp_32 + tmp_33) * be_we**2
+@species_registry.species_cache(maxsize=8)
+def buldakov_polarizability_table(
+    molecule: str, temperature_step_K: float = 5.0, max_temperature_K: float = 6000.0
+) -> np.ndarray:
+    """
+    Tabulates buldakov_polarizability_temperature once per molecule, on a
+    uniform temperature grid between 0 and max_temperature_K. At 0 [K] only
+    the ground level is populated
 
-    tmp_41 = 1 - a_2
-    tmp_41 *= 24
-    tmp_41 += 27 * a_1 * (1 + a_1)
-    tmp_41 *= derivative_const["first"]
+    Parameters:
+        molecule: H2, N2, O2
+        temperature_step_K: temperature step in [K], 5.0 (default)
+        max_temperature_K: highest temperature in [K], 6000.0 (default)
+
+    Returns:
+        read-only polarizability table in [m^3], the i-th entry is at
+        i * temperature_step_K
+    """
+    if temperature_step_K <= 0:
+        raise ValueError("Temperature step must be greater than 0!")
+    if max_temperature_K <= temperature_step_K:
+        raise ValueError("Max temperature must be greater than the step!")
+    n_points = int(np.ceil(max_temperature_K / temperature_step_K)) + 1
+    table = np.empty(n_points)
+    table[0] = buldakov_expansion(0, 0, molecule)
+    table[1:] = buldakov_polarizability_temperature(
+        temperature_step_K * np.arange(1, n_points), molecule
+    )
+    table.flags.writeable = False
 
-    tmp_42 = 1 + 3 * a_1
-    tmp_42 *= derivative_const["second"]
-    tmp_42 *= -3
+    return table  # [m^3]
 
-    tmp_43 = 1 / 8 * derivative_const["third"]
 
-    tmp_4 = tmp_41 + tmp_42 + tmp_43
-    tmp_4 *= rotational_degeneracy
-    tmp_4 *= vibrational_degeneracy
-    tmp_4 *= be_we**3
+@species_registry.species_cache
+def _buldakov_levels(
+    molecule: str, vibrational_number: int, rotational_number: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function that caches the (v, J) level energies in [K], relative to
+    the ground level, and the [degeneracy * polarizability, degeneracy]
+    weights of each level
+    """
+    check_species(
+        molecule, _BULDAKOV_SPECIES, "This function only supports H2, N2 or O2"
+    )
+    if not isinstance(vibrational_number, int) or vibrational_number < 0:
+        raise ValueError("Vibrational number should be a positive integer!")
+    max_rotational = 150 if rotational_number is None else rotational_number
+    if not isinstance(max_rotational, int) or max_rotational < 0:
+        raise ValueError("Rotational number should be a positive integer!")
+
+    vibrational, rotational = np.meshgrid(
+        np.arange(vibrational_number + 1), np.arange(max_rotational + 1), indexing="ij"
+    )
+    energy_K = quantum.born_oppenheimer_approximation(vibrational, rotational, molecule)
+    energy_K = conversions.wavenumber_to_joules(energy_K) / s_consts.k
+
+    # Born-Oppenheimer energies turn over at high J, or v
+    rising_J = (np.diff(energy_K, axis=1) > 0).all(axis=0)
+    if rotational_number is None and not rising_J.all():
+        max_rotational = int(np.argmin(rising_J))
+        energy_K = energy_K[:, : max_rotational + 1]
+        vibrational = vibrational[:, : max_rotational + 1]
+        rotational = rotational[:, : max_rotational + 1]
+    elif not rising_J.all():
+        raise ValueError(
+            f"Rotational number exceeds {int(np.argmin(rising_J))} for {molecule}!"
+        )
+    if not (np.diff(energy_K, axis=0) > 0).all():
+        raise ValueError(f"Vibrational number is too large for {molecule}!")
+
+    degeneracy = (2 * rotational + 1).ravel()
+    polarizability = buldakov_expansion(vibrational, rotational, molecule).ravel()
+    energy_K = energy_K.ravel() - energy_K.min()
+    weights = np.c_[degeneracy * polarizability, degeneracy]
+    energy_K.flags.writeable = False
+    weights.flags.writeable = False
 
-    return derivative_const["zeroth"] + tmp_1 + tmp_2 + tmp_3 + tmp_4
+    return energy_K, weights
 
 
+@chunked_elementwise("temperature_K")
 def kerl_polarizability_temperature(
-    temperature_K: float, molecule: str, wavelength_nm: float
+    temperature_K: float,
+    molecule: str,
+    wavelength_nm: float,
+    out: np.ndarray = None,
+    workspace: Workspace = None,
 ) -> float:
     """
-    Calculates the polarizability using Kerl's extrapolation.
+    Calculates the polarizability using Kerl's extrapolation. Follows
+    haot.get_precision()
 
     Parameters:
         temperature_K: reference temperature in [K]
-        molecule: H2, N2, O2, Air
+        molecule: H2, N2, O2, Air, or a registered species with Kerl constants
         wavelength_nm: signal's wavelength in [nm]
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
         polarizability in [m^3]
@@ -417,25 +968,126 @@ def kerl_polarizability_temperature(
         >> kerl_polarizability_temperature(600.0, 'N2', 533.0)
     """
     # Checking cases
-    if type(temperature_K) is float and temperature_K < 0:
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if type(temperature_K) is np.ndarray and (temperature_K < 0).any():
-        raise ValueError("Temperature must be greater than 0 Kelvin!")
-    if wavelength_nm <= 0:
-        raise ValueError("Wavelength must be greater than 0 nanometers!")
-    if molecule not in ["Air", "H2", "N2", "O2"]:
-        raise ValueError("This function only supports Air, H2, N2 or O2")
-    # Check sizes
-    mean_const = constants_tables.kerl_interpolation(molecule)
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    check_positive(wavelength_nm, "Wavelength must be greater than 0 nanometers!")
+    mean_const = _kerl_constants(molecule)
     angular_frequency = 2 * np.pi * s_consts.speed_of_light / (wavelength_nm * 1e-9)
+    if precision.get_precision() != np.float64:
+        temperature_K = np.asarray(temperature_K, dtype=precision.get_precision())
+
+    tmp = work_buffer(
+        "kerl_polarizability_temperature",
+        np.shape(temperature_K),
+        np.result_type(temperature_K, 1.0),
+        out,
+        workspace,
+    )
 
-    tmp = mean_const["c"] * temperature_K**2
-    tmp += mean_const["b"] * temperature_K
-    tmp += 1
-    tmp *= mean_const["groundPolarizability"]
-    tmp /= 1 - (angular_frequency / mean_const["groundFrequency"]) ** 2
+    # a_0 (1 + b T + c T^2) / (1 - (w / w_0)^2)
+    scale = mean_const["groundPolarizability"] / (
+        1 - (angular_frequency / mean_const["groundFrequency"]) ** 2
+    )
+    kernel = kernels.compiled_kernel("kerl_polarizability", tmp.dtype)
+    if kernel is not None:
+        kernel(temperature_K, mean_const["b"], mean_const["c"], scale, out=tmp)
+    else:
+        np.multiply(temperature_K, mean_const["c"], out=tmp)
+        tmp += mean_const["b"]
+        tmp *= temperature_K
+        tmp += 1
+        tmp *= scale
 
-    return tmp  # [m^3]
+    return tmp if tmp.ndim else tmp[()]  # [m^3]
+
+
+def kerl_polarizability_wavelengths(
+    temperature_K: np.ndarray,
+    molecule: str,
+    wavelengths_nm: list[float],
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Calculates the polarizability using Kerl's extrapolation at several
+    wavelengths at once. The Kerl coefficients of each (molecule,
+    wavelengths) set are cached, the temperature polynomial is evaluated once
+    and shared across wavelengths. Kerl's extrapolation is quadratic in
+    temperature, so the cached coefficients are exact (no interpolation error)
+
+    Parameters:
+        temperature_K: reference temperature in [K]
+        molecule: H2, N2, O2, Air, or a registered species with Kerl constants
+        wavelengths_nm: signal's wavelengths in [nm]
+        out: array of shape [n_wavelengths, *temperature_K.shape] to store
+            the results in, None (default)
+
+    Returns:
+        polarizability in [m^3], shape [n_wavelengths, *temperature_K.shape]
+
+    Reference:
+        Polarizability a(w,T,rho) of Small Molecules in the Gas Phase
+        (https://doi.org/10.1002/bbpc.19920960517)
+
+    Examples:
+        >> kerl_polarizability_wavelengths(temperature_field, 'N2', [355.0, 532.0, 1064.0])
+    """
+    # Checking cases
+    check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    wavelengths_nm = tuple(np.atleast_1d(wavelengths_nm).astype(float).tolist())
+    if min(wavelengths_nm) <= 0:
+        raise ValueError("Wavelength must be greater than 0 nanometers!")
+    polynomial, dispersion = _kerl_coefficients(molecule, wavelengths_nm)
+
+    field_shape = np.shape(temperature_K)
+    if out is None:
+        out = np.empty((len(wavelengths_nm),) + field_shape)
+    if out.shape != (len(wavelengths_nm),) + field_shape:
+        raise ValueError("out must have a shape of [n_wavelengths, *temperature shape]")
+
+    # a_0 (1 + b T + c T^2), shared across wavelengths
+    tmp = np.multiply(temperature_K, polynomial[2], dtype=out.dtype)
+    tmp += polynomial[1]
+    tmp *= temperature_K
+    tmp += polynomial[0]
+    for i, val in enumerate(dispersion):
+        np.multiply(tmp, val, out=out[i, ...])
+
+    return out  # [m^3]
+
+
+@species_registry.species_cache
+def _kerl_coefficients(
+    molecule: str, wavelengths_nm: tuple[float, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function that caches Kerl's temperature polynomial coefficients
+    [a_0, a_0 b, a_0 c] and the dispersion factor of each wavelength
+    """
+    mean_const = _kerl_constants(molecule)
+    angular_frequency = (
+        2 * np.pi * s_consts.speed_of_light / (np.array(wavelengths_nm) * 1e-9)
+    )
+    polynomial = mean_const["groundPolarizability"] * np.array(
+        [1.0, mean_const["b"], mean_const["c"]]
+    )
+    dispersion = 1 / (1 - (angular_frequency / mean_const["groundFrequency"]) ** 2)
+    polynomial.flags.writeable = False
+    dispersion.flags.writeable = False
+
+    return polynomial, dispersion
+
+
+def _kerl_constants(molecule: str) -> dict[str, float]:
+    """
+    Helper function that returns Kerl's extrapolation constants of a species
+    from the species registry, so registered overrides are used
+    """
+    try:
+        mean_const = species_registry.species_properties(molecule)["kerl"]
+    except (TypeError, ValueError):  # unknown or unhashable species
+        mean_const = None
+    if mean_const is None:
+        raise ValueError("This function only supports Air, H2, N2 or O2")
+    return mean_const
 
 
 def atmospheric_index_of_refraction(
@@ -455,6 +1107,9 @@ def atmospheric_index_of_refraction(
     Reference:
         The constants in the equation for atmospheric refractive index at radio frequencies (https://ieeexplore.ieee.org/document/4051437)
     """
+    # ambiance imports scipy.optimize, loaded only when needed
+    from ambiance import Atmosphere
+
     atmospheric_prop = Atmosphere(altitude_m)
     temperature = atmospheric_prop.temperature  # [K]
     pressure = atmospheric_prop.pressure * 0.01  # [mbar]
@@ -468,6 +1123,114 @@ def atmospheric_index_of_refraction(
     return refractivity + 1
 
 
+def atmospheric_index_of_refraction_profile(
+    altitude_m: np.ndarray,
+    vapor_pressure: np.ndarray = 0.0,
+    altitude_step_m: float = 10.0,
+) -> np.ndarray:
+    """
+    Calculates the atmospheric index of refraction as a function of altitude,
+    interpolating a cached standard atmosphere profile. Faster than
+    atmospheric_index_of_refraction for large altitude arrays (ex.
+    trajectories)
+
+    Parameters:
+        altitude_m: altitude in [m], between -4996 and 81019 [m], the top is
+            lower when altitude_step_m does not divide 85000 [m]
+        vapor_pressure: vapor pressure at given altitude in [mbar], 0.0
+            (default), scalar or array of the same shape as altitude_m
+        altitude_step_m: geopotential altitude step of the cached profile in
+            [m], 10.0 (default)
+
+    Returns:
+        index of refraction in [ ]
+
+    Reference:
+        The constants in the equation for atmospheric refractive index at radio frequencies (https://ieeexplore.ieee.org/document/4051437)
+
+    Examples:
+        >> atmospheric_index_of_refraction_profile(np.linspace(0, 30e3, 10**6))
+    """
+    profile = atmospheric_profile(altitude_step_m)
+    geopotential = profile["geopotential_altitude_m"]
+
+    # Geopotential altitude, H = r h / (r + h)
+    altitude_m = np.asarray(altitude_m, dtype=float)
+    position = altitude_m * _EARTH_RADIUS_M / (altitude_m + _EARTH_RADIUS_M)
+    # Geometric bounds of the grid, rounded inwards
+    lower, upper = profile["altitude_m"][[0, -1]]
+    check_range(
+        position,
+        geopotential[0],
+        geopotential[-1],
+        f"Altitude must be between {np.ceil(lower):.0f} and "
+        f"{np.floor(upper):.0f} meters!",
+    )
+
+    # Uniform grid lookup, shared by temperature and pressure
+    position -= geopotential[0]
+    position /= altitude_step_m
+    indx = np.minimum(position.astype(np.intp), len(geopotential) - 2)
+    position -= indx
+    temperature = profile["temperature_K"][indx]
+    temperature += position * (profile["temperature_K"][indx + 1] - temperature)
+    pressure = profile["log_pressure"][indx]
+    pressure += position * (profile["log_pressure"][indx + 1] - pressure)
+    pressure = np.exp(pressure)  # [mbar]
+    [K_1, K_2] = constants_tables.smith_atmospheric_constants()
+
+    refractivity = K_2 * vapor_pressure / temperature
+    refractivity += pressure
+    refractivity *= K_1 / temperature
+    refractivity *= 10**-6
+
+    return refractivity + 1
+
+
+@functools.lru_cache(maxsize=8)
+def atmospheric_profile(altitude_step_m: float = 10.0) -> dict[str, np.ndarray]:
+    """
+    Tabulates the standard atmosphere once per altitude step, on a uniform
+    geopotential altitude grid between -5000 and 80000 [m]. Layer boundaries
+    fall on grid points when the step divides 1000 [m], so temperature is
+    linearly interpolated without error, and pressure is log-linearly
+    interpolated by atmospheric_index_of_refraction_profile
+
+    Parameters:
+        altitude_step_m: geopotential altitude step in [m], 10.0 (default)
+
+    Returns:
+        dict: A read-only dictionary containing
+            - geopotential_altitude_m: geopotential altitude grid in [m]
+            - altitude_m: geometric altitude grid in [m]
+            - temperature_K: temperature in [K]
+            - pressure_mbar: pressure in [mbar]
+            - log_pressure: natural logarithm of the pressure in [mbar]
+    """
+    if altitude_step_m <= 0:
+        raise ValueError("Altitude step must be greater than 0!")
+    n_points = int(np.floor(85000.0 / altitude_step_m)) + 1
+    geopotential = -5000.0 + altitude_step_m * np.arange(n_points)
+    # Geometric altitude, h = r H / (r - H)
+    altitude = geopotential * _EARTH_RADIUS_M / (_EARTH_RADIUS_M - geopotential)
+
+    from ambiance import Atmosphere
+
+    atmospheric_prop = Atmosphere(altitude)
+    profile = {
+        "geopotential_altitude_m": geopotential,
+        "altitude_m": altitude,
+        "temperature_K": atmospheric_prop.temperature,  # [K]
+        "pressure_mbar": atmospheric_prop.pressure * 0.01,  # [mbar]
+    }
+    profile["log_pressure"] = np.log(profile["pressure_mbar"])
+    for val in profile.values():
+        val.flags.writeable = False
+
+    return MappingProxyType(profile)
+
+
+@chunked_elementwise("medium_index_of_refraction", "vacuum_index_of_refraction")
 def brewster_angle(
     medium_index_of_refraction: float, vacuum_index_of_refraction: float = 1.0
 ) -> float:
@@ -488,6 +1251,7 @@ def brewster_angle(
     )
 
 
+@chunked_elementwise("medium_index_of_refraction", "vacuum_index_of_refraction")
 def total_internal_reflection_angle(
     medium_index_of_refraction: float, vacuum_index_of_refraction: float = 1.0
 ) -> float:
@@ -508,8 +1272,12 @@ def total_internal_reflection_angle(
     )
 
 
+@chunked_elementwise("medium_index_of_refraction", "vacuum_index_of_refraction")
 def normal_incidence_reflectance(
-    medium_index_of_refraction: float, vacuum_index_of_refraction: float = 1.0
+    medium_index_of_refraction: float,
+    vacuum_index_of_refraction: float = 1.0,
+    out: np.ndarray = None,
+    workspace: Workspace = None,
 ) -> float:
     """
     Calculates the reflectance at a normal incidence. Note,
@@ -519,18 +1287,39 @@ def normal_incidence_reflectance(
     Parameters:
         medium_index_of_refraction: medium's index of refraction
         vacuum_index_of_refraction: vacuum's index of refraction, 1.0 (default)
+        out: array to store the results in, None (default)
+        workspace: Workspace that holds the results when out is not
+            provided, None (default)
 
     Returns:
        Reflectance at normal incidence in [ ]
     """
-    return (
-        (medium_index_of_refraction - vacuum_index_of_refraction)
-        / (medium_index_of_refraction + vacuum_index_of_refraction)
-    ) ** 2
+    field_shape = np.broadcast_shapes(
+        np.shape(medium_index_of_refraction), np.shape(vacuum_index_of_refraction)
+    )
+    reflectance = work_buffer(
+        "normal_incidence_reflectance",
+        field_shape,
+        np.result_type(medium_index_of_refraction, vacuum_index_of_refraction, 1.0),
+        out,
+        workspace,
+    )
+    index_sum = work_buffer(
+        "normal_incidence_reflectance.index_sum",
+        field_shape,
+        reflectance.dtype,
+        workspace=workspace,
+    )
+    np.add(medium_index_of_refraction, vacuum_index_of_refraction, out=index_sum)
+    np.subtract(medium_index_of_refraction, vacuum_index_of_refraction, out=reflectance)
+    reflectance /= index_sum
+    np.square(reflectance, out=reflectance)
+
+    return reflectance if reflectance.ndim else reflectance[()]
 
 
 def gladstone_dale_constant(
-    mass_density_dict: dict[str, float] = None
+    mass_density_dict: dict[str, float] = None,
 ) -> dict[str, float]:
     """
     Calculates Gladstone-Dale constants, returns constants haot.constants if
@@ -543,20 +1332,7 @@ def gladstone_dale_constant(
         dict: A dictionary containing
             - Species Gladstone-Dale constants in [m3/kg]
     """
-    pol_consts = constants_tables.polarizability()  # [cm^3]
-
-    # Convert polarizability CGS to SI
-    pol_SI = {
-        key: conversions.polarizability_cgs_to_si(pol_consts[key])
-        for key in pol_consts.keys()
-    }
-
-    # Calculates species GD
-    const_GD = {}
-    for key, val in pol_SI.items():
-        const_GD[key] = val * s_consts.N_A / molmass.Formula(key).mass
-        const_GD[key] /= 2 * s_consts.epsilon_0
-        const_GD[key] *= 1e3  # converts [1/g] to [1/kg]
+    const_GD = dict(_gladstone_dale_species_constants())
 
     # Calculate total GD
     if not mass_density_dict:
@@ -571,6 +1347,83 @@ def gladstone_dale_constant(
         return species_GD  # [m3/kg]
 
 
+def gladstone_dale_constant_field(
+    mass_density: np.ndarray,
+    species: list[str] = None,
+    dtype: type = None,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Calculates the mass-weighted mixture Gladstone-Dale constant over species
+    mass density fields, sum(K_i rho_i) / sum(rho_i). Vectorized version of
+    gladstone_dale_constant, species constants are cached and the mixture is
+    evaluated with a single weighted reduction
+
+    Parameters:
+        mass_density: species mass densities in [kg/m^3], either a dictionary
+            of equal shape arrays or an array of shape [n_species, n_cells]
+        species: species names of each row of mass_density, required when
+            mass_density is an array. Ex [N2, O2, O, N, NO]
+        dtype: output data type, np.float64 or np.float32, None (default)
+            follows haot.get_precision()
+        out: array to store the results in, None (default)
+
+    Returns:
+        mixture Gladstone-Dale constant in [m3/kg]
+
+    Examples:
+        >> gladstone_dale_constant_field({"N2": rho_n2, "O2": rho_o2, "NO": rho_no})
+
+        >> gladstone_dale_constant_field(rho, species, dtype=np.float32)
+    """
+    species, mass_density = _species_field(mass_density, species)
+    # K_i = a_i N_A / (2 e_0 M_i), [m3/kg]
+    coefficients = _molar_polarizability_coefficients(species)
+    coefficients = coefficients / (2 * s_consts.epsilon_0)
+
+    field_shape = np.shape(mass_density[0])
+    if out is None:
+        out = np.empty(field_shape, dtype=dtype or precision.get_precision())
+    if out.shape != field_shape:
+        raise ValueError("out must have the shape of the mass density fields")
+
+    # Weighted and total mass density
+    if isinstance(mass_density, np.ndarray):
+        flat_density = mass_density.reshape(len(species), -1)
+        weighted = (coefficients @ flat_density).reshape(field_shape)
+        total = flat_density.sum(axis=0).reshape(field_shape)
+    else:
+        weighted = np.multiply(mass_density[0], coefficients[0])
+        total = np.array(mass_density[0], dtype=float)
+        for i in range(1, len(species)):
+            weighted += mass_density[i] * coefficients[i]
+            total += mass_density[i]
+    np.divide(weighted, total, out=out, casting="same_kind")
+
+    return out if field_shape else out[()]  # [m3/kg]
+
+
+@species_registry.species_cache
+def _gladstone_dale_species_constants() -> MappingProxyType:
+    """
+    Helper function that caches the species Gladstone-Dale constants in
+    [m3/kg]
+    """
+    pol_consts = constants_tables.polarizability()  # [cm^3]
+
+    # Calculates species GD
+    const_GD = {}
+    for key in pol_consts.keys():
+        properties = species_registry.species_properties(key)
+        # Convert polarizability CGS to SI
+        pol_SI = conversions.polarizability_cgs_to_si(properties["polarizability"])
+        const_GD[key] = pol_SI * s_consts.N_A / properties["molar_mass"]
+        const_GD[key] /= 2 * s_consts.epsilon_0
+        const_GD[key] *= 1e3  # converts [1/g] to [1/kg]
+
+    return MappingProxyType(const_GD)
+
+
 def air_gladstone_dale_polarizability(polarizability: float):
     """
     Calculates the Air Gladstone Dale constant for a polarizability
@@ -581,12 +1434,7 @@ def air_gladstone_dale_polarizability(polarizability: float):
     Returns:
         Gladstone Dale constant in [m3/kg]
     """
-    molar_mass_air_g = (
-        0.78 * molmass.Formula("N2").mass
-        + 0.21 * molmass.Formula("O2").mass
-        + 0.01 * molmass.Formula("Ar").mass
-    )
-    molar_mass_air = molar_mass_air_g * 1e-3
+    molar_mass_air = species_registry.air_molar_mass() * 1e-3
 
     return 4 * np.pi * (s_consts.N_A * polarizability) / (3 * molar_mass_air)
 
@@ -609,3 +1457,6 @@ def gladstone_dale_air_wavelength(wavelength_nm: float) -> float:
     gd_const += 1
 
     return 2.2244 * 1e-4 * gd_const  # [m3/kg]
+
+
+instrument_module(globals())
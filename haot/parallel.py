@@ -0,0 +1,275 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   parallel.py
+Def:    Contains the thread pool that evaluates large fields in chunks.
+"""
+
+import contextlib
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from haot import validation
+
+# Threads and chunk size of field functions, shared by all threads
+_POLICY = {"num_threads": 1, "chunk_elements": 1 << 16}
+# Thread pool, created on first use and resized with the policy
+_POOL = {"executor": None, "num_threads": 0, "lock": threading.Lock()}
+# Marks worker threads, field functions called inside a chunk run serially
+_WORKER = threading.local()
+# Chunk boundaries are multiples of this many elements, SIMD loops see the
+# same element blocks as in a serial call
+_ALIGNMENT = 64
+
+
+def set_num_threads(num_threads: int = None, chunk_elements: int = None):
+    """
+    Sets the number of threads of field functions (optics, aerodynamics and
+    conversions). Fields larger than chunk_elements are split into chunks
+    that are evaluated concurrently in a thread pool, NumPy releases the GIL
+    so the chunks run in parallel. Every element goes through the same
+    operations as in a serial call, results are bit-identical
+
+    Parameters:
+        num_threads: number of threads, 1 is serial, None (default) uses all
+            cores
+        chunk_elements: elements per chunk, None (default) keeps the current
+            value, 65536 (512 KiB of float64) at import
+
+    Examples:
+        >> set_num_threads(16)
+
+        >> set_num_threads(1)
+    """
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+    if not isinstance(num_threads, (int, np.integer)) or num_threads < 1:
+        raise ValueError("Number of threads must be a positive integer!")
+    if chunk_elements is not None:
+        if not isinstance(chunk_elements, (int, np.integer)) or chunk_elements < 1:
+            raise ValueError("Chunk elements must be a positive integer!")
+        _POLICY["chunk_elements"] = int(chunk_elements)
+    _POLICY["num_threads"] = int(num_threads)
+
+
+def get_num_threads() -> int:
+    """
+    Returns the number of threads of field functions
+
+    Returns:
+        number of threads, 1 is serial
+    """
+    return _POLICY["num_threads"]
+
+
+@contextlib.contextmanager
+def thread_policy(num_threads: int = None, chunk_elements: int = None):
+    """
+    Context manager that sets the number of threads (and chunk size) of
+    field functions, and restores the previous ones on exit
+
+    Parameters:
+        num_threads: number of threads, None (default) uses all cores
+        chunk_elements: elements per chunk, None (default) keeps the current
+            value
+
+    Examples:
+        >> with thread_policy(32):
+        >>     index = index_of_refraction_density_temperature(T, rho)
+    """
+    previous = dict(_POLICY)
+    set_num_threads(num_threads, chunk_elements)
+    try:
+        yield
+    finally:
+        _POLICY.update(previous)
+
+
+def chunked_elementwise(*field_names: str):
+    """
+    Decorator of elementwise field functions. When get_num_threads() > 1,
+    the field arguments are split into chunks evaluated in the thread pool,
+    the remaining arguments must be scalars, otherwise the function runs
+    serially. The function must return an array of the field shape or a
+    dictionary of them. Chunks write straight into out (and the workspace
+    results) when the function takes them
+
+    Parameters:
+        field_names: names of the field arguments
+
+    Examples:
+        >> @chunked_elementwise("temperature_K")
+        >> def sutherland_law_viscosity(temperature_K, molecule="Air"):
+        >>     ...
+    """
+
+    def decorator(function):
+        signature = inspect.signature(function)
+        takes_out = "out" in signature.parameters
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _POLICY["num_threads"] == 1 or getattr(_WORKER, "active", False):
+                return function(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            layout = _chunk_layout(arguments, field_names)
+            if layout is None:
+                return function(*args, **kwargs)
+            return _chunked_call(function, arguments, field_names, layout, takes_out)
+
+        return wrapper
+
+    return decorator
+
+
+def _chunk_layout(arguments: dict, field_names: tuple[str, ...]):
+    """
+    Helper function that returns the field shape, whether the fields are
+    split as flat arrays (or along the first axis), and the chunk bounds.
+    None if the call should run serially
+    """
+    fields = []
+    for name, val in arguments.items():
+        if name in field_names:
+            if not isinstance(val, (np.ndarray, int, float, np.generic)):
+                return None
+            fields.append(val)
+        elif name not in ("out", "workspace") and np.ndim(val) > 0:
+            return None
+    try:
+        field_shape = np.broadcast_shapes(*(np.shape(val) for val in fields))
+    except ValueError:
+        return None
+    chunk_elements = _POLICY["chunk_elements"]
+    if not field_shape or np.prod(field_shape) <= chunk_elements:
+        return None
+
+    out = arguments.get("out")
+    outs = list(out.values()) if isinstance(out, dict) else [out]
+    outs = [val for val in outs if val is not None]
+    if any(not isinstance(val, np.ndarray) or val.shape != field_shape for val in outs):
+        return None
+
+    arrays = [val for val in fields if np.ndim(val) > 0] + outs
+    flat = all(
+        np.shape(val) == field_shape and val.flags.c_contiguous for val in arrays
+    )
+    if flat:
+        step = max(_ALIGNMENT, chunk_elements - chunk_elements % _ALIGNMENT)
+        length = int(np.prod(field_shape))
+    else:
+        step = max(1, chunk_elements // int(np.prod(field_shape[1:])))
+        length = field_shape[0]
+    bounds = [(start, min(start + step, length)) for start in range(0, length, step)]
+    if len(bounds) < 2:
+        return None
+
+    return field_shape, flat, bounds
+
+
+def _chunked_call(
+    function, arguments: dict, field_names: tuple[str, ...], layout, takes_out: bool
+):
+    """
+    Helper function that evaluates a field function chunk by chunk, the
+    first chunk in the calling thread and the rest in the thread pool
+    """
+    field_shape, flat, bounds = layout
+    out = arguments.get("out")
+    workspace = arguments.pop("workspace", None)
+    ndim = len(field_shape)
+
+    def view(val):
+        return val.reshape(-1) if flat and np.ndim(val) else val
+
+    # Fields broadcast along the first axis are passed whole
+    fields = {name: view(arguments[name]) for name in field_names if name in arguments}
+    split = {
+        name: np.ndim(val) == (1 if flat else ndim) and np.shape(val)[0] > 1
+        for name, val in fields.items()
+    }
+
+    # Chunks follow the input checks setting of the calling thread
+    validate = validation.get_validation()
+
+    def run_chunk(start: int, stop: int, out_chunk):
+        chunk = dict(arguments)
+        for name, val in fields.items():
+            chunk[name] = val[start:stop] if split[name] else val
+        if takes_out:
+            chunk["out"] = out_chunk
+        _WORKER.active = True
+        previous = validation.get_validation()
+        validation.set_validation(validate)
+        try:
+            return function(**chunk)
+        finally:
+            _WORKER.active = False
+            validation.set_validation(previous)
+
+    # First chunk, sets the result structure and data types
+    start, stop = bounds[0]
+    first_out = None
+    if isinstance(out, dict):
+        first_out = {key: view(val)[start:stop] for key, val in out.items()}
+    elif out is not None:
+        first_out = view(out)[start:stop]
+    first = run_chunk(start, stop, first_out)
+    chunk_shape = (stop - start,) if flat else (stop - start,) + field_shape[1:]
+    is_dict = isinstance(first, dict)
+    first_dict = first if is_dict else {None: first}
+    if not all(
+        isinstance(val, np.ndarray) and val.shape == chunk_shape
+        for val in first_dict.values()
+    ):
+        arguments["workspace"] = workspace
+        return function(**arguments)
+
+    results = {}
+    for key, val in first_dict.items():
+        name = function.__name__ if key is None else f"{function.__name__}.{key}"
+        user_out = out.get(key) if isinstance(out, dict) else out
+        if user_out is not None:
+            results[key] = user_out
+        elif workspace is not None:
+            results[key] = workspace.buffer(name, field_shape, val.dtype)
+        else:
+            results[key] = np.empty(field_shape, dtype=val.dtype)
+    views = {key: view(val) for key, val in results.items()}
+    for key, val in first_dict.items():
+        views[key][start:stop] = val
+
+    def task(start: int, stop: int):
+        out_chunk = {key: val[start:stop] for key, val in views.items()}
+        result = run_chunk(start, stop, out_chunk if is_dict else out_chunk[None])
+        if not takes_out:
+            result = result if is_dict else {None: result}
+            for key, val in result.items():
+                views[key][start:stop] = val
+
+    executor = _executor()
+    futures = [executor.submit(task, start, stop) for start, stop in bounds[1:]]
+    for future in futures:
+        future.result()
+
+    return results if is_dict else results[None]
+
+
+def _executor() -> ThreadPoolExecutor:
+    """
+    Helper function that returns the thread pool, resized to the current
+    number of threads
+    """
+    num_threads = _POLICY["num_threads"]
+    with _POOL["lock"]:
+        if _POOL["num_threads"] != num_threads:
+            if _POOL["executor"] is not None:
+                _POOL["executor"].shutdown(wait=False)
+            _POOL["executor"] = ThreadPoolExecutor(
+                num_threads, thread_name_prefix="haot"
+            )
+            _POOL["num_threads"] = num_threads
+        return _POOL["executor"]
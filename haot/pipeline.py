@@ -0,0 +1,234 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   pipeline.py
+Def:    Contains a streaming aero-optics pipeline, from CFD fields to the
+        Strehl ratio.
+"""
+
+import time
+import numpy as np
+from haot import optics
+from haot.streaming import welford_frames
+from haot.instrumentation import instrument_module
+
+
+class AeroOpticsPipeline:
+    """
+    Streaming aero-optics pipeline. Chains index_of_refraction_density_temperature
+    (or index_of_refraction_field), optical_path_length, optical_path_difference,
+    optical_path_difference_rms, phase_variance and strehl_ratio in a single
+    chunked pass over [time, x_axis, y_axis, z_axis] fields. Rays are parallel
+    to a grid axis, only chunk_size frames are held in memory at once, and the
+    refractivity n - 1 is integrated instead of n to keep significant digits
+
+    Parameters:
+        step_size: grid spacing along the rays in [m]
+        aperture_mask: boolean mask of the grid points crossed by rays, shape
+            of a frame without the ray axis, None (default) uses all points
+        ray_axis: frame axis the rays are parallel to, 2 (default) is z_axis
+        molecule: H2, N2, O2, Air (default), used with temperature fields
+        wavelength_nm: signal's wavelength in [nm], 633.0 (default)
+        index: 'dense' (default) or 'dilute' index of refraction
+        chunk_size: frames processed at once, 8 (default)
+
+    Examples:
+        >> pipeline = AeroOpticsPipeline(1e-3, wavelength_nm=532.0)
+
+        >> results = pipeline.run(rho, temperature_K=T)
+
+        >> pipeline.timings, pipeline.throughput
+    """
+
+    _STAGES = ("read", "index_of_refraction", "optical_path_length", "statistics")
+
+    def __init__(
+        self,
+        step_size: float,
+        aperture_mask: np.ndarray = None,
+        ray_axis: int = 2,
+        molecule: str = "Air",
+        wavelength_nm: float = 633.0,
+        index: str = "dense",
+        chunk_size: int = 8,
+    ):
+        if step_size <= 0:
+            raise ValueError("Step size must be greater than 0!")
+        if ray_axis not in [0, 1, 2]:
+            raise ValueError("ray_axis must be one of [0, 1, 2]")
+        if wavelength_nm <= 0:
+            raise ValueError("Wavelength must be greater than 0 nanometers!")
+        if index not in ["dense", "dilute"]:
+            raise ValueError("index must be 'dense' or 'dilute'")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be greater than 0!")
+        self.step_size = step_size
+        self.aperture_mask = aperture_mask
+        self.ray_axis = ray_axis
+        self.molecule = molecule
+        self.wavelength_nm = wavelength_nm
+        self.index = index
+        self.chunk_size = chunk_size
+        self.reset_counters()
+
+    def reset_counters(self):
+        """
+        Resets the stage timings and the processed frames and cells
+        """
+        self.timings = {stage: 0.0 for stage in self._STAGES}
+        self.frames = 0
+        self.cells = 0
+
+    @property
+    def throughput(self) -> dict[str, float]:
+        """
+        Processed cells per second of each stage, and of the whole pipeline
+        (total)
+        """
+        throughput = {
+            stage: self.cells / val if val > 0 else 0.0
+            for stage, val in self.timings.items()
+        }
+        total_time = sum(self.timings.values())
+        throughput["total"] = self.cells / total_time if total_time > 0 else 0.0
+        return throughput
+
+    def run(
+        self, mass_density: np.ndarray, temperature_K: np.ndarray = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Runs the pipeline over a time series of fields, the counters keep
+        accumulating across runs
+
+        Parameters:
+            mass_density: mass density in [kg/m^3], numpy array (ex. a
+                numpy.memmap) of shape [time, x_axis, y_axis, z_axis], or a
+                dictionary of species arrays of that shape (see
+                index_of_refraction_field)
+            temperature_K: temperature in [K] of the same shape as
+                mass_density, required unless mass_density is a dictionary
+
+        Returns:
+            dict: A dictionary containing
+                - opd_rms: Optical Path Difference RMS in [m], with the time
+                  averaged optical path length removed (avg_ax = 0)
+                - phase_variance: phase variance of opd_rms
+                - strehl_ratio: Strehl ratio of opd_rms
+                - opd_rms_frames: Optical Path Difference RMS of each frame
+                  in [m], with the aperture piston removed, shape [time]
+                - strehl_ratio_frames: Strehl ratio of each frame, shape [time]
+                - mean_opl: time averaged optical path length in [m] minus
+                  the ray length, shape of the aperture, NaN outside the mask
+        """
+        fields = self._fields(mass_density, temperature_K)
+        frame_rms = []
+        count, mean, sum_squares = welford_frames(
+            self._optical_path_chunks(fields, frame_rms)
+        )
+
+        start = time.perf_counter()
+        opd_rms = np.sqrt(sum_squares.sum() / (count * sum_squares.size))
+        variance = optics.phase_variance(opd_rms, self.wavelength_nm)
+        frame_rms = np.concatenate(frame_rms)
+        mean_opl = np.full(self._mask.shape, np.nan)
+        mean_opl[self._mask] = mean
+        self.timings["statistics"] += time.perf_counter() - start
+
+        return {
+            "opd_rms": opd_rms,
+            "phase_variance": variance,
+            "strehl_ratio": optics.strehl_ratio(variance),
+            "opd_rms_frames": frame_rms,
+            "strehl_ratio_frames": optics.strehl_ratio(
+                optics.phase_variance(frame_rms, self.wavelength_nm)
+            ),
+            "mean_opl": mean_opl,
+        }
+
+    def _fields(self, mass_density: np.ndarray, temperature_K: np.ndarray) -> dict:
+        """
+        Helper method that validates the input fields
+        """
+        if isinstance(mass_density, dict):
+            fields = dict(mass_density)
+        elif temperature_K is None:
+            raise ValueError("Temperature is required unless species are given")
+        else:
+            fields = {"mass_density": mass_density, "temperature_K": temperature_K}
+        shapes = {np.shape(val) for val in fields.values()}
+        if len(shapes) > 1:
+            raise ValueError("All fields must have the same shape!")
+        field_shape = shapes.pop()
+        if len(field_shape) != 4:
+            raise ValueError("Fields must be of shape [time, x_axis, y_axis, z_axis]")
+
+        frame_shape = list(field_shape[1:])
+        del frame_shape[self.ray_axis]
+        if self.aperture_mask is None:
+            self._mask = np.ones(frame_shape, dtype=bool)
+        else:
+            self._mask = np.asarray(self.aperture_mask, dtype=bool)
+        if list(self._mask.shape) != frame_shape:
+            raise ValueError("Aperture mask must have the frame shape without ray_axis")
+        self._species = isinstance(mass_density, dict)
+
+        return fields
+
+    def _optical_path_chunks(self, fields: dict, frame_rms: list):
+        """
+        Helper generator that yields the optical path length of chunks of
+        frames inside the aperture, shape [chunk, aperture points], and
+        appends the piston removed RMS of each frame to frame_rms
+        """
+        n_frames = len(next(iter(fields.values())))
+        for i in range(0, n_frames, self.chunk_size):
+            start = time.perf_counter()
+            chunk = {
+                key: np.asarray(val[i : i + self.chunk_size])
+                for key, val in fields.items()
+            }
+            stop = time.perf_counter()
+            self.timings["read"] += stop - start
+
+            # Refractivity, n - 1
+            start = stop
+            if self._species:
+                refractivity = optics.index_of_refraction_field(
+                    chunk, refractivity=True
+                )[self.index]
+            else:
+                refractivity = optics.index_of_refraction_density_temperature(
+                    chunk["temperature_K"],
+                    chunk["mass_density"],
+                    self.molecule,
+                    self.wavelength_nm,
+                    refractivity=True,
+                )[self.index]
+            stop = time.perf_counter()
+            self.timings["index_of_refraction"] += stop - start
+
+            # Optical path length minus the ray length, trapezoidal rule
+            start = stop
+            axis = self.ray_axis + 1
+            opl = np.sum(refractivity, axis=axis, dtype=np.float64)
+            opl -= 0.5 * np.take(refractivity, 0, axis=axis)
+            opl -= 0.5 * np.take(refractivity, -1, axis=axis)
+            opl = opl[:, self._mask] * self.step_size
+            stop = time.perf_counter()
+            self.timings["optical_path_length"] += stop - start
+
+            # Aperture piston removed RMS of each frame
+            start = stop
+            frame_rms.append(np.std(opl, axis=1, dtype=np.float64))
+            self.timings["statistics"] += time.perf_counter() - start
+
+            self.frames += refractivity.shape[0]
+            self.cells += refractivity.size
+
+            # Time spent by the consumer, Welford's accumulation
+            start = time.perf_counter()
+            yield opl
+            self.timings["statistics"] += time.perf_counter() - start
+
+
+instrument_module(globals())
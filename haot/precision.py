@@ -0,0 +1,75 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   precision.py
+Def:    Contains the floating point precision policy of large fields.
+"""
+
+import contextlib
+import numpy as np
+
+# Floating point type of field outputs, shared by all threads
+_POLICY = {"dtype": np.dtype(np.float64)}
+
+
+def set_precision(dtype: type):
+    """
+    Sets the floating point precision of large field outputs. In float32
+    mode, optics functions store fields in single precision (halving memory
+    and bandwidth) and keep float64 accumulators for reductions. Relative
+    error bounds against float64 are
+        - kerl_polarizability_temperature: 1e-6
+        - index_of_refraction_density_temperature with refractivity=True:
+          2e-6 of n - 1
+        - index_of_refraction_density_temperature: 1.2e-7 of n, the digits
+          of n - 1 are lost when n is rounded, use refractivity=True
+        - gladstone_dale_constant_field: 1.2e-7
+        - optical_path_difference: 1.2e-7 of the optical path difference,
+          the mean optical path length is accumulated in float64
+
+    Parameters:
+        dtype: np.float32 or np.float64 (default), or their names
+
+    Examples:
+        >> set_precision(np.float32)
+
+        >> set_precision("float64")
+    """
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        dtype = None
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("Precision must be float32 or float64!")
+    _POLICY["dtype"] = dtype
+
+
+def get_precision() -> np.dtype:
+    """
+    Returns the floating point precision of large field outputs
+
+    Returns:
+        np.dtype('float32') or np.dtype('float64')
+    """
+    return _POLICY["dtype"]
+
+
+@contextlib.contextmanager
+def precision_policy(dtype: type):
+    """
+    Context manager that sets the floating point precision of large field
+    outputs, and restores the previous one on exit
+
+    Parameters:
+        dtype: np.float32 or np.float64, or their names
+
+    Examples:
+        >> with precision_policy(np.float32):
+        >>     opd = optical_path_difference(opl)
+    """
+    previous = get_precision()
+    set_precision(dtype)
+    try:
+        yield
+    finally:
+        _POLICY["dtype"] = previous
@@ -5,11 +5,16 @@ File:   quantum_mechanics.py
 Def:    Contains Quantum Mechanics functions.
 """
 
-import molmass
 import numpy as np
 import scipy.constants as s_consts
-from haot import constants as constants_tables
 from haot import conversions
+from haot import species as species_registry
+from haot.parallel import chunked_elementwise
+from haot.instrumentation import instrument_module
+from haot.validation import check_nonnegative
+
+# Elements of the [levels, temperatures] Boltzmann factor blocks
+_LEVEL_BLOCK_ELEMENTS = 1 << 16
 
 
 def zero_point_energy(molecule: str) -> float:
@@ -30,10 +35,8 @@ def zero_point_energy(molecule: str) -> float:
         Experimental Vibrational Zero-Point Energies Diatomic Molecules
         (https://doi.org/10.1063/1.2436891)
     """
-    # Unit Test
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
-    spectroscopy_const = constants_tables.spectroscopy_constants(molecule)
+    # Load constants, unsupported species raise a ValueError
+    spectroscopy_const = _spectroscopy_constants(molecule)
 
     scope_var = spectroscopy_const["alpha_e"]
     scope_var *= spectroscopy_const["omega_e"]
@@ -48,101 +51,109 @@ def zero_point_energy(molecule: str) -> float:
     return zpe  # [1/cm]
 
 
+def _spectroscopy_constants(molecule: str) -> dict[str, float]:
+    """
+    Helper function that returns the spectroscopy constants of a species from
+    the species registry, so registered overrides are used
+    """
+    try:
+        spectroscopy_const = species_registry.species_properties(molecule)[
+            "spectroscopy"
+        ]
+    except (TypeError, ValueError):  # unknown or unhashable species
+        spectroscopy_const = None
+    if spectroscopy_const is None:
+        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
+    return spectroscopy_const
+
+
+@chunked_elementwise("temperature_K")
 def vibrational_partition_function(
     vibrational_number: int, temperature_K: float, molecule: str
 ) -> float:
     """
     Calculates the vibrational partition function base in the harmonic
-    terms only for diatomic molecules
+    terms only for diatomic molecules. The level energies are computed once
+    per molecule, and every level is evaluated against the temperature field
 
     Parameters:
         vibrational_number: vibrational quantum number (has to be positive)
-        temperature_K: reference temperature in [K]
+        temperature_K: reference temperature in [K], float or numpy.ndarray
         molecule: NO+, N2+, O2+, NO, N2, O2
 
     Returns:
-        vibrational partition function
+        vibrational partition function, of the temperature shape
 
     Examples:
         >> vibrational_partition_function(2, 350.0, 'N2')
+
+        >> vibrational_partition_function(10, temperature_field, 'N2')
     """
     # Unit Test
     if not isinstance(vibrational_number, int):
         raise ValueError("Vibrational quantum number should be a positive integer")
     if vibrational_number < 0.0:
         raise ValueError("Vibrational number should be a positive integer!")
-    if temperature_K < 0.0:
-        raise ValueError("Temperature should be positive!")
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
-    z_vib = 0.0
-    for v in range(vibrational_number + 1):
-        z_vib += boltzmann_factor(
-            temperature_K,
-            molecule,
-            vibrational_number=v,
-            rotational_number=None,
-            born_opp_flag=False,
-        )
-    return z_vib
+    check_nonnegative(temperature_K, "Temperature should be positive!")
+    energy_J, degeneracy = _partition_levels(molecule, vibrational_number, None)
+    return _partition_function(temperature_K, energy_J, degeneracy)
 
 
+@chunked_elementwise("temperature_K")
 def rotational_partition_function(
     rotational_number: int, temperature_K: float, molecule: str
 ) -> float:
     """
     Calculates the rotational partition function base in the harmonic
-    terms only for diatomic molecules
+    terms only for diatomic molecules. The level energies are computed once
+    per molecule, and every level is evaluated against the temperature field
 
     Parameters:
         rotational_number: rotational quantum number (has to be positive)
-        temperature_K: reference temperature in [K]
+        temperature_K: reference temperature in [K], float or numpy.ndarray
         molecule: NO+, N2+, O2+, NO, N2, O2
 
     Returns:
-        rotational partition function
+        rotational partition function, of the temperature shape
 
     Examples:
         >> rotational_partition_function(2, 350.0, 'N2')
+
+        >> rotational_partition_function(100, temperature_field, 'N2')
     """
     # Unit Test
     if not isinstance(rotational_number, int):
         raise ValueError("Vibrational quantum number should be a positive integer")
     if rotational_number < 0.0:
         raise ValueError("Rotational number should be a positive integer!")
-    if temperature_K < 0.0:
-        raise ValueError("Temperature should be positive!")
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
-    z_rot = 0.0
-    for j in range(rotational_number + 1):
-        z_rot += boltzmann_factor(
-            temperature_K,
-            molecule,
-            vibrational_number=None,
-            rotational_number=j,
-            born_opp_flag=False,
-        )
-    return z_rot
+    check_nonnegative(temperature_K, "Temperature should be positive!")
+    energy_J, degeneracy = _partition_levels(molecule, None, rotational_number)
+    return _partition_function(temperature_K, energy_J, degeneracy)
 
 
+@chunked_elementwise("temperature_K")
 def born_oppenheimer_partition_function(
     vibrational_number: int, rotational_number: int, temperature_K: float, molecule: str
 ) -> float:
     """
-    Calculates the partition function using the Born-Oppenheimer approximation
+    Calculates the partition function using the Born-Oppenheimer
+    approximation. The level energies are computed once per molecule, and
+    every level is evaluated against the temperature field
 
     Parameters:
         vibrational_number: vibrational quantum number (has to be positive)
         rotational_number: rotational quantum number (has to be positive)
-        temperature_K: reference temperature in [K]
+        temperature_K: reference temperature in [K], float or numpy.ndarray
         molecule: NO+, N2+, O2+, NO, N2, O2
 
     Returns:
-        partition function using the Born-Oppenheimer approximations
+        partition function using the Born-Oppenheimer approximations, of the
+        temperature shape
 
     Examples:
         >> born_oppenheimer_partition_function(2, 4, 500.0, 'O2')
+
+        >> born_oppenheimer_partition_function(10, 100, temperature_field, 'O2')
     """
     # Unit Test
     if not isinstance(vibrational_number, int):
@@ -153,21 +164,69 @@ def born_oppenheimer_partition_function(
         raise ValueError("Vibrational quantum number should be a positive integer")
     if rotational_number < 0.0:
         raise ValueError("Rotational number should be a positive integer!")
-    if temperature_K < 0.0:
-        raise ValueError("Temperature should be positive!")
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
-    z_bo = 0.0
-    for j in range(rotational_number + 1):
-        for v in range(vibrational_number + 1):
-            z_bo += boltzmann_factor(
-                temperature_K,
-                molecule,
-                vibrational_number=v,
-                rotational_number=j,
-                born_opp_flag=True,
-            )
-    return z_bo
+    check_nonnegative(temperature_K, "Temperature should be positive!")
+    energy_J, degeneracy = _partition_levels(
+        molecule, vibrational_number, rotational_number
+    )
+    return _partition_function(temperature_K, energy_J, degeneracy)
+
+
+@species_registry.species_cache(maxsize=32)
+def _partition_levels(
+    molecule: str, vibrational_number: int, rotational_number: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function that caches the level energies in [J] and degeneracies
+    of a partition function, vibrational (rotational_number is None),
+    rotational (vibrational_number is None) or Born-Oppenheimer levels
+    """
+    if rotational_number is None:
+        vibrational = np.arange(vibrational_number + 1)
+        energy_k = vibrational_energy_k(vibrational, molecule)
+        degeneracy = np.ones(vibrational.size)
+    elif vibrational_number is None:
+        rotational = np.arange(rotational_number + 1)
+        energy_k = rotational_energy_k(rotational, molecule)
+        degeneracy = 2.0 * rotational + 1
+    else:
+        rotational, vibrational = np.meshgrid(
+            np.arange(rotational_number + 1),
+            np.arange(vibrational_number + 1),
+            indexing="ij",
+        )
+        energy_k = born_oppenheimer_approximation(
+            vibrational.ravel(), rotational.ravel(), molecule
+        )
+        degeneracy = 2.0 * rotational.ravel() + 1
+    energy_J = conversions.wavenumber_to_joules(np.asarray(energy_k, dtype=float))
+    energy_J.flags.writeable = False
+    degeneracy.flags.writeable = False
+
+    return energy_J, degeneracy
+
+
+def _partition_function(
+    temperature_K, energy_J: np.ndarray, degeneracy: np.ndarray
+) -> np.ndarray:
+    """
+    Helper function that sums g exp(-E / (k T)) over the levels, in blocks
+    of [levels, temperatures] Boltzmann factors
+    """
+    thermal_beta = 1 / (s_consts.k * np.asarray(temperature_K, dtype=float))
+    shape = thermal_beta.shape
+    thermal_beta = thermal_beta.reshape(-1)
+    z_tot = np.zeros_like(thermal_beta)
+    block = max(1, _LEVEL_BLOCK_ELEMENTS // thermal_beta.size)
+    for start in range(0, energy_J.size, block):
+        factors = np.multiply.outer(-energy_J[start : start + block], thermal_beta)
+        np.exp(factors, out=factors)
+        factors *= degeneracy[start : start + block, np.newaxis]
+        # Levels are accumulated in order (sum(axis=0) is pairwise over a
+        # single column), results do not depend on the block size
+        factors[0] += z_tot
+        z_tot = np.cumsum(factors, axis=0, out=factors)[-1]
+
+    return z_tot.reshape(shape)[()]
 
 
 def potential_dunham_coef_012(molecule: str) -> tuple[float, float, float]:
@@ -191,7 +250,7 @@ def potential_dunham_coef_012(molecule: str) -> tuple[float, float, float]:
         Anharmonic Potential Constants and Their Dependence upon Bond Length
         (https://doi.org/10.1063/1.1731952)
     """
-    spectroscopy_const = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_const = _spectroscopy_constants(molecule)
     a_0 = spectroscopy_const["omega_e"] ** 2 / (4 * spectroscopy_const["B_e"])
     a_1 = -(
         spectroscopy_const["alpha_e"]
@@ -392,7 +451,7 @@ def born_oppenheimer_approximation(
     Examples:
         >> born_oppenheimer_approximation(2,3,'N2')
     """
-    spectroscopy_constants = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_constants = _spectroscopy_constants(molecule)
 
     vib_levels = vibrational_number + 1 / 2
     rot_levels = rotational_number * (rotational_number + 1)
@@ -426,7 +485,7 @@ def vibrational_energy_k(vibrational_number: int, molecule: str) -> float:
     Examples:
         >> vibrational_energy_k(2, 'N2')
     """
-    spectroscopy_constants = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_constants = _spectroscopy_constants(molecule)
     # Calculates the vibrational energy in units of wave number
     vib_levels = vibrational_number + 1 / 2
     return spectroscopy_constants["omega_e"] * vib_levels  # [cm^-1]
@@ -447,7 +506,7 @@ def rotational_energy_k(rotational_number: int, molecule: str) -> float:
     Examples:
         >> rotational_energy_k(2, 'N2')
     """
-    spectroscopy_constants = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_constants = _spectroscopy_constants(molecule)
     # Calculates the rotational energy in units of wave number
     rot_levels = rotational_number * (rotational_number + 1)
     return spectroscopy_constants["B_e"] * rot_levels  # [cm^-1]
@@ -467,8 +526,8 @@ def reduced_mass_kg(molecule_1: str, molecule_2: str) -> float:
     Examples:
         >> reduced_mass_kg('N', 'O')
     """
-    m_1 = molmass.Formula(molecule_1).mass
-    m_2 = molmass.Formula(molecule_2).mass
+    m_1 = species_registry.species_molar_mass(molecule_1)
+    m_2 = species_registry.species_molar_mass(molecule_2)
     mu = m_1 * m_2 / (m_1 + m_2)
 
     return conversions.molar_mass_to_kilogram(mu)
@@ -492,10 +551,7 @@ def characteristic_temperatures_K(molecule: str) -> tuple[float, float]:
     Examples:
         >> [T_tr, T_vib] = characteristic_temperatures_K('N2')
     """
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
-
-    spectroscopy_const = constants_tables.spectroscopy_constants(molecule)
+    spectroscopy_const = _spectroscopy_constants(molecule)
 
     # Eq 4.110
     T_tr = spectroscopy_const["B_e"] * 1e2 * (s_consts.h * s_consts.c) / s_consts.k
@@ -518,11 +574,9 @@ def molecular_spring_constant(molecule: str) -> float:
         >> molecular_spring_constant('N2')
     """
     # Split masses
-    if molecule not in ["NO+", "N2+", "O2+", "NO", "N2", "O2", "H2"]:
-        raise ValueError("This function only supports NO+, N2+, O2+, NO, N2, O2, H2")
+    spectroscopy_const = _spectroscopy_constants(molecule)
     m_1 = molecule[0]
     m_2 = m_1 if molecule[1] == str(2) else molecule[1]
-    spectroscopy_const = constants_tables.spectroscopy_constants(molecule)
     mass_kg = reduced_mass_kg(m_1, m_2)
     freq_rps = conversions.wavenumber_to_angular_frequency(
         spectroscopy_const["omega_e"]
@@ -534,3 +588,6 @@ def molecular_spring_constant(molecule: str) -> float:
 # TODO: Missing Translational Energy
 def tranlational_energy(principal_number_x, principal_number_y, principal_number_z):
     print("TODO: Missing implementation of this function")
+
+
+instrument_module(globals())
@@ -0,0 +1,426 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   ray_tracing.py
+Def:    Contains ray tracing functions to integrate optical path lengths.
+"""
+
+import numpy as np
+import scipy.sparse
+import scipy.spatial
+from haot import coordinates
+from haot import optics
+from haot.instrumentation import instrument_module
+
+
+def optical_path_length_grid(
+    index_of_refraction: np.ndarray,
+    grid_axes: tuple[np.ndarray, np.ndarray, np.ndarray],
+    ray_origins: np.ndarray,
+    ray_directions: np.ndarray,
+    step_size: float,
+    ray_length: float,
+    fill_value: float = 1.0,
+    chunk_size: int = 2**20,
+) -> np.ndarray:
+    """
+    Calculates the optical path length of a bundle of rays through an index of
+    refraction field on a structured grid (uniform or rectilinear). All the
+    rays are marched at once, the index of refraction is trilinearly
+    interpolated and integrated using the trapezoidal rule
+
+    Parameters:
+        index_of_refraction: index of refraction of shape [x_axis, y_axis, z_axis]
+        grid_axes: x, y and z grid coordinates, strictly increasing
+        ray_origins: ray origins of shape [n_rays, 3], in units of grid_axes
+        ray_directions: ray directions of shape [n_rays, 3], normalized
+            internally
+        step_size: marching step, in units of grid_axes
+        ray_length: integration length of each ray, in units of grid_axes
+        fill_value: index of refraction outside the grid, 1.0 (default)
+        chunk_size: number of samples interpolated at once, 2**20 (default)
+
+    Returns:
+        Optical path length of each ray [n_rays] in units of grid_axes
+
+    Examples:
+        >> opl = optical_path_length_grid(n, (x, y, z), origins, [0, 0, 1], 1e-4, 0.1)
+
+        >> opd = optical_path_difference(opl_time_stack, avg_ax=0)
+    """
+    # Unit Test
+    if not isinstance(index_of_refraction, np.ndarray) or index_of_refraction.ndim != 3:
+        raise ValueError("Index of refraction must be a 3D numpy.ndarray")
+    if len(grid_axes) != 3:
+        raise ValueError("Grid axes must contain the x, y and z coordinates")
+    grid_axes = [np.asarray(axis, dtype=float) for axis in grid_axes]
+    if tuple(len(axis) for axis in grid_axes) != index_of_refraction.shape:
+        raise ValueError("Grid axes and index of refraction must have the same shape")
+    for axis in grid_axes:
+        if len(axis) < 2 or (np.diff(axis) <= 0).any():
+            raise ValueError("Grid axes must be strictly increasing")
+    ray_origins, ray_directions, distance, weights = _ray_samples(
+        ray_origins, ray_directions, step_size, ray_length
+    )
+
+    grid = _grid_lookup(grid_axes)
+    n_rays = ray_origins.shape[0]
+    samples_per_chunk = max(1, chunk_size // n_rays)
+    opl = np.zeros(n_rays)
+    for start in range(0, len(distance), samples_per_chunk):
+        stop = min(start + samples_per_chunk, len(distance))
+        # Positions [n_rays, samples, 3]
+        points = ray_origins[:, None, :] + (
+            distance[None, start:stop, None] * ray_directions[:, None, :]
+        )
+        samples = _trilinear_interpolation(
+            index_of_refraction, grid, points.reshape(-1, 3), fill_value
+        )
+        opl += samples.reshape(n_rays, -1) @ weights[start:stop]
+
+    return opl
+
+
+class UnstructuredRayTracer:
+    """
+    Ray tracer for cell-centred data on unstructured meshes. The spatial index
+    (KD-tree of the cell centres) is built once per mesh, and the path weights
+    of a ray bundle are built once per bundle, so every time step costs one
+    sparse matrix-vector product
+
+    Parameters:
+        cell_centers: cell centres of shape [n_cells, 3]
+        max_distance: samples further than this distance from every cell
+            centre are outside the mesh, None (default) uses the largest
+            distance between neighbouring cell centres
+        leafsize: KD-tree leaf size, 16 (default)
+
+    Examples:
+        >> tracer = UnstructuredRayTracer(mesh.cell_centers().points)
+
+        >> bundle = tracer.ray_bundle(origins, [0, 0, 1], 1e-4, 0.1)
+
+        >> opl = tracer.optical_path_length(n_cells, bundle)
+    """
+
+    def __init__(
+        self, cell_centers: np.ndarray, max_distance: float = None, leafsize: int = 16
+    ):
+        cell_centers = np.asarray(cell_centers, dtype=float)
+        if cell_centers.ndim != 2 or cell_centers.shape[1] != 3:
+            raise ValueError("Cell centres must have a shape of [n_cells, 3]")
+        if len(cell_centers) < 2:
+            raise ValueError("The mesh must contain at least two cells")
+        self.n_cells = len(cell_centers)
+        self.tree = scipy.spatial.cKDTree(cell_centers, leafsize=leafsize)
+        if max_distance is None:
+            neighbour_distance, _ = self.tree.query(cell_centers, k=2)
+            max_distance = neighbour_distance[:, 1].max()
+        if max_distance <= 0:
+            raise ValueError("Maximum distance must be greater than 0!")
+        self.max_distance = max_distance
+
+    def ray_bundle(
+        self,
+        ray_origins: np.ndarray,
+        ray_directions: np.ndarray,
+        step_size: float,
+        ray_length: float,
+        chunk_size: int = 2**20,
+        workers: int = 1,
+    ) -> dict:
+        """
+        Builds the path weights of a bundle of rays, samples are assigned to
+        their nearest cell centre and integrated using the trapezoidal rule
+
+        Parameters:
+            ray_origins: ray origins of shape [n_rays, 3], in mesh units
+            ray_directions: ray directions of shape [n_rays, 3], normalized
+                internally
+            step_size: marching step, in mesh units
+            ray_length: integration length of each ray, in mesh units
+            chunk_size: number of samples queried at once, 2**20 (default)
+            workers: KD-tree query workers, 1 (default), -1 uses all cores
+
+        Returns:
+            dict: A dictionary containing
+                - weights: sparse path length of each ray in each cell [n_rays, n_cells]
+                - outside_length: path length of each ray outside the mesh [n_rays]
+        """
+        ray_origins, ray_directions, distance, weights = _ray_samples(
+            ray_origins, ray_directions, step_size, ray_length
+        )
+        n_rays = ray_origins.shape[0]
+        samples_per_chunk = max(1, chunk_size // n_rays)
+        path_weights = scipy.sparse.csr_matrix((n_rays, self.n_cells))
+        outside_length = np.zeros(n_rays)
+        for start in range(0, len(distance), samples_per_chunk):
+            stop = min(start + samples_per_chunk, len(distance))
+            points = ray_origins[:, None, :] + (
+                distance[None, start:stop, None] * ray_directions[:, None, :]
+            )
+            _, cells = self.tree.query(
+                points.reshape(-1, 3),
+                k=1,
+                distance_upper_bound=self.max_distance,
+                workers=workers,
+            )
+            cells = cells.reshape(n_rays, -1)
+            sample_weights = np.broadcast_to(weights[start:stop], cells.shape)
+            rays = np.broadcast_to(np.arange(n_rays)[:, None], cells.shape)
+            # Missing neighbours are flagged with an index of n_cells
+            inside = cells < self.n_cells
+            outside_length += np.where(inside, 0.0, sample_weights).sum(axis=1)
+            path_weights += scipy.sparse.csr_matrix(
+                (sample_weights[inside], (rays[inside], cells[inside])),
+                shape=(n_rays, self.n_cells),
+            )
+
+        return {"weights": path_weights, "outside_length": outside_length}
+
+    def optical_path_length(
+        self, index_of_refraction: np.ndarray, ray_bundle: dict, fill_value: float = 1.0
+    ) -> np.ndarray:
+        """
+        Calculates the optical path length of a ray bundle through cell-centred
+        index of refraction data
+
+        Parameters:
+            index_of_refraction: index of refraction of shape [n_cells] or
+                [time, n_cells]
+            ray_bundle: ray bundle built with ray_bundle
+            fill_value: index of refraction outside the mesh, 1.0 (default)
+
+        Returns:
+            Optical path length of each ray [n_rays] or [time, n_rays], in mesh units
+        """
+        index_of_refraction = np.asarray(index_of_refraction)
+        if index_of_refraction.shape[-1] != self.n_cells:
+            raise ValueError("Index of refraction must have a value for each cell")
+        opl = ray_bundle["weights"] @ index_of_refraction.T
+        opl = opl.T + fill_value * ray_bundle["outside_length"]
+
+        return opl
+
+
+def slant_path_refraction(
+    lla_start: np.ndarray,
+    lla_end: np.ndarray,
+    n_samples: int = 1000,
+    altitude_step_m: float = 10.0,
+) -> dict[str, np.ndarray]:
+    """
+    Calculates the optical path length and apparent elevation of atmospheric
+    slant lines of sight (ex. airborne sensor to ground site), for many links
+    at once. Each link is sampled along its straight chord and the index of
+    refraction is evaluated from the cached standard atmosphere profile. The
+    bending is obtained from the refractivity gradient using the small angle
+    (chord) approximation, the optical path length error of the straight
+    chord is of second order (Fermat's principle)
+
+    Parameters:
+        lla_start: [latitude (deg), longitude (deg), altitude (m)] of the
+            observer, shape [3] or [n_links, 3]
+        lla_end: [latitude (deg), longitude (deg), altitude (m)] of the
+            target, shape [3] or [n_links, 3]
+        n_samples: samples along each link, 1000 (default)
+        altitude_step_m: altitude step of the cached atmosphere profile in
+            [m], 10.0 (default)
+
+    Returns:
+        dict: A dictionary containing
+            - optical_path_length: optical path length in [m]
+            - geometric_length: straight line distance in [m]
+            - geometric_elevation_deg: elevation of the target seen from the
+              observer, without refraction, in [degs]
+            - apparent_elevation_deg: elevation of the target seen from the
+              observer, with refraction, in [degs]
+
+    Examples:
+        >> slant_path_refraction([35.0, -106.0, 1600.0], [35.5, -106.0, 12e3])
+    """
+    # Unit Test
+    lla_start, lla_end = np.broadcast_arrays(
+        np.atleast_2d(np.asarray(lla_start, dtype=float)),
+        np.atleast_2d(np.asarray(lla_end, dtype=float)),
+    )
+    if lla_start.ndim != 2 or lla_start.shape[1] != 3:
+        raise ValueError("LLA positions must have a shape of [n_links, 3]")
+    if n_samples < 2:
+        raise ValueError("Number of samples must be at least 2!")
+
+    # Straight chords in ECEF [n_links, 3]
+    ecef_start = coordinates.lla_to_ecef(*lla_start.T).T
+    chord = coordinates.lla_to_ecef(*lla_end.T).T - ecef_start
+    geometric_length = np.linalg.norm(chord, axis=1)
+    if (geometric_length == 0).any():
+        raise ValueError("Link end points must be different!")
+    direction = chord / geometric_length[:, None]
+
+    # Samples along the chords [n_links, n_samples]
+    fraction = np.linspace(0.0, 1.0, n_samples)
+    points = ecef_start[:, None, :] + fraction[None, :, None] * chord[:, None, :]
+    latitude_deg, longitude_deg, altitude_m = coordinates.ecef_to_lla(
+        points.reshape(-1, 3).T
+    )
+    up = _geodetic_up(latitude_deg, longitude_deg).reshape(points.shape)
+    altitude_m = altitude_m.reshape(points.shape[:2])
+
+    # Index of refraction and its vertical gradient, n = 1 above the profile
+    profile = optics.atmospheric_profile(altitude_step_m)
+    altitude_top = profile["altitude_m"][-1]
+    if (altitude_m < profile["altitude_m"][0]).any():
+        raise ValueError("Line of sight must stay above -4996 meters!")
+    inside = altitude_m <= altitude_top
+    index = np.ones_like(altitude_m)
+    gradient = np.zeros_like(altitude_m)
+    altitude_inside = altitude_m[inside]
+    index[inside] = optics.atmospheric_index_of_refraction_profile(
+        altitude_inside, altitude_step_m=altitude_step_m
+    )
+    altitude_upper = np.minimum(altitude_inside + altitude_step_m, altitude_top)
+    altitude_lower = np.maximum(
+        altitude_inside - altitude_step_m, profile["altitude_m"][0]
+    )
+    gradient[inside] = optics.atmospheric_index_of_refraction_profile(
+        altitude_upper, altitude_step_m=altitude_step_m
+    )
+    gradient[inside] -= optics.atmospheric_index_of_refraction_profile(
+        altitude_lower, altitude_step_m=altitude_step_m
+    )
+    gradient[inside] /= altitude_upper - altitude_lower  # [1/m]
+
+    # Trapezoidal weights along the chords
+    weights = np.full(n_samples, 1.0 / (n_samples - 1))
+    weights[[0, -1]] *= 0.5
+    optical_path_length = (index @ weights) * geometric_length
+
+    # Ray curvature, normal component of grad(n) / n [n_links, n_samples, 3]
+    curvature = (gradient / index)[:, :, None] * up
+    curvature -= (
+        np.einsum("lsk,lk->ls", curvature, direction)[:, :, None]
+        * direction[:, None, :]
+    )
+    # Tangent deviation at the observer, -int k(s) (L - s) / L ds, s = f L
+    deviation = -np.einsum("lsk,s->lk", curvature, weights * (1.0 - fraction))
+    deviation *= geometric_length[:, None]
+    apparent = direction + deviation
+    apparent /= np.linalg.norm(apparent, axis=1, keepdims=True)
+
+    up_start = up[:, 0, :]
+    return {
+        "optical_path_length": optical_path_length,  # [m]
+        "geometric_length": geometric_length,  # [m]
+        "geometric_elevation_deg": np.degrees(
+            np.arcsin(np.einsum("lk,lk->l", up_start, direction))
+        ),
+        "apparent_elevation_deg": np.degrees(
+            np.arcsin(np.einsum("lk,lk->l", up_start, apparent))
+        ),
+    }
+
+
+def _geodetic_up(latitude_deg: np.ndarray, longitude_deg: np.ndarray) -> np.ndarray:
+    """
+    Helper function that returns the local up (geodetic normal) unit vector in
+    ECEF of shape [n_points, 3]
+    """
+    latitude_rad = np.deg2rad(latitude_deg)
+    longitude_rad = np.deg2rad(longitude_deg)
+    return np.stack(
+        [
+            np.cos(latitude_rad) * np.cos(longitude_rad),
+            np.cos(latitude_rad) * np.sin(longitude_rad),
+            np.sin(latitude_rad),
+        ],
+        axis=-1,
+    )
+
+
+def _ray_samples(
+    ray_origins: np.ndarray,
+    ray_directions: np.ndarray,
+    step_size: float,
+    ray_length: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Helper function to validate a ray bundle, returns normalized rays, the
+    sample distances along the rays and their trapezoidal weights
+    """
+    if step_size <= 0:
+        raise ValueError("Step size must be greater than 0!")
+    if ray_length <= 0:
+        raise ValueError("Ray length must be greater than 0!")
+    ray_origins, ray_directions = np.broadcast_arrays(
+        np.atleast_2d(np.asarray(ray_origins, dtype=float)),
+        np.atleast_2d(np.asarray(ray_directions, dtype=float)),
+    )
+    if ray_origins.shape[-1] != 3 or ray_origins.ndim != 2:
+        raise ValueError("Rays must have a shape of [n_rays, 3]")
+    norm = np.linalg.norm(ray_directions, axis=1, keepdims=True)
+    if (norm == 0).any():
+        raise ValueError("Ray directions must be non-zero vectors")
+    ray_directions = ray_directions / norm
+
+    # Samples along the rays, t_k = k * step_size, last step is partial
+    n_steps = int(np.ceil(ray_length / step_size))
+    distance = np.minimum(np.arange(n_steps + 1) * step_size, ray_length)
+    # Trapezoidal weights
+    delta = np.diff(distance)
+    weights = np.zeros_like(distance)
+    weights[:-1] += 0.5 * delta
+    weights[1:] += 0.5 * delta
+
+    return ray_origins, ray_directions, distance, weights
+
+
+def _grid_lookup(grid_axes: list[np.ndarray]) -> list[tuple]:
+    """
+    Helper function that stores, for each axis, its coordinates and uniform
+    spacing (None for rectilinear axes)
+    """
+    grid = []
+    for axis in grid_axes:
+        spacing = (axis[-1] - axis[0]) / (len(axis) - 1)
+        uniform = np.allclose(np.diff(axis), spacing, rtol=1e-10, atol=0.0)
+        grid.append((axis, spacing if uniform else None))
+
+    return grid
+
+
+def _trilinear_interpolation(
+    field: np.ndarray, grid: list[tuple], points: np.ndarray, fill_value: float
+) -> np.ndarray:
+    """
+    Helper function to trilinearly interpolate a structured field at points
+    of shape [n_points, 3]
+    """
+    inside = np.ones(len(points), dtype=bool)
+    lower = []
+    fraction = []
+    for dim, (axis, spacing) in enumerate(grid):
+        coord = points[:, dim]
+        inside &= (coord >= axis[0]) & (coord <= axis[-1])
+        if spacing is not None:
+            indx = np.floor((coord - axis[0]) / spacing)
+            indx = np.clip(indx, 0, len(axis) - 2, out=indx).astype(np.intp)
+        else:
+            indx = np.searchsorted(axis, coord, side="right") - 1
+            indx = np.clip(indx, 0, len(axis) - 2, out=indx)
+        lower.append(indx)
+        fraction.append((coord - axis[indx]) / (axis[indx + 1] - axis[indx]))
+
+    i, j, k = lower
+    fx, fy, fz = fraction
+    value = np.zeros(len(points))
+    for di, wx in ((0, 1 - fx), (1, fx)):
+        for dj, wy in ((0, 1 - fy), (1, fy)):
+            wxy = wx * wy
+            for dk, wz in ((0, 1 - fz), (1, fz)):
+                value += wxy * wz * field[i + di, j + dj, k + dk]
+    value[~inside] = fill_value
+
+    return value
+
+
+instrument_module(globals())
@@ -0,0 +1,204 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   species.py
+Def:    Contains a cached registry of species properties.
+"""
+
+import functools
+from types import MappingProxyType
+import molmass
+from haot import constants as constants_tables
+
+# Resolved species properties, {name: properties}
+_REGISTRY = {}
+# Caches built on top of the registry, cleared when a species changes
+_DEPENDENT_CACHES = []
+
+
+def species_properties(species: str) -> MappingProxyType:
+    """
+    Returns the properties of a species. Properties are resolved once, from
+    molmass and haot.constants, and then served from memory
+
+    Parameters:
+        species: species name. Ex N2, O2, NO+, Air
+
+    Returns:
+        dict: A read-only dictionary containing
+            - molar_mass: molar mass in [g/mol]
+            - charge: charge in [e]
+            - polarizability: volumetric polarizability in [cm^3], None if
+              not available
+            - kerl: Kerl's extrapolation constants, None if not available
+            - spectroscopy: spectroscopy constants, None if not available
+
+    Examples:
+        >> species_properties('N2')['molar_mass']
+    """
+    try:
+        return _REGISTRY[species]
+    except KeyError:
+        properties = MappingProxyType(_resolve_species(species))
+        _REGISTRY[species] = properties
+        return properties
+
+
+def species_molar_mass(species: str) -> float:
+    """
+    Returns the molar mass of a species
+
+    Parameters:
+        species: species name. Ex N2, O2, NO+, Air
+
+    Returns:
+        molar mass in [g/mol]
+
+    Examples:
+        >> species_molar_mass('NO+')
+    """
+    return species_properties(species)["molar_mass"]
+
+
+def air_molar_mass() -> float:
+    """
+    Returns the molar mass of air, 0.78 N2 + 0.21 O2 + 0.01 Ar
+
+    Returns:
+        molar mass in [g/mol]
+    """
+    return species_properties("Air")["molar_mass"]
+
+
+def register_species(
+    species: str,
+    molar_mass: float = None,
+    charge: int = None,
+    polarizability: float = None,
+    kerl: dict[str, float] = None,
+    spectroscopy: dict[str, float] = None,
+):
+    """
+    Registers a user defined species, or overrides the properties of a known
+    species. Properties that are not provided are resolved from molmass and
+    haot.constants when possible
+
+    Parameters:
+        species: species name
+        molar_mass: molar mass in [g/mol], None (default)
+        charge: charge in [e], None (default)
+        polarizability: volumetric polarizability in [cm^3], None (default)
+        kerl: Kerl's extrapolation constants, see
+            haot.constants.kerl_interpolation, None (default)
+        spectroscopy: spectroscopy constants, see
+            haot.constants.spectroscopy_constants, None (default)
+
+    Examples:
+        >> register_species('Ar', polarizability=1.6411e-24)
+
+        >> register_species('Mix', molar_mass=28.6, polarizability=1.7e-24)
+    """
+    if molar_mass is not None and molar_mass <= 0:
+        raise ValueError("Molar mass must be greater than 0!")
+    try:
+        properties = _resolve_species(species)
+    except ValueError:
+        if molar_mass is None:
+            raise
+        properties = {
+            "molar_mass": None,
+            "charge": 0,
+            "polarizability": None,
+            "kerl": None,
+            "spectroscopy": None,
+        }
+
+    overrides = {
+        "molar_mass": molar_mass,
+        "charge": charge,
+        "polarizability": polarizability,
+        "kerl": kerl,
+        "spectroscopy": spectroscopy,
+    }
+    for key, val in overrides.items():
+        if val is not None:
+            properties[key] = dict(val) if isinstance(val, dict) else val
+
+    _REGISTRY[species] = MappingProxyType(properties)
+    _clear_dependent_caches()
+
+
+def unregister_species(species: str):
+    """
+    Removes a species from the registry, known species are resolved again
+    on their next use
+
+    Parameters:
+        species: species name
+    """
+    _REGISTRY.pop(species, None)
+    _clear_dependent_caches()
+
+
+def species_cache(func=None, maxsize: int = None):
+    """
+    Decorator that caches a function of species names, the cache is cleared
+    whenever the registry changes
+
+    Parameters:
+        func: function to cache
+        maxsize: calls kept in the cache, None (default) keeps every call
+
+    Examples:
+        >> @species_cache
+        >> def _coefficients(species): ...
+
+        >> @species_cache(maxsize=32)
+        >> def _levels(species, vibrational_number): ...
+    """
+    if func is None:
+        return functools.partial(species_cache, maxsize=maxsize)
+    cached_func = functools.lru_cache(maxsize=maxsize)(func)
+    _DEPENDENT_CACHES.append(cached_func)
+
+    return cached_func
+
+
+def _clear_dependent_caches():
+    """
+    Helper function to clear caches built on top of the registry
+    """
+    for cached_func in _DEPENDENT_CACHES:
+        cached_func.cache_clear()
+
+
+def _resolve_species(species: str) -> dict:
+    """
+    Helper function to resolve the properties of a species
+    """
+    if species == "Air":
+        molar_mass = (
+            0.78 * molmass.Formula("N2").mass
+            + 0.21 * molmass.Formula("O2").mass
+            + 0.01 * molmass.Formula("Ar").mass
+        )
+        charge = 0
+    else:
+        try:
+            formula = molmass.Formula(species)
+            molar_mass = formula.mass
+            charge = formula.charge
+        except molmass.FormulaError as err:
+            raise ValueError(f"Unknown species '{species}'!") from err
+
+    polarizability = constants_tables.polarizability().get(species)  # [cm^3]
+    kerl = constants_tables.kerl_interpolation(species)
+    spectroscopy = constants_tables.spectroscopy_constants(species)
+
+    return {
+        "molar_mass": molar_mass,  # [g/mol]
+        "charge": charge,
+        "polarizability": polarizability,
+        "kerl": kerl or None,
+        "spectroscopy": spectroscopy or None,
+    }
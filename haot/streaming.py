@@ -0,0 +1,94 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   streaming.py
+Def:    Contains the frame streams and online statistics shared by the
+        out-of-core functions.
+"""
+
+import numpy as np
+
+
+def chunked_frames(array: np.ndarray, chunk_size: int):
+    """
+    Yields chunks of chunk_size entries along the first axis of an array,
+    views of the array (ex. a numpy.memmap) that are read on first use
+
+    Parameters:
+        array: numpy array of shape [time, ...]
+        chunk_size: entries of the first axis per chunk
+
+    Examples:
+        >> for chunk in chunked_frames(np.load('opd.npy', mmap_mode='r'), 16):
+        >>     ...
+    """
+    for i in range(0, array.shape[0], chunk_size):
+        yield array[i : i + chunk_size]
+
+
+def grouped_frames(frames, chunk_size: int):
+    """
+    Yields an iterable of frames stacked into chunks of chunk_size frames,
+    the last chunk holds the remaining frames
+
+    Parameters:
+        frames: iterable of equal shape frames, ex. a generator
+        chunk_size: frames per chunk
+
+    Examples:
+        >> for chunk in grouped_frames(frame_generator(), 16):
+        >>     ...
+    """
+    group = []
+    for frame in frames:
+        group.append(frame)
+        if len(group) == chunk_size:
+            yield np.stack(group)
+            group = []
+    if group:
+        yield np.stack(group)
+
+
+def welford_frames(chunks) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Accumulates the count, mean and sum of squared deviations along the
+    first axis of a stream of chunks, with Welford's online algorithm merged
+    chunk by chunk and float64 accumulators. Only one chunk is in memory at
+    a time
+
+    Parameters:
+        chunks: iterable of arrays of shape [time, ...], ex. chunked_frames
+            or grouped_frames
+
+    Returns:
+        count: number of frames
+        mean: mean frame, shape [...]
+        sum_squares: sum of squared deviations from the mean, shape [...]
+
+    Examples:
+        >> count, mean, sum_squares = welford_frames(chunked_frames(opd, 16))
+
+        >> variance = sum_squares / count
+    """
+    count = 0
+    mean = None
+    sum_squares = None
+    for chunk in chunks:
+        chunk_count = chunk.shape[0]
+        chunk_mean = np.mean(chunk, axis=0, dtype=np.float64)
+        chunk_squares = np.var(chunk, axis=0, dtype=np.float64) * chunk_count
+        if mean is None:
+            count, mean, sum_squares = (chunk_count, chunk_mean, chunk_squares)
+            continue
+        total = count + chunk_count
+        delta = chunk_mean - mean
+        mean += delta * (chunk_count / total)
+        delta **= 2
+        delta *= count * chunk_count / total
+        sum_squares += chunk_squares
+        sum_squares += delta
+        count = total
+    if mean is None:
+        raise ValueError("opd must contain at least one frame")
+
+    return count, mean, sum_squares
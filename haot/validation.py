@@ -0,0 +1,162 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   validation.py
+Def:    Contains the input checks shared by the HAOT modules.
+"""
+
+import contextlib
+import threading
+import numpy as np
+
+
+class _Policy(threading.local):
+    """
+    Helper class of the input checks switch, one per thread
+    """
+
+    enabled = True
+
+
+# Input checks switch of each thread, trusted() turns it off
+_POLICY = _Policy()
+# Scalars checked without NumPy
+_SCALARS = (int, float, np.generic)
+
+
+def set_validation(enabled: bool):
+    """
+    Enables or disables the input checks of the HAOT functions (ranges and
+    supported species). Disabled checks save a pass over each field and a
+    few microseconds per scalar call, invalid inputs then return invalid
+    results instead of raising ValueError. The setting applies to the
+    calling thread (and to the chunks of its field functions), other threads
+    keep checking inputs
+
+    Parameters:
+        enabled: True (default) checks inputs, False trusts them
+
+    Examples:
+        >> set_validation(False)
+    """
+    _POLICY.enabled = bool(enabled)
+
+
+def get_validation() -> bool:
+    """
+    Returns whether inputs are checked in the calling thread
+
+    Returns:
+        True or False
+    """
+    return _POLICY.enabled
+
+
+@contextlib.contextmanager
+def trusted():
+    """
+    Context manager that skips the input checks of its block, for inputs
+    already validated upstream, and restores the previous setting on exit.
+    Only calls from the calling thread are trusted
+
+    Examples:
+        >> with trusted():
+        >>     for T in temperature_snapshots:
+        >>         viscosity = sutherland_law_viscosity(T)
+    """
+    previous = _POLICY.enabled
+    _POLICY.enabled = False
+    try:
+        yield
+    finally:
+        _POLICY.enabled = previous
+
+
+def check_nonnegative(value, message: str):
+    """
+    Raises ValueError if a scalar or any element of an array is negative.
+    Arrays are checked in a single pass, without temporary arrays
+
+    Parameters:
+        value: scalar, numpy.ndarray or array like
+        message: error message
+
+    Examples:
+        >> check_nonnegative(temperature_K, "Temperature must be greater than 0 Kelvin!")
+    """
+    if _POLICY.enabled and _minimum(value) < 0:
+        raise ValueError(message)
+
+
+def check_positive(value, message: str):
+    """
+    Raises ValueError if a scalar or any element of an array is zero or
+    negative. Arrays are checked in a single pass, without temporary arrays
+
+    Parameters:
+        value: scalar, numpy.ndarray or array like
+        message: error message
+
+    Examples:
+        >> check_positive(wavelength_nm, "Wavelength must be greater than 0 nanometers!")
+    """
+    if _POLICY.enabled and _minimum(value) <= 0:
+        raise ValueError(message)
+
+
+def check_range(value, lower: float, upper: float, message: str):
+    """
+    Raises ValueError if a scalar or any element of an array is outside of
+    [lower, upper]
+
+    Parameters:
+        value: scalar, numpy.ndarray or array like
+        lower: lower bound
+        upper: upper bound
+        message: error message
+
+    Examples:
+        >> check_range(altitude_m, -4996, 81020, "Altitude must be between -4996 and 81020 meters!")
+    """
+    if not _POLICY.enabled:
+        return
+    if isinstance(value, _SCALARS):
+        out_of_range = value < lower or value > upper
+    else:
+        value = np.asarray(value)
+        out_of_range = value.size > 0 and (value.min() < lower or value.max() > upper)
+    if out_of_range:
+        raise ValueError(message)
+
+
+def check_species(species: str, supported: frozenset, message: str):
+    """
+    Raises ValueError if a species is not supported
+
+    Parameters:
+        species: species name
+        supported: supported species, a frozenset for a constant time lookup
+        message: error message
+
+    Examples:
+        >> check_species(molecule, frozenset({"N2", "O2"}), "This function only supports N2 or O2")
+    """
+    if not _POLICY.enabled:
+        return
+    try:
+        is_supported = species in supported
+    except TypeError:  # unhashable species, ex. a list
+        is_supported = False
+    if not is_supported:
+        raise ValueError(message)
+
+
+def _minimum(value):
+    """
+    Helper function that returns the minimum of a scalar or array, +inf for
+    empty arrays
+    """
+    if isinstance(value, _SCALARS):
+        return value
+    value = np.asarray(value)
+    return value.min() if value.size else np.inf
@@ -0,0 +1,96 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   workspace.py
+Def:    Contains pre-allocated buffers reused by elementwise functions.
+"""
+
+import numpy as np
+
+
+class Workspace:
+    """
+    Named buffers reused across calls of elementwise functions. Functions
+    that take a workspace store their results (and scratch arrays) in it
+    when out is not provided, so repeated calls on fields of the same shape
+    do not allocate memory. Results returned from a workspace are
+    overwritten by the next call of the same function, copy them to keep
+    them
+
+    Examples:
+        >> work = Workspace()
+
+        >> for temperature in snapshots:
+        >>     viscosity = sutherland_law_viscosity(temperature, workspace=work)
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def buffer(
+        self, name: str, shape: tuple[int, ...], dtype: type = np.float64
+    ) -> np.ndarray:
+        """
+        Returns the buffer of a given name, allocates it the first time or
+        when its shape or data type changes
+
+        Parameters:
+            name: buffer name, ex. 'sutherland_law_viscosity'
+            shape: buffer shape
+            dtype: buffer data type, np.float64 (default)
+
+        Returns:
+            uninitialized buffer
+        """
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory held by the workspace in [bytes]
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self):
+        """
+        Releases all buffers
+        """
+        self._buffers.clear()
+
+
+def work_buffer(
+    name: str,
+    shape: tuple[int, ...],
+    dtype: type = np.float64,
+    out: np.ndarray = None,
+    workspace: Workspace = None,
+) -> np.ndarray:
+    """
+    Returns the array where an elementwise function stores a result, out if
+    provided, a workspace buffer, or a new array
+
+    Parameters:
+        name: buffer name in the workspace
+        shape: result shape
+        dtype: result data type, np.float64 (default)
+        out: user provided array, None (default)
+        workspace: Workspace, None (default)
+
+    Returns:
+        uninitialized array of the given shape
+    """
+    if out is not None:
+        if not isinstance(out, np.ndarray) or out.shape != tuple(shape):
+            raise ValueError(f"out must be a numpy array of shape {tuple(shape)}")
+        if not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("out must be a floating point array")
+        return out
+    if workspace is not None:
+        return workspace.buffer(name, shape, dtype)
+    return np.empty(shape, dtype=dtype)
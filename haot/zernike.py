@@ -0,0 +1,257 @@
+"""
+Date:   10/18/2026
+Author: Martin E. Liza
+File:   zernike.py
+Def:    Contains Zernike decomposition functions for wavefronts.
+"""
+
+import math
+import numpy as np
+from haot.instrumentation import instrument_module
+
+
+def zernike_noll_to_nm(noll_index: int) -> tuple[int, int]:
+    """
+    Converts a Noll index to radial and azimuthal Zernike orders
+
+    Parameters:
+        noll_index: Noll index (has to be positive), 1 is piston, 2 and 3 are
+            tip and tilt, 4 is focus
+
+    Returns:
+        radial order n and azimuthal order m
+
+    Examples:
+        >> zernike_noll_to_nm(4)
+
+    Reference:
+        Zernike polynomials and atmospheric turbulence
+        (https://doi.org/10.1364/JOSA.66.000207)
+    """
+    if not isinstance(noll_index, (int, np.integer)) or noll_index < 1:
+        raise ValueError("Noll index should be a positive integer!")
+    n = 0
+    while (n + 1) * (n + 2) // 2 < noll_index:
+        n += 1
+    # Azimuthal orders of radial order n, |m| = n % 2, n % 2 + 2, ..., n
+    k = noll_index - n * (n + 1) // 2 - 1
+    m = n % 2 + 2 * ((k + (n + 1) % 2) // 2)
+    if noll_index % 2:
+        m = -m
+    return n, m
+
+
+def zernike_polynomial(
+    noll_index: int, radius: np.ndarray, angle_rad: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates a Noll normalized Zernike polynomial on the unit disk
+
+    Parameters:
+        noll_index: Noll index (has to be positive)
+        radius: normalized radius, between 0 and 1
+        angle_rad: azimuthal angle in [rads]
+
+    Returns:
+        Zernike polynomial evaluated at (radius, angle_rad)
+
+    Examples:
+        >> zernike_polynomial(4, rho, theta)
+
+    Reference:
+        Zernike polynomials and atmospheric turbulence
+        (https://doi.org/10.1364/JOSA.66.000207)
+    """
+    n, m = zernike_noll_to_nm(noll_index)
+    m_abs = abs(m)
+
+    # Radial polynomial
+    radial = np.zeros(np.shape(radius))
+    for k in range((n - m_abs) // 2 + 1):
+        coefficient = (-1) ** k * math.factorial(n - k)
+        coefficient /= (
+            math.factorial(k)
+            * math.factorial((n + m_abs) // 2 - k)
+            * math.factorial((n - m_abs) // 2 - k)
+        )
+        radial += coefficient * radius ** (n - 2 * k)
+
+    if m == 0:
+        return np.sqrt(n + 1) * radial
+    if m > 0:
+        return np.sqrt(2 * (n + 1)) * radial * np.cos(m_abs * angle_rad)
+    return np.sqrt(2 * (n + 1)) * radial * np.sin(m_abs * angle_rad)
+
+
+def circular_aperture(grid_shape: tuple[int, int]) -> np.ndarray:
+    """
+    Calculates the largest circular aperture inscribed in a grid
+
+    Parameters:
+        grid_shape: grid shape [x_axis, y_axis]
+
+    Returns:
+        boolean mask of shape grid_shape, True inside the aperture
+
+    Examples:
+        >> circular_aperture((128, 128))
+    """
+    if len(grid_shape) != 2:
+        raise ValueError("Grid shape must be [x_axis, y_axis]")
+    x, y = _normalized_grid(grid_shape)
+    return np.hypot(x, y) <= 1.0
+
+
+def _normalized_grid(grid_shape: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function that returns grid coordinates normalized to [-1, 1]
+    """
+    return np.meshgrid(
+        np.linspace(-1.0, 1.0, grid_shape[0]),
+        np.linspace(-1.0, 1.0, grid_shape[1]),
+        indexing="ij",
+    )
+
+
+class ZernikeBasis:
+    """
+    Zernike basis over a circular aperture on a regular grid. The basis is
+    evaluated once and orthonormalised over the aperture mask (QR
+    decomposition), with unit RMS over the aperture points, so coefficients
+    are RMS wavefront amplitudes independent of the grid resolution. Whole
+    [time, x_axis, y_axis] wavefront stacks are decomposed, reconstructed or
+    filtered with one matrix product
+
+    Parameters:
+        grid_shape: wavefront grid shape [x_axis, y_axis]
+        n_modes: number of Noll modes, starting at piston
+        mask: boolean aperture mask of shape grid_shape, None (default) uses
+            the largest circle inscribed in the grid
+
+    Examples:
+        >> basis = ZernikeBasis((128, 128), 15)
+
+        >> coefficients = basis.decompose(opd)
+
+        >> opd_high_order = basis.remove_modes(opd, [1, 2, 3])
+    """
+
+    def __init__(
+        self, grid_shape: tuple[int, int], n_modes: int, mask: np.ndarray = None
+    ):
+        if len(grid_shape) != 2:
+            raise ValueError("Grid shape must be [x_axis, y_axis]")
+        if not isinstance(n_modes, (int, np.integer)) or n_modes < 1:
+            raise ValueError("Number of modes should be a positive integer!")
+        self.grid_shape = tuple(grid_shape)
+        self.n_modes = n_modes
+
+        # Normalized polar coordinates of the grid
+        x, y = _normalized_grid(self.grid_shape)
+        radius = np.hypot(x, y)
+        if mask is None:
+            mask = radius <= 1.0
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != self.grid_shape:
+            raise ValueError("Mask must have the grid shape")
+        if mask.sum() < n_modes:
+            raise ValueError("The aperture must have more points than modes")
+        self.mask = mask
+
+        # Basis sampled on the aperture [n_points, n_modes]
+        radius = radius[mask] / radius[mask].max()
+        angle_rad = np.arctan2(y[mask], x[mask])
+        modes = np.stack(
+            [zernike_polynomial(j, radius, angle_rad) for j in range(1, n_modes + 1)],
+            axis=1,
+        )
+        # Orthonormal over the aperture, mean(Z_i Z_j) = delta_ij, signs
+        # follow the analytic modes
+        q, r = np.linalg.qr(modes)
+        q *= np.sign(np.diag(r)) * np.sqrt(q.shape[0])
+        self.basis = q
+        self.basis.flags.writeable = False
+
+    def decompose(self, wavefront: np.ndarray) -> np.ndarray:
+        """
+        Projects wavefronts onto the orthonormal Zernike modes
+
+        Parameters:
+            wavefront: wavefront (ex. OPD) of shape [x_axis, y_axis] or
+                [time, x_axis, y_axis]
+
+        Returns:
+            modal coefficients of shape [n_modes] or [time, n_modes], RMS
+            amplitudes in units of wavefront
+        """
+        return self._aperture_values(wavefront) @ self.basis / self.basis.shape[0]
+
+    def reconstruct(
+        self, coefficients: np.ndarray, modes: list[int] = None
+    ) -> np.ndarray:
+        """
+        Builds wavefronts from modal coefficients, points outside the
+        aperture are set to zero
+
+        Parameters:
+            coefficients: modal RMS amplitudes of shape [n_modes] or
+                [time, n_modes]
+            modes: Noll indices to include, None (default) includes all
+
+        Returns:
+            wavefront of shape [x_axis, y_axis] or [time, x_axis, y_axis]
+        """
+        coefficients = np.asarray(coefficients, dtype=float)
+        if coefficients.shape[-1] != self.n_modes:
+            raise ValueError("Coefficients must have a value for each mode")
+        basis = self.basis
+        if modes is not None:
+            columns = self._mode_columns(modes)
+            basis = basis[:, columns]
+            coefficients = coefficients[..., columns]
+        wavefront = np.zeros(coefficients.shape[:-1] + self.grid_shape)
+        wavefront[..., self.mask] = coefficients @ basis.T
+
+        return wavefront
+
+    def remove_modes(self, wavefront: np.ndarray, modes: list[int]) -> np.ndarray:
+        """
+        Removes Zernike modes from wavefronts (ex. piston, tip and tilt),
+        points outside the aperture are set to zero
+
+        Parameters:
+            wavefront: wavefront of shape [x_axis, y_axis] or
+                [time, x_axis, y_axis]
+            modes: Noll indices to remove
+
+        Returns:
+            wavefront without the selected modes, same shape as wavefront
+        """
+        basis = self.basis[:, self._mode_columns(modes)]
+        values = self._aperture_values(wavefront)
+        values = values - (values @ basis / self.basis.shape[0]) @ basis.T
+        filtered = np.zeros(np.shape(wavefront))
+        filtered[..., self.mask] = values
+
+        return filtered
+
+    def _aperture_values(self, wavefront: np.ndarray) -> np.ndarray:
+        """
+        Helper method that returns the wavefront values inside the aperture
+        """
+        wavefront = np.asarray(wavefront)
+        if wavefront.shape[-2:] != self.grid_shape:
+            raise ValueError("Wavefront must have the grid shape")
+        return wavefront[..., self.mask]
+
+    def _mode_columns(self, modes: list[int]) -> list[int]:
+        """
+        Helper method that converts Noll indices to basis columns
+        """
+        for j in modes:
+            if not 1 <= j <= self.n_modes:
+                raise ValueError(f"Noll index {j} is not in the basis")
+        return [j - 1 for j in modes]
+
+
+instrument_module(globals())
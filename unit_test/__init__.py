@@ -1,3 +1,20 @@
 from .test_aerodynamics import *
 from .test_optics import *
 from .test_quantum_mechanics import *
+from .test_coordinates import *
+from .test_species import *
+from .test_precision import *
+from .test_workspace import *
+from .test_streaming import *
+from .test_parallel import *
+from .test_batch import *
+from .test_kernels import *
+from .test_instrumentation import *
+from .test_validation import *
+from .test_package import *
+from .test_benchmarks import *
+from .test_ray_tracing import *
+from .test_zernike import *
+from .test_far_field import *
+from .test_pipeline import *
+from .test_openfoam import *
@@ -31,6 +31,20 @@ class TestAerodynamics(unittest.TestCase):
         with self.assertRaises(ValueError):
             sutherland_law_viscosity(self.sea_level_temperature, "H2")
 
+    def test_sutherland_law_viscosity_out(self):
+        """Test viscosity of a temperature array written to out."""
+        temperature = np.full(4, self.sea_level_temperature)
+        out = np.empty(4)
+        result = sutherland_law_viscosity(temperature, "Air", out=out)
+        self.assertIs(result, out)
+        expected = sutherland_law_viscosity(self.sea_level_temperature, "Air")
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+
+    def test_sutherland_law_viscosity_invalid_out(self):
+        """Test that out arrays of the wrong shape raise a ValueError."""
+        with self.assertRaises(ValueError):
+            sutherland_law_viscosity(np.ones(4) * 300.0, out=np.empty(3))
+
     # Test sutherland_law_viscosity #
 
     # Test sutherland_law_conductivity #
@@ -143,8 +157,56 @@ class TestAerodynamics(unittest.TestCase):
         with self.assertRaises(ValueError):
             isentropic_relations(self.negative_mach)
 
+    def test_isentropic_relations_array_out(self):
+        """Test isentropic relations of Mach arrays written to out arrays."""
+        mach_1 = np.array([self.low_mach, self.valid_mach, self.high_mach])
+        out = {"pressure_s": np.empty(3)}
+        result = isentropic_relations(mach_1, out=out)
+        self.assertIs(result["pressure_s"], out["pressure_s"])
+        for i, mach in enumerate(mach_1):
+            expected = isentropic_relations(float(mach))
+            for key, val in expected.items():
+                self.assertAlmostEqual(result[key][i], val, places=10)
+
+    def test_isentropic_relations_array_gamma(self):
+        """Test isentropic relations of an adiabatic index array."""
+        adiabatic_indx = np.array([1.3, 1.4])
+        result = isentropic_relations(self.valid_mach, adiabatic_indx)
+        for i, gamma in enumerate(adiabatic_indx):
+            expected = isentropic_relations(self.valid_mach, float(gamma))
+            for key, val in expected.items():
+                self.assertEqual(result[key].shape, (2,))
+                self.assertAlmostEqual(result[key][i], val, places=10)
+
     # Test isentropic relations #
 
+    # Test normal shock relations #
+    def test_normal_shock_relations_workspace(self):
+        """Test that a workspace reuses its buffers across calls."""
+        mach_1 = np.linspace(1.5, self.high_mach, 5)
+        work = Workspace()
+        first = normal_shock_relations(mach_1, workspace=work)
+        memory = work.nbytes
+        second = normal_shock_relations(mach_1, workspace=work)
+        self.assertEqual(work.nbytes, memory)
+        self.assertIs(first["mach_2"], second["mach_2"])
+        expected = normal_shock_relations(self.valid_mach)
+        result = normal_shock_relations(np.array([self.valid_mach]), workspace=work)
+        for key, val in expected.items():
+            self.assertAlmostEqual(result[key][0], val, places=10)
+
+    def test_normal_shock_relations_array_gamma(self):
+        """Test normal shock relations of an adiabatic index array."""
+        adiabatic_indx = np.array([1.3, 1.4])
+        result = normal_shock_relations(self.valid_mach, adiabatic_indx)
+        for i, gamma in enumerate(adiabatic_indx):
+            expected = normal_shock_relations(self.valid_mach, float(gamma))
+            for key, val in expected.items():
+                self.assertEqual(result[key].shape, (2,))
+                self.assertAlmostEqual(result[key][i], val, places=10)
+
+    # Test normal shock relations #
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import numpy as np
+from haot.batch import *
+from haot import optics
+
+
+def _snapshot_statistics(snapshot):
+    """Optical path difference RMS and Strehl ratio of a snapshot."""
+    index = optics.index_of_refraction_density_temperature(
+        snapshot["temperature_K"], snapshot["mass_density"]
+    )["dense"]
+    opl = index.sum(axis=-1) * 1e-3
+    opd_rms = np.std(opl)
+    variance = optics.phase_variance(opd_rms, 633.0)
+    return {
+        "opd_rms": opd_rms,
+        "strehl_ratio": optics.strehl_ratio(variance),
+        "mean_opl": opl.mean(axis=1),
+    }
+
+
+def _snapshot_negative(snapshot):
+    """Raises an error on the last snapshot."""
+    return {
+        "polarizability": optics.kerl_polarizability_temperature(
+            snapshot["temperature_K"] - 400.0, "N2", 633.0
+        )
+    }
+
+
+def _snapshot_shapes(snapshot):
+    """Returns a shorter result after the first snapshot."""
+    x = snapshot["x"]
+    return {"value": x if x[0] == 0 else x[:1]}
+
+
+def _snapshot_types(snapshot):
+    """Returns an integer on the first snapshot and floats after it."""
+    x = snapshot["x"]
+    return {"value": int(x) if x == 0 else x + 0.5}
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        rng = np.random.default_rng(0)
+        shape = (9, 6, 5, 8)
+        self.fields = {
+            "temperature_K": 300.0 + 20.0 * rng.normal(size=shape),
+            "mass_density": 1.0 + 0.05 * rng.normal(size=shape),
+        }
+        self.expected = [
+            _snapshot_statistics({key: val[i] for key, val in self.fields.items()})
+            for i in range(shape[0])
+        ]
+
+    def _assert_expected(self, results):
+        """Compares results against a loop over snapshots."""
+        for key in ["opd_rms", "strehl_ratio", "mean_opl"]:
+            expected = np.array([val[key] for val in self.expected])
+            np.testing.assert_array_equal(results[key], expected)
+
+    # Test process_snapshots #
+    def test_process_snapshots_serial(self):
+        """Test a single worker in the calling process."""
+        results = process_snapshots(_snapshot_statistics, self.fields, workers=1)
+        self.assertEqual(results["mean_opl"].shape, (9, 6))
+        self._assert_expected(results)
+
+    def test_process_snapshots_ordered(self):
+        """Test ordered completion in a process pool."""
+        completed = []
+        results = process_snapshots(
+            _snapshot_statistics,
+            self.fields,
+            workers=2,
+            callback=lambda i, val: completed.append((i, val["opd_rms"])),
+        )
+        self._assert_expected(results)
+        self.assertEqual([i for i, _ in completed], list(range(9)))
+        self.assertEqual(completed[4][1], results["opd_rms"][4])
+
+    def test_process_snapshots_unordered(self):
+        """Test unordered completion in a process pool."""
+        completed = []
+        results = process_snapshots(
+            _snapshot_statistics,
+            self.fields,
+            workers=3,
+            ordered=False,
+            callback=lambda i, val: completed.append(i),
+        )
+        self._assert_expected(results)
+        self.assertEqual(sorted(completed), list(range(9)))
+
+    def test_process_snapshots_invalid(self):
+        """Test invalid fields, workers and worker errors."""
+        with self.assertRaises(ValueError):
+            process_snapshots(_snapshot_statistics, self.fields["temperature_K"])
+        with self.assertRaises(ValueError):
+            process_snapshots(
+                _snapshot_statistics,
+                {"temperature_K": np.ones((3, 2)), "mass_density": np.ones((4, 2))},
+            )
+        with self.assertRaises(ValueError):
+            process_snapshots(_snapshot_statistics, self.fields, workers=0)
+        temperature = {"temperature_K": np.full((4, 3), 500.0)}
+        temperature["temperature_K"][-1] = 300.0
+        with self.assertRaises(ValueError):
+            process_snapshots(_snapshot_negative, temperature, workers=2)
+
+    def test_process_snapshots_result_shapes(self):
+        """Test results with a different shape than the first snapshot."""
+        fields = {"x": np.arange(6.0).reshape(3, 2)}
+        for workers in [1, 2]:
+            with self.assertRaises(ValueError):
+                process_snapshots(_snapshot_shapes, fields, workers=workers)
+
+    def test_process_snapshots_result_types(self):
+        """Test integer results of the first snapshot are stored as floats."""
+        for workers in [1, 2]:
+            results = process_snapshots(
+                _snapshot_types, {"x": np.arange(3.0)}, workers=workers
+            )
+            np.testing.assert_array_equal(results["value"], [0.0, 1.5, 2.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
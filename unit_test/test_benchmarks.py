@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import unittest
+import haot
+
+# Repository root, benchmarks is not installed with haot
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.cases import CASES, EXCLUDED, cases_for
+from benchmarks import run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.modules = [
+            "optics",
+            "aerodynamics",
+            "quantum_mechanics",
+            "coordinates",
+            "conversions",
+        ]
+
+    # Test cases #
+    def test_cases_coverage(self):
+        """Test every public function has a benchmark case or is excluded."""
+        public = {
+            f"{module}.{name}"
+            for module in self.modules
+            for name in haot._EXPORTS[module]
+        }
+        self.assertEqual(public - set(EXCLUDED), set(CASES) - {"workflow"})
+
+    def test_cases_run(self):
+        """Test every case runs at scalar and field scale."""
+        for elements in [None, 400]:
+            for name, case in cases_for(elements).items():
+                with self.subTest(name=name, elements=elements):
+                    call = case["builder"](
+                        elements, run_benchmarks.np.random.default_rng(0)
+                    )
+                    call()
+
+    # Test run_benchmarks #
+    def test_run_benchmarks_compare(self):
+        """Test results are serializable and regressions are reported."""
+        results = run_benchmarks.run(["scalar"], 1, "conversions.molar")
+        self.assertEqual(len(results), 1)
+        self.assertGreater(results[0]["time_s"], 0.0)
+        baseline = json.loads(json.dumps({"results": results}))
+        baseline["results"][0]["time_s"] /= 10
+        self.assertEqual(len(run_benchmarks.compare(results, baseline, 0.1)), 1)
+        self.assertEqual(run_benchmarks.compare(results, {"results": results}, 0.1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
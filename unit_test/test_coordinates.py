@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from haot.coordinates import *
+
+
+class TestCoordinates(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.error_precision = 6
+        # One point per longitude quadrant, both hemispheres
+        self.lla = np.array(
+            [
+                [45.0, 30.0, 1000.0],
+                [-30.0, 120.0, 250.0],
+                [60.0, -150.0, 10000.0],
+                [-75.0, -60.0, 0.0],
+            ]
+        )
+
+    # Test lla_to_ecef #
+    def test_lla_to_ecef_equator(self):
+        """Test the ECEF position of points on the equator."""
+        radius = 6378137.0
+        np.testing.assert_almost_equal(
+            lla_to_ecef(0.0, 0.0, 0.0), [radius, 0.0, 0.0], self.error_precision
+        )
+        np.testing.assert_almost_equal(
+            lla_to_ecef([0.0, 90.0, 100.0]),
+            [0.0, radius + 100.0, 0.0],
+            self.error_precision,
+        )
+
+    def test_lla_to_ecef_invalid_arguments(self):
+        """Test invalid number of arguments."""
+        with self.assertRaises(ValueError):
+            lla_to_ecef(0.0, 0.0)
+
+    # Test ecef_to_lla #
+    def test_ecef_to_lla_round_trip(self):
+        """Test lla -> ecef -> lla in the four longitude quadrants."""
+        for lla in self.lla:
+            with self.subTest(lla=lla):
+                result = ecef_to_lla(lla_to_ecef(*lla))
+                self.assertEqual(result.shape, (3,))
+                np.testing.assert_almost_equal(result, lla, self.error_precision)
+
+    def test_ecef_to_lla_vector(self):
+        """Test lla -> ecef -> lla for arrays of points."""
+        ecef = lla_to_ecef(self.lla.T)
+        self.assertEqual(ecef.shape, (3, len(self.lla)))
+        result = ecef_to_lla(ecef)
+        self.assertEqual(result.shape, (3, len(self.lla)))
+        np.testing.assert_almost_equal(result, self.lla.T, self.error_precision)
+        for i in range(len(self.lla)):
+            np.testing.assert_almost_equal(
+                result[:, i], ecef_to_lla(*ecef[:, i]), self.error_precision
+            )
+
+    def test_ecef_to_lla_invalid_arguments(self):
+        """Test invalid number of arguments."""
+        with self.assertRaises(ValueError):
+            ecef_to_lla(1.0, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from haot.far_field import *
+from haot import optics
+
+
+class TestFarField(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.error_precision = 10
+        self.wavelength_nm = 500.0
+        self.grid_size = 32
+        x = np.linspace(-1.0, 1.0, self.grid_size)
+        rng = np.random.default_rng(0)
+        self.opd = np.zeros((3, self.grid_size, self.grid_size))
+        self.opd[1] = 0.5e-6 * x[:, None]  # two waves of tilt along x_axis
+        self.opd[2] = rng.normal(scale=5e-9, size=(self.grid_size, self.grid_size))
+
+    # Test far_field_statistics #
+    def test_far_field_statistics_diffraction_limited(self):
+        """Test the Strehl ratio and Airy encircled energy of a flat wavefront."""
+        result = far_field_statistics(self.opd[:1], self.wavelength_nm, padding=4)
+        self.assertAlmostEqual(result["strehl_ratio"][0], 1.0, self.error_precision)
+        self.assertAlmostEqual(result["encircled_energy"][0, 0], 0.838, 2)
+        np.testing.assert_almost_equal(
+            result["centroid"][0], [0.0, 0.0], self.error_precision
+        )
+
+    def test_far_field_statistics_tilt(self):
+        """Test that a tilted wavefront moves the centroid by its tilt."""
+        result = far_field_statistics(self.opd, self.wavelength_nm)
+        self.assertAlmostEqual(result["centroid"][1, 0], 2.0, 1)
+        self.assertAlmostEqual(result["centroid"][1, 1], 0.0, self.error_precision)
+
+    def test_far_field_statistics_marechal(self):
+        """Test that small aberrations match the Marechal approximation."""
+        mask = np.ones((self.grid_size, self.grid_size), dtype=bool)
+        opd = self.opd[2] - self.opd[2].mean()
+        variance = optics.phase_variance(opd.std(), self.wavelength_nm)
+        expected = optics.strehl_ratio(variance)
+        result = far_field_statistics(opd[None], self.wavelength_nm, mask, padding=1)
+        self.assertAlmostEqual(result["strehl_ratio"][0], expected, 4)
+
+    def test_far_field_statistics_chunks(self):
+        """Test that chunks and frame iterables match a single pass."""
+        expected = far_field_statistics(self.opd, self.wavelength_nm)
+        result = far_field_statistics(iter(self.opd), self.wavelength_nm, chunk_size=2)
+        for key in expected:
+            np.testing.assert_almost_equal(
+                result[key], expected[key], self.error_precision
+            )
+
+    def test_far_field_statistics_invalid_wavelength(self):
+        """Test that invalid wavelengths raise an error."""
+        with self.assertRaises(ValueError):
+            far_field_statistics(self.opd, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+import numpy as np
+from haot.instrumentation import *
+from haot import aerodynamics
+from haot import optics
+from haot import pipeline
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.enabled = get_profiling()
+        self.temperature = np.linspace(300.0, 2000.0, 1000)
+        set_profiling(False)
+        reset_profile()
+
+    def tearDown(self):
+        set_profiling(self.enabled)
+        reset_profile()
+
+    # Test profiling #
+    def test_profiling_disabled(self):
+        """Test calls are not recorded while profiling is off."""
+        aerodynamics.sutherland_law_viscosity(self.temperature)
+        self.assertEqual(profile_stats(), {})
+
+    def test_profiling_counters(self):
+        """Test call counts, elements and bytes of instrumented functions."""
+        with profiling():
+            self.assertTrue(get_profiling())
+            for _ in range(3):
+                aerodynamics.sutherland_law_viscosity(self.temperature)
+            aerodynamics.sutherland_law_viscosity(300.0)
+        self.assertFalse(get_profiling())
+        stats = profile_stats()["haot.aerodynamics.sutherland_law_viscosity"]
+        self.assertEqual(stats["calls"], 4)
+        self.assertEqual(stats["elements"], 3001)
+        self.assertEqual(stats["bytes"], 3 * self.temperature.nbytes)
+        self.assertGreater(stats["time_s"], 0.0)
+        self.assertGreater(stats["elements_per_s"], 0.0)
+
+    def test_profiling_nested(self):
+        """Test nested public calls and methods are recorded."""
+        with profiling():
+            optics.buldakov_expansion(np.arange(5), np.arange(5), "N2")
+            pipeline.AeroOpticsPipeline(1e-3).run(
+                np.ones((2, 4, 4, 8)), temperature_K=300.0 * np.ones((2, 4, 4, 8))
+            )
+        stats = profile_stats()
+        self.assertIn("haot.optics.buldakov_expansion", stats)
+        self.assertIn("haot.pipeline.AeroOpticsPipeline.run", stats)
+
+    def test_profiling_wrappers(self):
+        """Test instrumented functions keep names, caches and pickling."""
+        function = optics.buldakov_polarizability_table
+        self.assertEqual(function.__name__, "buldakov_polarizability_table")
+        self.assertTrue(callable(function.cache_clear))
+        self.assertIs(
+            pickle.loads(pickle.dumps(optics.strehl_ratio)), optics.strehl_ratio
+        )
+
+    # Test profile_report #
+    def test_profile_report_formats(self):
+        """Test the table and JSON reports."""
+        with profiling():
+            aerodynamics.speed_of_sound(self.temperature)
+        report = json.loads(profile_report(output_format="json"))
+        self.assertEqual(report["haot.aerodynamics.speed_of_sound"]["calls"], 1)
+        self.assertIn("haot.aerodynamics.speed_of_sound", profile_report())
+        with self.assertRaises(ValueError):
+            profile_report(output_format="csv")
+        with self.assertRaises(ValueError):
+            profile_report(sort="name")
+
+    def test_profile_report_environment(self):
+        """Test HAOT_PROFILE writes a JSON report at exit."""
+        path = os.path.join(os.path.dirname(__file__), "_profile.json")
+        statement = "import haot; haot.haversine_distance(0.0, 0.0, 1.0, 1.0)"
+        try:
+            subprocess.run(
+                [sys.executable, "-c", statement],
+                env=dict(os.environ, HAOT_PROFILE=path),
+                check=True,
+            )
+            with open(path) as file:
+                report = json.load(file)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+        self.assertEqual(report["haot.coordinates.haversine_distance"]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
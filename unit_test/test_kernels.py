@@ -0,0 +1,169 @@
+import unittest
+import numpy as np
+from haot.kernels import *
+from haot import kernels
+from haot import aerodynamics
+from haot import coordinates
+from haot import optics
+
+NUMBA = kernels.numba is not None
+
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        rng = np.random.default_rng(0)
+        self.backend = get_backend()
+        self.temperature = rng.uniform(100.0, 5000.0, 500)
+        self.refractivity = rng.uniform(0.0, 1e-2, 500)
+        self.ecef = np.array(
+            coordinates.lla_to_ecef(
+                rng.uniform(-89.0, 89.0, 500),
+                rng.uniform(-180.0, 180.0, 500),
+                rng.uniform(0.0, 1e5, 500),
+            )
+        )
+        set_backend("numpy")
+
+    def tearDown(self):
+        kernels._POLICY["backend"] = self.backend
+
+    def _numpy_dense(self, refractivity):
+        """Dense refractivity of the numpy implementation."""
+        dilute = refractivity.copy()
+        dense = np.empty_like(dilute)
+        optics._dilute_dense_index(dilute, dense, refractivity=True)
+        return dense
+
+    def _numpy_ecef_to_lla(self, ecef):
+        """Kernel of ecef_to_lla evaluated one point at a time."""
+        earth = coordinates._earth_data()
+        eccentricity_2 = earth["earth_eccentricity"] ** 2
+        a_1 = earth["semi_major_earth_radius_m"] * eccentricity_2
+        constants = np.array(
+            [
+                earth["semi_major_earth_radius_m"],
+                eccentricity_2,
+                a_1,
+                a_1**2,
+                0.5 * a_1 * eccentricity_2,
+                2.5 * a_1**2,
+                a_1 + 0.5 * a_1 * eccentricity_2,
+                1 - eccentricity_2,
+            ]
+        )
+        lla = np.empty((3, ecef.shape[1]))
+        for i, point in enumerate(ecef.T):
+            kernels._ecef_to_lla(*point, constants, *lla[:, i : i + 1])
+        return lla
+
+    # Test set_backend #
+    def test_set_backend_policy(self):
+        """Test the backend policy and the numpy fallback."""
+        self.assertEqual(get_backend(), "numpy")
+        self.assertIsNone(compiled_kernel("kerl_polarizability"))
+        with self.assertRaises(ValueError):
+            set_backend("cython")
+        with self.assertRaises(ValueError):
+            compiled_kernel("tropina")
+
+    @unittest.skipIf(NUMBA, "numba is installed")
+    def test_set_backend_without_numba(self):
+        """Test the numba backend requires numba."""
+        with self.assertRaises(ValueError):
+            set_backend("numba")
+
+    # Test kernels against the numpy implementation #
+    def test_kernels_reference(self):
+        """Test the kernel formulas, in Python, against numpy."""
+        const = optics.constants_tables.kerl_interpolation("N2")
+        frequency = 2 * np.pi * optics.s_consts.speed_of_light / 532e-9
+        scale = const["groundPolarizability"] / (
+            1 - (frequency / const["groundFrequency"]) ** 2
+        )
+        kerl = np.vectorize(kernels._kerl_polarizability)(
+            self.temperature, const["b"], const["c"], scale
+        )
+        np.testing.assert_allclose(
+            kerl,
+            optics.kerl_polarizability_temperature(self.temperature, "N2", 532.0),
+            rtol=1e-15,
+        )
+        dense = np.vectorize(kernels._dense_refractivity)(self.refractivity)
+        np.testing.assert_allclose(
+            dense, self._numpy_dense(self.refractivity), rtol=1e-14
+        )
+        vibrational, rotational = np.meshgrid(np.arange(5), np.arange(40))
+        buldakov = np.vectorize(kernels._buldakov_polarizability)(
+            vibrational, rotational, *optics._buldakov_coefficients("N2")
+        )
+        np.testing.assert_allclose(
+            buldakov,
+            optics.buldakov_expansion(vibrational, rotational, "N2"),
+            rtol=1e-15,
+        )
+        np.testing.assert_allclose(
+            self._numpy_ecef_to_lla(self.ecef),
+            coordinates.ecef_to_lla(self.ecef),
+            rtol=1e-12,
+            atol=1e-6,
+        )
+
+    def test_kernels_reference_sutherland(self):
+        """Test the Sutherland kernels, in Python, against numpy."""
+        const = aerodynamics.constants_tables.sutherland_constants("Air")
+        scale = (
+            const["viscosity_ref"]
+            * (const["temperature_ref"] + const["sutherland_visc"])
+            / const["temperature_ref"] ** (3 / 2)
+        )
+        viscosity = np.vectorize(kernels._sutherland_viscosity)(
+            self.temperature, const["sutherland_visc"], scale
+        )
+        np.testing.assert_allclose(
+            viscosity,
+            aerodynamics.sutherland_law_viscosity(self.temperature),
+            rtol=1e-15,
+        )
+        ratio_ref = (const["sutherland_cond"] + const["temperature_ref"]) / const[
+            "temperature_ref"
+        ]
+        conductivity = np.vectorize(kernels._sutherland_conductivity)(
+            self.temperature,
+            const["sutherland_cond"],
+            ratio_ref,
+            const["conductivity_ref"],
+        )
+        np.testing.assert_allclose(
+            conductivity,
+            aerodynamics.sutherland_law_conductivity(self.temperature),
+            rtol=1e-14,
+        )
+
+    @unittest.skipUnless(NUMBA, "numba is not installed")
+    def test_kernels_numba_equivalence(self):
+        """Test the compiled kernels against the numpy implementation."""
+        calls = [
+            lambda: optics.kerl_polarizability_temperature(
+                self.temperature, "N2", 532.0
+            ),
+            lambda: optics.index_of_refraction_density_temperature(
+                self.temperature, self.refractivity, refractivity=True
+            )["dense"],
+            lambda: optics.buldakov_expansion(
+                np.arange(5)[:, None], np.arange(40), "O2"
+            ),
+            lambda: aerodynamics.sutherland_law_viscosity(self.temperature),
+            lambda: aerodynamics.sutherland_law_conductivity(self.temperature),
+            lambda: coordinates.ecef_to_lla(self.ecef),
+        ]
+        for call in calls:
+            set_backend("numpy")
+            expected = call()
+            set_backend("numba")
+            np.testing.assert_allclose(call(), expected, rtol=1e-13, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
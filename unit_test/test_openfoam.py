@@ -0,0 +1,137 @@
+import os
+import gzip
+import tempfile
+import unittest
+import numpy as np
+from haot.openfoam import *
+
+HEADER = """FoamFile
+{{
+    version     2.0;
+    format      {file_format};
+    arch        "LSB;label=32;scalar=64";
+    class       {field_class};
+    object      T;
+}}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+dimensions      [0 0 0 1 0 0 0];
+
+"""
+BOUNDARY = (
+    b"\n\nboundaryField\n{\n    inlet\n    {\n        value uniform 300;\n    }\n}\n"
+)
+
+
+class TestOpenFoam(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.case_dir = self.tmp_dir.name
+        self.temperature = np.linspace(300.0, 400.0, 7)
+        self.velocity = np.arange(6.0).reshape(2, 3)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, data, time="0"):
+        """Writes a file in a time directory of the case."""
+        os.makedirs(os.path.join(self.case_dir, time), exist_ok=True)
+        path = os.path.join(self.case_dir, time, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def _ascii_field(self, values):
+        """ASCII volScalarField file."""
+        header = HEADER.format(file_format="ascii", field_class="volScalarField")
+        payload = "\n".join(str(val) for val in values)
+        internal = f"internalField   nonuniform List<scalar> \n{len(values)}\n(\n"
+        return (header + internal + payload + "\n)\n;").encode() + BOUNDARY
+
+    def _binary_field(self, values):
+        """Binary volScalarField file."""
+        header = HEADER.format(file_format="binary", field_class="volScalarField")
+        internal = f"internalField   nonuniform List<scalar> \n{len(values)}\n("
+        payload = np.asarray(values, dtype="<f8").tobytes()
+        return (header + internal).encode() + payload + b")\n;" + BOUNDARY
+
+    # Test read_openfoam_field #
+    def test_read_openfoam_field_ascii(self):
+        """Test an ASCII scalar field."""
+        path = self._write("T", self._ascii_field(self.temperature))
+        np.testing.assert_allclose(read_openfoam_field(path), self.temperature)
+
+    def test_read_openfoam_field_binary_memmap(self):
+        """Test a binary scalar field is memory-mapped."""
+        path = self._write("T", self._binary_field(self.temperature))
+        temperature = read_openfoam_field(path)
+        self.assertIsInstance(temperature, np.memmap)
+        self.assertFalse(temperature.flags.writeable)
+        np.testing.assert_array_equal(temperature, self.temperature)
+        del temperature
+
+    def test_read_openfoam_field_gzip(self):
+        """Test a gzip compressed binary field."""
+        path = os.path.join(self.case_dir, "T.gz")
+        with gzip.open(path, "wb") as file:
+            file.write(self._binary_field(self.temperature))
+        np.testing.assert_array_equal(read_openfoam_field(path), self.temperature)
+
+    def test_read_openfoam_field_vector(self):
+        """Test an ASCII vector field."""
+        header = HEADER.format(file_format="ascii", field_class="volVectorField")
+        internal = "internalField   nonuniform List<vector> 2((0 1 2) (3 4 5));\n"
+        path = self._write("U", (header + internal).encode())
+        np.testing.assert_array_equal(read_openfoam_field(path), self.velocity)
+
+    def test_read_openfoam_field_uniform(self):
+        """Test a uniform field, expanded to the number of cells."""
+        header = HEADER.format(file_format="ascii", field_class="volScalarField")
+        path = self._write("p", (header + "internalField   uniform 101325;\n").encode())
+        self.assertEqual(read_openfoam_field(path), 101325.0)
+        np.testing.assert_array_equal(read_openfoam_field(path, 3), [101325.0] * 3)
+
+    def test_read_openfoam_field_invalid(self):
+        """Test files that are not fields, or are truncated."""
+        path = self._write("controlDict", b"application rhoCentralFoam;\n")
+        with self.assertRaises(ValueError):
+            read_openfoam_field(path)
+        path = self._write("T", self._binary_field(self.temperature)[:-100])
+        with self.assertRaises(ValueError):
+            read_openfoam_field(path)
+
+    # Test OpenFoamCase #
+    def test_openfoam_case_lazy_series(self):
+        """Test time directories, fields and a series of a case."""
+        for time in ["0", "0.002", "0.0005"]:
+            self._write("T", self._binary_field(self.temperature), time)
+        self._write("p", b"", "0.002")
+        os.makedirs(os.path.join(self.case_dir, "constant"))
+        case = OpenFoamCase(self.case_dir)
+        self.assertEqual(case.times, ["0", "0.0005", "0.002"])
+        self.assertEqual(case.fields(), ["T", "p"])
+        self.assertIsNone(case.n_cells)
+        series = list(case.series("T", case.times[1:]))
+        self.assertEqual([time for time, _ in series], ["0.0005", "0.002"])
+        np.testing.assert_array_equal(series[-1][1], self.temperature)
+        with self.assertRaises(ValueError):
+            case.read("rho")
+        del series
+
+    def test_openfoam_case_n_cells(self):
+        """Test uniform fields are expanded to the mesh size."""
+        mesh_dir = os.path.join(self.case_dir, "constant", "polyMesh")
+        os.makedirs(mesh_dir)
+        with open(os.path.join(mesh_dir, "owner"), "w") as file:
+            file.write('    note        "nPoints:8  nCells:4  nFaces:12";\n')
+        header = HEADER.format(file_format="ascii", field_class="volScalarField")
+        self._write("p", (header + "internalField   uniform 101325;\n").encode())
+        case = OpenFoamCase(self.case_dir)
+        self.assertEqual(case.n_cells, 4)
+        np.testing.assert_array_equal(case.read("p", "0"), [101325.0] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from haot.optics import *
+from haot import quantum_mechanics as quantum
 
 
 class TestOptics(unittest.TestCase):
@@ -20,6 +21,9 @@ class TestOptics(unittest.TestCase):
         self.invalid_distance = -2
         self.invalid_distance_dimension = np.array([2, 1, -4])
         self.valid_distance = 2.0
+        self.species = ["N2", "O2", "NO", "N", "O"]
+        self.species_density = np.linspace(0.01, 0.5, 5 * 8).reshape(5, 8)
+        self.opl = 1 + 1e-4 * np.sin(np.arange(13 * 4 * 3 * 2)).reshape(13, 4, 3, 2)
 
     # Test permittivity_material, invalid data type
     def test_permittivity_material_invalid_data_type(self):
@@ -45,6 +49,15 @@ class TestOptics(unittest.TestCase):
         with self.assertRaises(ValueError):
             electric_susceptibility(self.invalid_index)
 
+    # Test electric_susceptibility, out
+    def test_electric_susceptibility_out(self):
+        """Test electric susceptibility written to out."""
+        index = np.array([1.0, 1.0003, 1.5])
+        out = np.empty(3)
+        result = electric_susceptibility(index, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_allclose(result, index**2 - 1, rtol=1e-14)
+
     # Test optical_path_length, invalid data type
     def test_optical_path_length_invalid_data_type(self):
         """Test invalid index of refraction data type."""
@@ -93,6 +106,104 @@ class TestOptics(unittest.TestCase):
         with self.assertRaises(ValueError):
             index_of_refraction(self.invalid_mass_density_dict)
 
+    # Test index_of_refraction_field
+    def test_index_of_refraction_field_matches_dict(self):
+        """Test vectorized index of refraction against index_of_refraction."""
+        density_dict = dict(zip(self.species, self.species_density))
+        expected = index_of_refraction(density_dict)
+        for result in (
+            index_of_refraction_field(density_dict),
+            index_of_refraction_field(self.species_density, self.species),
+        ):
+            for key in ("dilute", "dense"):
+                np.testing.assert_allclose(result[key], expected[key], rtol=1e-14)
+
+    def test_index_of_refraction_field_out_buffers(self):
+        """Test that out= buffers are filled and returned."""
+        out = {"dilute": np.empty(8), "dense": np.empty(8)}
+        result = index_of_refraction_field(self.species_density, self.species, out=out)
+        self.assertIs(result["dilute"], out["dilute"])
+        self.assertIs(result["dense"], out["dense"])
+
+    def test_index_of_refraction_field_refractivity(self):
+        """Test refractivity of dilute fields without cancellation."""
+        mass_density = self.species_density[:, :1] * np.array([1.0, 1e-9])
+        index = index_of_refraction_field(mass_density, self.species)
+        result = index_of_refraction_field(
+            mass_density, self.species, refractivity=True
+        )
+        for key in ("dilute", "dense"):
+            np.testing.assert_allclose(result[key][0], index[key][0] - 1, rtol=1e-9)
+        # n - 1 of 1e-13 keeps its digits, dense and dilute agree at low density
+        np.testing.assert_allclose(
+            result["dilute"][1], 1e-9 * result["dilute"][0], rtol=1e-12
+        )
+        np.testing.assert_allclose(result["dense"][1], result["dilute"][1], rtol=1e-12)
+
+    def test_index_of_refraction_field_invalid_keys(self):
+        """Test invalid species names."""
+        with self.assertRaises(ValueError):
+            index_of_refraction_field(self.invalid_mass_density_dict)
+
+    def test_index_of_refraction_field_missing_species(self):
+        """Test array input without species names."""
+        with self.assertRaises(ValueError):
+            index_of_refraction_field(self.species_density)
+
+    # Test optical_path_difference_streaming
+    def test_optical_path_difference_streaming(self):
+        """Test streaming OPD against the in-memory function."""
+        for avg_ax in range(4):
+            expected = optical_path_difference(self.opl, avg_ax)
+            result = optical_path_difference_streaming(self.opl, avg_ax, chunk_size=4)
+            np.testing.assert_allclose(result, expected, rtol=0, atol=1e-15)
+
+    def test_optical_path_difference_streaming_invalid_axis(self):
+        """Test invalid average axis."""
+        with self.assertRaises(ValueError):
+            optical_path_difference_streaming(self.opl, 4)
+
+    # Test optical_path_difference_rms_streaming
+    def test_optical_path_difference_rms_streaming(self):
+        """Test streaming OPD RMS against the in-memory function."""
+        for avg_ax in range(4):
+            expected = optical_path_difference_rms(self.opl, avg_ax)
+            result = optical_path_difference_rms_streaming(
+                self.opl, avg_ax, chunk_size=4
+            )
+            self.assertAlmostEqual(result / expected, 1.0, places=10)
+
+    def test_optical_path_difference_rms_streaming_frames(self):
+        """Test streaming OPD RMS over an iterator of frames."""
+        expected = optical_path_difference_rms(self.opl)
+        result = optical_path_difference_rms_streaming(iter(self.opl), chunk_size=5)
+        self.assertAlmostEqual(result / expected, 1.0, places=10)
+
+    def test_optical_path_difference_rms_streaming_frames_invalid_axis(self):
+        """Test that iterables only support averaging along time."""
+        with self.assertRaises(ValueError):
+            optical_path_difference_rms_streaming(iter(self.opl), 1)
+
+    # Test gladstone_dale_constant_field
+    def test_gladstone_dale_constant_field(self):
+        """Test mixture Gladstone-Dale field against gladstone_dale_constant."""
+        expected = [
+            gladstone_dale_constant(dict(zip(self.species, cell)))["gladstone_dale"]
+            for cell in self.species_density.T
+        ]
+        result = gladstone_dale_constant_field(self.species_density, self.species)
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+        result = gladstone_dale_constant_field(
+            dict(zip(self.species, self.species_density)), dtype=np.float32
+        )
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_gladstone_dale_constant_field_invalid_keys(self):
+        """Test invalid species names."""
+        with self.assertRaises(ValueError):
+            gladstone_dale_constant_field(self.invalid_mass_density_dict)
+
     # Test kerl_polarizability_temperature #
     def test_kerl_polarizability_valid_temperature(self):
         """Test invalid temperature."""
@@ -121,6 +232,128 @@ class TestOptics(unittest.TestCase):
                 self.valid_temperature, self.valid_molecule, self.invalid_wavelength
             )
 
+    # Test kerl_polarizability_wavelengths #
+    def test_kerl_polarizability_wavelengths(self):
+        """Test cached multi-wavelength Kerl against the single wavelength."""
+        temperature = np.linspace(200.0, 5000.0, 7)
+        wavelengths = [355.0, 532.0, self.valid_wavelength]
+        result = kerl_polarizability_wavelengths(temperature, "N2", wavelengths)
+        self.assertEqual(result.shape, (3, 7))
+        for i, wavelength in enumerate(wavelengths):
+            expected = kerl_polarizability_temperature(temperature, "N2", wavelength)
+            np.testing.assert_allclose(result[i], expected, rtol=1e-14)
+
+    def test_kerl_polarizability_wavelengths_invalid_molecule(self):
+        """Test invalid molecule."""
+        with self.assertRaises(ValueError):
+            kerl_polarizability_wavelengths(
+                self.valid_temperature, self.invalid_molecule, [self.valid_wavelength]
+            )
+
+    def test_kerl_polarizability_wavelengths_invalid_wavelength(self):
+        """Test invalid wavelength."""
+        with self.assertRaises(ValueError):
+            kerl_polarizability_wavelengths(
+                self.valid_temperature,
+                self.valid_molecule,
+                [self.valid_wavelength, self.invalid_wavelength],
+            )
+
+    # Test buldakov_expansion #
+    def test_buldakov_expansion_grid(self):
+        """Test a (v, J) grid against single level calls."""
+        vibrational = np.arange(4)[:, None]
+        rotational = np.arange(0, 30, 7)
+        result = buldakov_expansion(vibrational, rotational, "N2")
+        self.assertEqual(result.shape, (4, 5))
+        self.assertAlmostEqual(result[3, 0] * 1e30, 1.83005, self.error_precision)
+        for v in range(4):
+            for i, j in enumerate(rotational):
+                expected = buldakov_expansion(v, int(j), "N2")
+                self.assertAlmostEqual(result[v, i], expected, 40)
+
+    # Test buldakov_polarizability_temperature #
+    def test_buldakov_polarizability_temperature(self):
+        """Test the thermal average against Boltzmann factors."""
+        temperature = np.array([300.0, 2000.0])
+        result = buldakov_polarizability_temperature(temperature, "O2", 3, 20)
+        for i, val in enumerate(temperature):
+            factors = np.array(
+                [
+                    [quantum.boltzmann_factor(val, "O2", v, j, True) for j in range(21)]
+                    for v in range(4)
+                ]
+            )
+            levels = buldakov_expansion(np.arange(4)[:, None], np.arange(21), "O2")
+            expected = (factors * levels).sum() / factors.sum()
+            self.assertAlmostEqual(result[i] / expected, 1.0, 12)
+
+    def test_buldakov_polarizability_temperature_invalid_levels(self):
+        """Test rotational levels past the Born-Oppenheimer turning point."""
+        with self.assertRaises(ValueError):
+            buldakov_polarizability_temperature(300.0, "H2", 3, 100)
+
+    # Test buldakov_polarizability_field #
+    def test_buldakov_polarizability_field(self):
+        """Test the cached table against the exact thermal average."""
+        temperature = np.linspace(0.0, 5000.0, 7).reshape(7, 1) + 2.5
+        expected = buldakov_polarizability_temperature(temperature, "N2")
+        result = buldakov_polarizability_field(temperature, "N2")
+        self.assertEqual(result.shape, (7, 1))
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_buldakov_polarizability_field_invalid_temperature(self):
+        """Test temperatures outside the cached table."""
+        with self.assertRaises(ValueError):
+            buldakov_polarizability_field(7000.0, "N2")
+
+    def test_index_of_refraction_density_temperature_wavelengths(self):
+        """Test broadcast wavelengths against single wavelength calls."""
+        temperature = np.linspace(200.0, 3000.0, 6)
+        mass_density = np.linspace(0.1, 1.2, 6)
+        wavelengths = [355.0, 532.0, self.valid_wavelength]
+        result = index_of_refraction_density_temperature(
+            temperature, mass_density, "N2", wavelengths
+        )
+        for i, wavelength in enumerate(wavelengths):
+            expected = index_of_refraction_density_temperature(
+                temperature, mass_density, "N2", wavelength
+            )
+            for key in ("dilute", "dense"):
+                self.assertEqual(result[key].shape, (3, 6))
+                np.testing.assert_allclose(result[key][i], expected[key], rtol=1e-14)
+
+    def test_index_of_refraction_density_temperature_invalid_wavelengths(self):
+        """Test invalid wavelength in a wavelength array."""
+        with self.assertRaises(ValueError):
+            index_of_refraction_density_temperature(
+                self.valid_temperature,
+                self.mass_density,
+                self.valid_molecule,
+                [self.valid_wavelength, self.invalid_wavelength],
+            )
+
+    # Test atmospheric_index_of_refraction_profile #
+    def test_atmospheric_index_of_refraction_profile(self):
+        """Test the cached profile against the standard atmosphere."""
+        altitude = np.linspace(-4000.0, 80000.0, 997)
+        vapor_pressure = np.linspace(10.0, 0.0, 997)
+        expected = atmospheric_index_of_refraction(altitude, vapor_pressure) - 1
+        result = atmospheric_index_of_refraction_profile(altitude, vapor_pressure) - 1
+        np.testing.assert_allclose(result, expected, rtol=1e-5)
+
+    def test_atmospheric_index_of_refraction_profile_invalid_altitude(self):
+        """Test altitude outside the standard atmosphere."""
+        with self.assertRaises(ValueError):
+            atmospheric_index_of_refraction_profile(np.array([0.0, 90e3]))
+
+    def test_atmospheric_index_of_refraction_profile_step_bounds(self):
+        """Test the altitude bounds of a step that does not divide the grid."""
+        with self.assertRaisesRegex(ValueError, "between -4996 and 80917 meters"):
+            atmospheric_index_of_refraction_profile(81000.0, altitude_step_m=300.0)
+        result = atmospheric_index_of_refraction_profile(80917.0, altitude_step_m=300.0)
+        self.assertGreater(result, 1.0)
+
     def test_index_of_refraction_density_temperature_invalid_molecule(self):
         """Test invalid molecule."""
         with self.assertRaises(ValueError):
@@ -0,0 +1,51 @@
+import importlib
+import subprocess
+import sys
+import unittest
+import haot
+
+
+class TestPackage(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.heavy_modules = ["scipy", "ambiance", "molmass", "haot.optics"]
+
+    # Test lazy imports #
+    def test_lazy_import_light_function(self):
+        """Test a coordinates function does not import heavy dependencies."""
+        statement = (
+            "import sys, haot; haot.haversine_distance; "
+            f"print([name for name in {self.heavy_modules} if name in sys.modules])"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", statement], capture_output=True, text=True
+        )
+        self.assertEqual(output.stdout.strip(), "[]")
+
+    def test_lazy_import_exports(self):
+        """Test every public function and class of a module is exported."""
+        for module_name in haot._MODULES:
+            module = importlib.import_module(f"haot.{module_name}")
+            public = {
+                name
+                for name, val in vars(module).items()
+                if not name.startswith("_")
+                and callable(val)
+                and getattr(val, "__module__", None) == module.__name__
+            }
+            self.assertEqual(public, set(haot._EXPORTS[module_name]), module_name)
+            for name in public:
+                self.assertIs(getattr(haot, name), getattr(module, name))
+
+    def test_lazy_import_attributes(self):
+        """Test modules, version, dir and missing attributes."""
+        self.assertIs(haot.optics, importlib.import_module("haot.optics"))
+        self.assertIsInstance(haot.__version__, str)
+        self.assertIn("strehl_ratio", dir(haot))
+        with self.assertRaises(AttributeError):
+            haot.not_a_function
+
+
+if __name__ == "__main__":
+    unittest.main()
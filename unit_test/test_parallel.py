@@ -0,0 +1,131 @@
+import unittest
+import numpy as np
+from haot.parallel import *
+from haot import aerodynamics
+from haot import conversions
+from haot import optics
+from haot import quantum_mechanics
+from haot import Workspace
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        rng = np.random.default_rng(0)
+        self.temperature = rng.uniform(200.0, 3000.0, (60, 70))
+        self.mass_density = rng.uniform(0.1, 2.0, (60, 70))
+        self.mach = rng.uniform(1.1, 8.0, (60, 70))
+        self.chunk_elements = 500
+
+    def tearDown(self):
+        set_num_threads(1, chunk_elements=1 << 16)
+
+    def _assert_bit_identical(self, function, *args, **kwargs):
+        """Compares the threaded and serial results of a function."""
+        serial = function(*args, **kwargs)
+        with thread_policy(4, self.chunk_elements):
+            threaded = function(*args, **kwargs)
+        if not isinstance(serial, dict):
+            serial, threaded = ({"": serial}, {"": threaded})
+        self.assertEqual(serial.keys(), threaded.keys())
+        for key in serial:
+            self.assertEqual(serial[key].dtype, threaded[key].dtype)
+            np.testing.assert_array_equal(serial[key], threaded[key])
+
+    # Test set_num_threads #
+    def test_set_num_threads_policy(self):
+        """Test the number of threads and the context manager."""
+        set_num_threads(3)
+        self.assertEqual(get_num_threads(), 3)
+        with thread_policy(8, chunk_elements=1024):
+            self.assertEqual(get_num_threads(), 8)
+        self.assertEqual(get_num_threads(), 3)
+        set_num_threads()
+        self.assertGreaterEqual(get_num_threads(), 1)
+        with self.assertRaises(ValueError):
+            set_num_threads(0)
+        with self.assertRaises(ValueError):
+            set_num_threads(2, chunk_elements=1.5)
+
+    # Test chunked_elementwise #
+    def test_chunked_elementwise_optics(self):
+        """Test optics field functions are bit-identical to serial."""
+        self._assert_bit_identical(
+            optics.index_of_refraction_density_temperature,
+            self.temperature,
+            self.mass_density,
+        )
+        self._assert_bit_identical(
+            optics.kerl_polarizability_temperature, self.temperature, "N2", 532.0
+        )
+        self._assert_bit_identical(optics.permittivity_material, self.mass_density)
+        self._assert_bit_identical(optics.strehl_ratio, self.mass_density)
+        self._assert_bit_identical(
+            optics.normal_incidence_reflectance, 1.0 + self.mass_density
+        )
+
+    def test_chunked_elementwise_aerodynamics(self):
+        """Test aerodynamics field functions are bit-identical to serial."""
+        self._assert_bit_identical(
+            aerodynamics.sutherland_law_viscosity, self.temperature
+        )
+        self._assert_bit_identical(aerodynamics.speed_of_sound, self.temperature)
+        self._assert_bit_identical(aerodynamics.normal_shock_relations, self.mach)
+        self._assert_bit_identical(
+            conversions.mass_density_to_molar_density, self.mass_density, "N2"
+        )
+
+    def test_chunked_elementwise_partition_functions(self):
+        """Test partition functions with a one element tail chunk."""
+        temperature = self.temperature.ravel()[:257]
+        functions = [
+            lambda T: quantum_mechanics.vibrational_partition_function(10, T, "N2"),
+            lambda T: quantum_mechanics.rotational_partition_function(60, T, "N2"),
+            lambda T: quantum_mechanics.born_oppenheimer_partition_function(
+                10, 60, T, "N2"
+            ),
+        ]
+        for function in functions:
+            serial = function(temperature)
+            with thread_policy(4, 256):
+                threaded = function(temperature)
+            np.testing.assert_array_equal(serial, threaded)
+            self.assertEqual(function(temperature[-1]), serial[-1])
+
+    def test_chunked_elementwise_layouts(self):
+        """Test Fortran ordered, strided and broadcast fields."""
+        self._assert_bit_identical(
+            aerodynamics.sutherland_law_conductivity,
+            np.asfortranarray(self.temperature),
+        )
+        self._assert_bit_identical(aerodynamics.isentropic_relations, self.mach[:, ::2])
+        self._assert_bit_identical(
+            optics.brewster_angle, 1.0 + self.mass_density, self.mass_density[0]
+        )
+
+    def test_chunked_elementwise_out_workspace(self):
+        """Test results are stored in out and in the workspace."""
+        work = Workspace()
+        out = np.empty_like(self.temperature)
+        expected = aerodynamics.sutherland_law_viscosity(self.temperature)
+        with thread_policy(4, self.chunk_elements):
+            viscosity = aerodynamics.sutherland_law_viscosity(self.temperature, out=out)
+            self.assertIs(viscosity, out)
+            viscosity = aerodynamics.sutherland_law_viscosity(
+                self.temperature, workspace=work
+            )
+            self.assertIs(viscosity, work.buffer("sutherland_law_viscosity", (60, 70)))
+        np.testing.assert_array_equal(out, expected)
+        np.testing.assert_array_equal(viscosity, expected)
+
+    def test_chunked_elementwise_errors(self):
+        """Test errors of a chunk are raised."""
+        self.temperature[-1, -1] = -1.0
+        with thread_policy(4, self.chunk_elements):
+            with self.assertRaises(ValueError):
+                aerodynamics.speed_of_sound(self.temperature)
+
+
+if __name__ == "__main__":
+    unittest.main()
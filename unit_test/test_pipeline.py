@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+from haot.pipeline import *
+from haot import optics
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        rng = np.random.default_rng(0)
+        self.shape = (10, 6, 5, 12)
+        self.step_size = 1e-3
+        self.temperature = 300.0 + 20.0 * rng.normal(size=self.shape)
+        self.mass_density = 1.0 + 0.05 * rng.normal(size=self.shape)
+        self.mask = np.ones(self.shape[1:3], dtype=bool)
+        self.mask[0, 0] = False
+
+    def _chained_opl(self, index_of_refraction):
+        """Optical path length of the stages called one at a time."""
+        opl = index_of_refraction.sum(axis=3)
+        opl -= 0.5 * (index_of_refraction[..., 0] + index_of_refraction[..., -1])
+        return opl[:, self.mask] * self.step_size
+
+    # Test AeroOpticsPipeline #
+    def test_aero_optics_pipeline_chained_stages(self):
+        """Test the pipeline against the stages called one at a time."""
+        pipeline = AeroOpticsPipeline(self.step_size, self.mask, chunk_size=3)
+        result = pipeline.run(self.mass_density, temperature_K=self.temperature)
+        index = optics.index_of_refraction_density_temperature(
+            self.temperature, self.mass_density
+        )["dense"]
+        opl = self._chained_opl(index)
+        opd_rms = optics.optical_path_difference_rms(opl)
+        self.assertAlmostEqual(result["opd_rms"] / opd_rms, 1.0, 10)
+        expected = optics.strehl_ratio(optics.phase_variance(opd_rms, 633.0))
+        self.assertAlmostEqual(result["strehl_ratio"], expected, 10)
+        np.testing.assert_allclose(result["opd_rms_frames"], opl.std(axis=1), rtol=1e-9)
+        self.assertTrue(np.isnan(result["mean_opl"][0, 0]))
+
+    def test_aero_optics_pipeline_species(self):
+        """Test the pipeline over species mass density fields."""
+        species = {"N2": 0.77 * self.mass_density, "O2": 0.23 * self.mass_density}
+        pipeline = AeroOpticsPipeline(self.step_size, self.mask, chunk_size=4)
+        result = pipeline.run(species)
+        index = optics.index_of_refraction_field(species)["dense"]
+        opd_rms = optics.optical_path_difference_rms(self._chained_opl(index))
+        self.assertAlmostEqual(result["opd_rms"] / opd_rms, 1.0, 8)
+
+    def test_aero_optics_pipeline_counters(self):
+        """Test the processed frames, cells and stage timings."""
+        pipeline = AeroOpticsPipeline(self.step_size, chunk_size=4)
+        pipeline.run(self.mass_density, temperature_K=self.temperature)
+        self.assertEqual(pipeline.frames, self.shape[0])
+        self.assertEqual(pipeline.cells, self.mass_density.size)
+        self.assertTrue(all(val >= 0 for val in pipeline.timings.values()))
+        self.assertGreater(pipeline.throughput["total"], 0)
+        pipeline.reset_counters()
+        self.assertEqual(pipeline.cells, 0)
+
+    def test_aero_optics_pipeline_invalid_mask(self):
+        """Test that aperture masks of the wrong shape raise a ValueError."""
+        pipeline = AeroOpticsPipeline(self.step_size, np.ones((6, 12), dtype=bool))
+        with self.assertRaises(ValueError):
+            pipeline.run(self.mass_density, temperature_K=self.temperature)
+
+    def test_aero_optics_pipeline_missing_temperature(self):
+        """Test that density arrays without temperature raise a ValueError."""
+        with self.assertRaises(ValueError):
+            AeroOpticsPipeline(self.step_size).run(self.mass_density)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+from haot.precision import *
+from haot import optics
+
+
+class TestPrecision(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        rng = np.random.default_rng(0)
+        self.temperature = rng.uniform(150.0, 3000.0, 1000)
+        self.mass_density = rng.uniform(1e-4, 50.0, 1000)
+        self.opl = 1.0 + rng.normal(scale=1e-6, size=(8, 4, 4, 3))
+
+    def tearDown(self):
+        """Restore the default precision."""
+        set_precision(np.float64)
+
+    # Test set_precision #
+    def test_set_precision(self):
+        """Test setting and reading the precision."""
+        set_precision("float32")
+        self.assertEqual(get_precision(), np.float32)
+
+    def test_set_precision_invalid(self):
+        """Test invalid precisions."""
+        for dtype in (np.float16, "double-ish"):
+            with self.assertRaises(ValueError):
+                set_precision(dtype)
+
+    # Test precision_policy #
+    def test_precision_policy_restores(self):
+        """Test that the previous precision is restored on errors."""
+        with self.assertRaises(RuntimeError):
+            with precision_policy(np.float32):
+                self.assertEqual(get_precision(), np.float32)
+                raise RuntimeError
+        self.assertEqual(get_precision(), np.float64)
+
+    # Test float32 error bounds #
+    def test_precision_kerl_polarizability_temperature(self):
+        """Test the float32 Kerl polarizability error bound."""
+        expected = optics.kerl_polarizability_temperature(self.temperature, "N2", 633.0)
+        with precision_policy(np.float32):
+            result = optics.kerl_polarizability_temperature(
+                self.temperature, "N2", 633.0
+            )
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_precision_index_of_refraction_refractivity(self):
+        """Test the float32 refractivity error bound."""
+        expected = optics.index_of_refraction_density_temperature(
+            self.temperature, self.mass_density, "N2", refractivity=True
+        )
+        with precision_policy(np.float32):
+            result = optics.index_of_refraction_density_temperature(
+                self.temperature, self.mass_density, "N2", refractivity=True
+            )
+        for key in ("dilute", "dense"):
+            self.assertEqual(result[key].dtype, np.float32)
+            np.testing.assert_allclose(result[key], expected[key], rtol=2e-6)
+
+    def test_precision_index_of_refraction(self):
+        """Test the float32 index of refraction error bound."""
+        expected = optics.index_of_refraction_density_temperature(
+            self.temperature, self.mass_density, "N2"
+        )
+        with precision_policy(np.float32):
+            result = optics.index_of_refraction_density_temperature(
+                self.temperature, self.mass_density, "N2"
+            )
+        for key in ("dilute", "dense"):
+            np.testing.assert_allclose(result[key], expected[key], rtol=1.2e-7)
+
+    def test_precision_gladstone_dale_constant_field(self):
+        """Test the float32 Gladstone-Dale error bound."""
+        mass_density = {"N2": self.mass_density, "O2": 0.3 * self.mass_density}
+        expected = optics.gladstone_dale_constant_field(mass_density)
+        with precision_policy(np.float32):
+            result = optics.gladstone_dale_constant_field(mass_density)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=1.2e-7)
+
+    def test_precision_optical_path_difference(self):
+        """Test the float32 optical path difference error bound."""
+        expected = optics.optical_path_difference(self.opl)
+        with precision_policy(np.float32):
+            result = optics.optical_path_difference(self.opl)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(
+            result, expected, rtol=0, atol=1.2e-7 * np.abs(expected).max()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from haot.quantum_mechanics import *
 
 
@@ -17,6 +18,7 @@ class TestOptics(unittest.TestCase):
         self.invalid_vibrational = -2
         self.invalid_rotational = -1
         self.valid_rotational = 6
+        self.temperature_field = np.linspace(200.0, 5000.0, 24).reshape(4, 6)
 
     def test_zero_point_energy_invalid_molecule(self):
         """Test invalid molecule."""
@@ -105,6 +107,45 @@ class TestOptics(unittest.TestCase):
                 self.invalid_molecule,
             )
 
+    def test_partition_functions_temperature_field(self):
+        """Test partition functions of a temperature field against the level sums."""
+        for temperature in [self.valid_temperature, *self.temperature_field.ravel()]:
+            z_vib = sum(boltzmann_factor(temperature, "N2", v) for v in range(11))
+            z_rot = sum(boltzmann_factor(temperature, "N2", None, j) for j in range(41))
+            z_bo = sum(
+                boltzmann_factor(temperature, "N2", v, j, True)
+                for j in range(41)
+                for v in range(11)
+            )
+            self.assertAlmostEqual(
+                vibrational_partition_function(10, temperature, "N2") / z_vib, 1.0, 12
+            )
+            self.assertAlmostEqual(
+                rotational_partition_function(40, temperature, "N2") / z_rot, 1.0, 12
+            )
+            self.assertAlmostEqual(
+                born_oppenheimer_partition_function(10, 40, temperature, "N2") / z_bo,
+                1.0,
+                12,
+            )
+        z_field = born_oppenheimer_partition_function(
+            10, 40, self.temperature_field, "N2"
+        )
+        self.assertEqual(z_field.shape, self.temperature_field.shape)
+        self.assertAlmostEqual(
+            z_field[-1, -1],
+            born_oppenheimer_partition_function(10, 40, 5000.0, "N2"),
+            places=6,
+        )
+
+    def test_partition_functions_invalid_temperature_field(self):
+        """Test invalid temperature field."""
+        self.temperature_field[1, 2] = self.invalid_temperature
+        with self.assertRaises(ValueError):
+            rotational_partition_function(
+                self.valid_rotational, self.temperature_field, self.valid_molecule
+            )
+
     def test_molecular_spring_constant_invalid_molecule(self):
         """Test invalid molecule."""
         with self.assertRaises(ValueError):
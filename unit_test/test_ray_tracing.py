@@ -0,0 +1,150 @@
+import unittest
+from haot.ray_tracing import *
+from haot import optics
+
+
+class TestRayTracing(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.error_precision = 10
+        self.grid_axes = (
+            np.linspace(0.0, 1.0, 11),
+            np.linspace(0.0, 1.0, 6),
+            np.array([0.0, 0.1, 0.3, 0.6, 1.0]),
+        )
+        x, y, z = np.meshgrid(*self.grid_axes, indexing="ij")
+        self.linear_index = 1 + 1e-3 * x + 2e-3 * y + 3e-3 * z
+        self.ray_origins = np.array([[0.1, 0.2, 0.0], [0.5, 0.5, 0.0]])
+        self.ray_directions = np.array([0.0, 0.0, 1.0])
+        self.step_size = 0.03
+        cell_size = 0.05
+        centers = np.arange(cell_size / 2, 1.0, cell_size)
+        x, y, z = np.meshgrid(centers, centers, centers, indexing="ij")
+        self.cell_centers = np.c_[x.ravel(), y.ravel(), z.ravel()]
+        self.cell_index = 1 + 1e-3 * x.ravel() + 3e-3 * z.ravel()
+
+    # Test optical_path_length_grid #
+    def test_optical_path_length_grid_linear_field(self):
+        """Test that a linear field is integrated exactly."""
+        expected = (
+            1 + 1e-3 * self.ray_origins[:, 0] + 2e-3 * self.ray_origins[:, 1] + 1.5e-3
+        )
+        result = optical_path_length_grid(
+            self.linear_index,
+            self.grid_axes,
+            self.ray_origins,
+            self.ray_directions,
+            self.step_size,
+            1.0,
+        )
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_optical_path_length_grid_outside(self):
+        """Test that rays outside the grid use the fill value."""
+        result = optical_path_length_grid(
+            self.linear_index,
+            self.grid_axes,
+            [2.0, 2.0, 2.0],
+            self.ray_directions,
+            self.step_size,
+            1.0,
+            fill_value=1.5,
+        )
+        self.assertAlmostEqual(result[0], 1.5, places=self.error_precision)
+
+    def test_optical_path_length_grid_invalid_shape(self):
+        """Test that mismatched grid axes raise a ValueError."""
+        with self.assertRaises(ValueError):
+            optical_path_length_grid(
+                self.linear_index[:-1],
+                self.grid_axes,
+                self.ray_origins,
+                self.ray_directions,
+                self.step_size,
+                1.0,
+            )
+
+    def test_optical_path_length_grid_invalid_step(self):
+        """Test that a negative step raises a ValueError."""
+        with self.assertRaises(ValueError):
+            optical_path_length_grid(
+                self.linear_index,
+                self.grid_axes,
+                self.ray_origins,
+                self.ray_directions,
+                -self.step_size,
+                1.0,
+            )
+
+    # Test optical_path_length_grid #
+
+    # Test UnstructuredRayTracer #
+    def test_unstructured_ray_tracer_matches_linear_field(self):
+        """Test nearest cell integration of a linear field."""
+        tracer = UnstructuredRayTracer(self.cell_centers)
+        bundle = tracer.ray_bundle(
+            self.ray_origins, self.ray_directions, self.step_size, 1.0
+        )
+        expected = 1 + 1e-3 * self.ray_origins[:, 0] + 1.5e-3
+        result = tracer.optical_path_length(self.cell_index, bundle)
+        np.testing.assert_allclose(result, expected, rtol=1e-4)
+
+    def test_unstructured_ray_tracer_time_steps(self):
+        """Test that a bundle is reused across time steps."""
+        tracer = UnstructuredRayTracer(self.cell_centers)
+        bundle = tracer.ray_bundle(
+            self.ray_origins, self.ray_directions, self.step_size, 1.0
+        )
+        fields = np.stack([self.cell_index, 2 * self.cell_index - 1])
+        result = tracer.optical_path_length(fields, bundle)
+        self.assertEqual(result.shape, (2, len(self.ray_origins)))
+        np.testing.assert_allclose(
+            result[1], 2 * result[0] - 1.0, rtol=1e-12, atol=1e-12
+        )
+
+    def test_unstructured_ray_tracer_outside(self):
+        """Test that rays outside the mesh use the fill value."""
+        tracer = UnstructuredRayTracer(self.cell_centers)
+        bundle = tracer.ray_bundle([5.0, 5.0, 5.0], self.ray_directions, 0.1, 1.0)
+        result = tracer.optical_path_length(self.cell_index, bundle, fill_value=1.5)
+        self.assertAlmostEqual(result[0], 1.5, places=self.error_precision)
+
+    def test_unstructured_ray_tracer_invalid_cells(self):
+        """Test that invalid cell centres raise a ValueError."""
+        with self.assertRaises(ValueError):
+            UnstructuredRayTracer(self.cell_centers[:, :2])
+
+    # Test UnstructuredRayTracer #
+
+    # Test slant_path_refraction #
+    def test_slant_path_refraction_zenith(self):
+        """Test a vertical link against the atmospheric index of refraction."""
+        altitude = np.linspace(0.0, 10e3, 2001)
+        index = optics.atmospheric_index_of_refraction(altitude)
+        expected = np.sum(0.5 * (index[1:] + index[:-1]) * np.diff(altitude))
+        result = slant_path_refraction([35.0, -106.0, 0.0], [35.0, -106.0, 10e3])
+        self.assertAlmostEqual(result["optical_path_length"][0], expected, places=3)
+        self.assertAlmostEqual(result["geometric_length"][0], 10e3, places=6)
+        self.assertAlmostEqual(result["apparent_elevation_deg"][0], 90.0, places=6)
+
+    def test_slant_path_refraction_bending(self):
+        """Test that refraction raises the apparent elevation of low links."""
+        result = slant_path_refraction(
+            [[35.0, -106.0, 0.0], [35.0, -106.0, 0.0]],
+            [[35.5, -106.0, 10e3], [37.0, -106.0, 10e3]],
+        )
+        bending = result["apparent_elevation_deg"] - result["geometric_elevation_deg"]
+        self.assertTrue((bending > 0).all())
+        self.assertGreater(bending[1], bending[0])
+
+    def test_slant_path_refraction_invalid_shape(self):
+        """Test that invalid positions raise a ValueError."""
+        with self.assertRaises(ValueError):
+            slant_path_refraction([35.0, -106.0], [35.0, -106.0])
+
+    # Test slant_path_refraction #
+
+
+if __name__ == "__main__":
+    unittest.main()
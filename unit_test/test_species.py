@@ -0,0 +1,120 @@
+import unittest
+import numpy as np
+from haot.species import *
+from haot import optics
+from haot import quantum_mechanics
+
+
+class TestSpecies(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.error_precision = 4
+        self.valid_species = "N2+"
+        self.invalid_species = "Argon"
+        self.user_species = "Xe"
+        self.user_polarizability = 4.044e-24  # [cm^3]
+
+    def tearDown(self):
+        """Remove user registered species."""
+        unregister_species(self.user_species)
+
+    def test_species_properties_valid_species(self):
+        """Test properties of a known species."""
+        result = species_properties(self.valid_species)
+        self.assertAlmostEqual(
+            result["molar_mass"], 28.0129, places=self.error_precision
+        )
+        self.assertEqual(result["charge"], 1)
+        self.assertIsNotNone(result["polarizability"])
+        self.assertIsNotNone(result["spectroscopy"])
+
+    def test_species_properties_is_cached(self):
+        """Test that properties are resolved once."""
+        self.assertIs(species_properties("O2"), species_properties("O2"))
+
+    def test_species_properties_invalid_species(self):
+        """Test that an unknown species raises a ValueError."""
+        with self.assertRaises(ValueError):
+            species_properties(self.invalid_species)
+
+    def test_air_molar_mass(self):
+        """Test air molar mass."""
+        self.assertAlmostEqual(air_molar_mass(), 28.9697, places=self.error_precision)
+
+    def test_register_species(self):
+        """Test that user registered species are used by dependent caches."""
+        density = {"N2": np.full(4, 0.5)}
+        optics.index_of_refraction_field(density)
+        with self.assertRaises(ValueError):
+            optics.index_of_refraction_field({self.user_species: np.full(4, 0.5)})
+        register_species(self.user_species, polarizability=self.user_polarizability)
+        result = optics.index_of_refraction_field({self.user_species: np.full(4, 0.5)})
+        self.assertTrue((result["dilute"] > 1).all())
+
+    def test_register_species_kerl(self):
+        """Test that Kerl overrides are used by every wavelength path."""
+        self.addCleanup(unregister_species, "Air")
+        kerl = dict(species_properties("Air")["kerl"])
+        kerl["groundPolarizability"] *= 1.02
+        register_species("Air", kerl=kerl)
+        temperature = np.array([250.0, 300.0])
+        density = np.array([0.5, 1.2])
+        scalar = optics.index_of_refraction_density_temperature(
+            temperature, density, "Air", 633.0
+        )
+        vector = optics.index_of_refraction_density_temperature(
+            temperature, density, "Air", [633.0]
+        )
+        refractivity = optics.index_of_refraction_density_temperature(
+            temperature, density, "Air", 633.0, refractivity=True
+        )
+        np.testing.assert_allclose(scalar["dilute"], vector["dilute"][0], rtol=1e-14)
+        np.testing.assert_allclose(
+            scalar["dilute"] - 1, refractivity["dilute"], rtol=1e-9
+        )
+
+    def test_register_species_kerl_user_species(self):
+        """Test that a user species with Kerl constants is supported."""
+        with self.assertRaises(ValueError):
+            optics.kerl_polarizability_temperature(300.0, self.user_species, 633.0)
+        kerl = species_properties("N2")["kerl"]
+        register_species(self.user_species, kerl=kerl)
+        result = optics.kerl_polarizability_temperature(300.0, self.user_species, 633.0)
+        expected = optics.kerl_polarizability_temperature(300.0, "N2", 633.0)
+        self.assertEqual(result, expected)
+
+    def test_register_species_spectroscopy(self):
+        """Test that spectroscopy overrides reach the cached levels."""
+        self.addCleanup(unregister_species, "N2")
+        temperature = np.array([300.0, 1000.0])
+        partition = quantum_mechanics.born_oppenheimer_partition_function(
+            5, 20, temperature, "N2"
+        )
+        zero_point = quantum_mechanics.zero_point_energy("N2")
+        polarizability = optics.buldakov_expansion(1, 2, "N2")
+        table = optics.buldakov_polarizability_table("N2")
+        spectroscopy = dict(species_properties("N2")["spectroscopy"])
+        spectroscopy["omega_e"] *= 0.5
+        spectroscopy["B_e"] *= 0.5
+        register_species("N2", spectroscopy=spectroscopy)
+        self.assertAlmostEqual(
+            quantum_mechanics.zero_point_energy("N2") / zero_point, 0.5, delta=0.01
+        )
+        result = quantum_mechanics.born_oppenheimer_partition_function(
+            5, 20, temperature, "N2"
+        )
+        self.assertTrue((result > partition).all())
+        self.assertNotEqual(optics.buldakov_expansion(1, 2, "N2"), polarizability)
+        self.assertFalse(
+            np.array_equal(optics.buldakov_polarizability_table("N2"), table)
+        )
+
+    def test_register_species_invalid_molar_mass(self):
+        """Test that a negative molar mass raises a ValueError."""
+        with self.assertRaises(ValueError):
+            register_species(self.user_species, molar_mass=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+from haot.streaming import *
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.frames = np.arange(7 * 3 * 2, dtype=float).reshape(7, 3, 2)
+        self.chunk_size = 3
+
+    # Test chunked_frames #
+    def test_chunked_frames(self):
+        """Test chunks are views along the first axis with a shorter tail."""
+        chunks = list(chunked_frames(self.frames, self.chunk_size))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        for chunk in chunks:
+            self.assertTrue(np.shares_memory(chunk, self.frames))
+        np.testing.assert_array_equal(np.concatenate(chunks), self.frames)
+
+    # Test grouped_frames #
+    def test_grouped_frames(self):
+        """Test an iterable of frames is stacked into chunks."""
+        chunks = list(grouped_frames(iter(self.frames), self.chunk_size))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        np.testing.assert_array_equal(np.concatenate(chunks), self.frames)
+
+    def test_grouped_frames_empty(self):
+        """Test an empty iterable yields no chunks."""
+        self.assertEqual(list(grouped_frames(iter([]), self.chunk_size)), [])
+
+    # Test welford_frames #
+    def test_welford_frames(self):
+        """Test the streamed mean and variance against the in-memory ones."""
+        count, mean, sum_squares = welford_frames(
+            chunked_frames(self.frames, self.chunk_size)
+        )
+        self.assertEqual(count, len(self.frames))
+        np.testing.assert_allclose(mean, self.frames.mean(axis=0), rtol=1e-14)
+        np.testing.assert_allclose(
+            sum_squares / count, self.frames.var(axis=0), rtol=1e-12
+        )
+
+    def test_welford_frames_empty(self):
+        """Test an empty stream raises a ValueError."""
+        with self.assertRaises(ValueError):
+            welford_frames(iter([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import threading
+import unittest
+import warnings
+import numpy as np
+from haot.validation import *
+from haot import aerodynamics
+from haot import optics
+from haot.parallel import thread_policy
+
+
+class TestValidation(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.enabled = get_validation()
+        self.temperature = np.linspace(300.0, 2000.0, 100)
+        self.negative = self.temperature.copy()
+        self.negative[50] = -1.0
+        set_validation(True)
+
+    def tearDown(self):
+        set_validation(self.enabled)
+
+    # Test check_nonnegative #
+    def test_check_nonnegative_inputs(self):
+        """Test scalars, integers, arrays, lists and empty arrays."""
+        for val in [0.0, 3, np.float32(1.0), self.temperature, [1.0, 2.0], np.ones(0)]:
+            check_nonnegative(val, "negative")
+        for val in [-1.0, -3, np.float64(-1.0), self.negative, [1.0, -2.0]]:
+            with self.assertRaises(ValueError):
+                check_nonnegative(val, "negative")
+
+    # Test check_positive #
+    def test_check_positive_inputs(self):
+        """Test zero and negative values are rejected."""
+        check_positive(self.temperature, "not positive")
+        for val in [0.0, np.zeros(3), [532.0, 0.0]]:
+            with self.assertRaises(ValueError):
+                check_positive(val, "not positive")
+
+    # Test check_range #
+    def test_check_range_inputs(self):
+        """Test values outside of the bounds are rejected."""
+        check_range(self.temperature, 300.0, 2000.0, "out of range")
+        check_range(500, 300.0, 2000.0, "out of range")
+        for val in [2000.1, self.negative, [300.0, 2500.0]]:
+            with self.assertRaises(ValueError):
+                check_range(val, 300.0, 2000.0, "out of range")
+
+    # Test check_species #
+    def test_check_species_inputs(self):
+        """Test unsupported species are rejected."""
+        check_species("N2", frozenset({"N2", "O2"}), "unsupported")
+        with self.assertRaises(ValueError):
+            check_species("CO2", frozenset({"N2", "O2"}), "unsupported")
+        with self.assertRaises(ValueError):
+            check_species(["N2"], frozenset({"N2", "O2"}), "unsupported")
+
+    # Test trusted #
+    def test_trusted_skips_checks(self):
+        """Test trusted skips the checks and restores them on exit."""
+        with trusted():
+            self.assertFalse(get_validation())
+            check_nonnegative(self.negative, "negative")
+            check_species("CO2", frozenset({"N2"}), "unsupported")
+            with np.errstate(invalid="ignore"):
+                aerodynamics.speed_of_sound(self.negative)
+        self.assertTrue(get_validation())
+        with self.assertRaises(ValueError):
+            aerodynamics.speed_of_sound(self.negative)
+
+    def test_trusted_thread_local(self):
+        """Test trusted only skips the checks of the calling thread."""
+        errors = []
+
+        def other_thread():
+            try:
+                aerodynamics.speed_of_sound(self.negative)
+            except ValueError as error:
+                errors.append(error)
+
+        with trusted():
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_trusted_chunks(self):
+        """Test threaded chunks follow the setting of the calling thread."""
+        temperature = np.tile(self.negative, 50)
+        with thread_policy(4, 1000):
+            with self.assertRaises(ValueError):
+                aerodynamics.speed_of_sound(temperature)
+            with trusted(), warnings.catch_warnings():
+                # Worker threads do not inherit np.errstate
+                warnings.simplefilter("ignore", RuntimeWarning)
+                aerodynamics.speed_of_sound(temperature)
+
+    def test_trusted_results(self):
+        """Test valid inputs give the same results when trusted."""
+        expected = optics.kerl_polarizability_temperature(self.temperature, "N2", 532)
+        with trusted():
+            result = optics.kerl_polarizability_temperature(self.temperature, "N2", 532)
+        np.testing.assert_array_equal(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
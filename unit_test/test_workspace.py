@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+from haot.workspace import *
+
+
+class TestWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.shape = (4, 3)
+        self.work = Workspace()
+
+    # Test Workspace #
+    def test_workspace_buffer_reuse(self):
+        """Test that buffers are reused while shape and type match."""
+        first = self.work.buffer("field", self.shape)
+        self.assertIs(self.work.buffer("field", self.shape), first)
+        self.assertIsNot(self.work.buffer("field", self.shape, np.float32), first)
+        self.assertEqual(self.work.nbytes, 4 * np.prod(self.shape))
+
+    def test_workspace_clear(self):
+        """Test that clear releases all buffers."""
+        self.work.buffer("field", self.shape)
+        self.work.clear()
+        self.assertEqual(self.work.nbytes, 0)
+
+    # Test work_buffer #
+    def test_work_buffer_priority(self):
+        """Test that out is used before the workspace."""
+        out = np.empty(self.shape)
+        result = work_buffer("field", self.shape, out=out, workspace=self.work)
+        self.assertIs(result, out)
+        self.assertEqual(self.work.nbytes, 0)
+
+    def test_work_buffer_invalid_out(self):
+        """Test that out arrays of the wrong shape or type raise a ValueError."""
+        with self.assertRaises(ValueError):
+            work_buffer("field", self.shape, out=np.empty(3))
+        with self.assertRaises(ValueError):
+            work_buffer("field", self.shape, out=np.empty(self.shape, dtype=int))
+
+
+if __name__ == "__main__":
+    unittest.main()
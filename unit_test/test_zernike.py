@@ -0,0 +1,87 @@
+import unittest
+import numpy as np
+from haot.zernike import *
+
+
+class TestZernike(unittest.TestCase):
+
+    def setUp(self):
+        """Initialize test parameters."""
+        self.error_precision = 10
+        self.grid_shape = (33, 33)
+        self.n_modes = 10
+        self.basis = ZernikeBasis(self.grid_shape, self.n_modes)
+        rng = np.random.default_rng(0)
+        self.coefficients = rng.normal(size=(4, self.n_modes))
+
+    # Test zernike_noll_to_nm #
+    def test_zernike_noll_to_nm_ordering(self):
+        """Test the Noll ordering of the first modes."""
+        expected = [(0, 0), (1, 1), (1, -1), (2, 0), (2, -2), (2, 2), (3, -1)]
+        result = [zernike_noll_to_nm(j) for j in range(1, 8)]
+        self.assertEqual(result, expected)
+
+    def test_zernike_noll_to_nm_invalid(self):
+        """Test that invalid Noll indices raise an error."""
+        with self.assertRaises(ValueError):
+            zernike_noll_to_nm(0)
+
+    # Test zernike_polynomial #
+    def test_zernike_polynomial_focus(self):
+        """Test the focus mode against its analytic form."""
+        radius = np.linspace(0.0, 1.0, 5)
+        expected = np.sqrt(3) * (2 * radius**2 - 1)
+        result = zernike_polynomial(4, radius, np.zeros_like(radius))
+        np.testing.assert_almost_equal(result, expected, self.error_precision)
+
+    # Test ZernikeBasis #
+    def test_zernike_basis_orthonormal(self):
+        """Test that the basis is orthonormal over the aperture."""
+        result = self.basis.basis.T @ self.basis.basis / self.basis.basis.shape[0]
+        np.testing.assert_almost_equal(
+            result, np.eye(self.n_modes), self.error_precision
+        )
+
+    def test_zernike_basis_round_trip(self):
+        """Test that reconstructed stacks decompose to the same coefficients."""
+        wavefront = self.basis.reconstruct(self.coefficients)
+        self.assertEqual(wavefront.shape, (4,) + self.grid_shape)
+        result = self.basis.decompose(wavefront)
+        np.testing.assert_almost_equal(result, self.coefficients, self.error_precision)
+
+    def test_zernike_basis_remove_modes(self):
+        """Test that removed modes are missing from the filtered stack."""
+        wavefront = self.basis.reconstruct(self.coefficients)
+        filtered = self.basis.remove_modes(wavefront, [1, 2, 3])
+        expected = self.basis.reconstruct(self.coefficients, modes=range(4, 11))
+        np.testing.assert_almost_equal(filtered, expected, self.error_precision)
+
+    def test_zernike_basis_single_frame(self):
+        """Test that a single frame matches its stacked result."""
+        wavefront = self.basis.reconstruct(self.coefficients)
+        expected = self.basis.decompose(wavefront)[1]
+        result = self.basis.decompose(wavefront[1])
+        np.testing.assert_almost_equal(result, expected, self.error_precision)
+
+    def test_zernike_basis_resolution(self):
+        """Test that a focus wavefront has the same coefficient on two grids."""
+        result = []
+        for grid_size in [33, 129]:
+            basis = ZernikeBasis((grid_size, grid_size), self.n_modes)
+            x, y = np.meshgrid(
+                np.linspace(-1.0, 1.0, grid_size),
+                np.linspace(-1.0, 1.0, grid_size),
+                indexing="ij",
+            )
+            wavefront = 1e-6 * zernike_polynomial(4, np.hypot(x, y), np.arctan2(y, x))
+            result.append(basis.decompose(wavefront)[3])
+        np.testing.assert_allclose(result, 1e-6, rtol=1e-2)
+
+    def test_zernike_basis_invalid_mode(self):
+        """Test that modes outside the basis raise an error."""
+        with self.assertRaises(ValueError):
+            self.basis.remove_modes(np.zeros(self.grid_shape), [11])
+
+
+if __name__ == "__main__":
+    unittest.main()